@@ -0,0 +1,25 @@
+"""
+Cryptanalysis: frequency counting and statistical key recovery.
+"""
+
+from .counting import count_symbols, count_symbols_stream, count_ngrams
+from .shift import ShiftCandidate, chi_squared_shifts, rank_shifts, recover_shift
+from .ngrams import NgramModel
+from .substitution import SubstitutionResult, solve_substitution
+from .dictionary import DictionaryResult, KeywordCandidate, dictionary_attack
+
+__all__ = [
+    "count_symbols",
+    "count_symbols_stream",
+    "count_ngrams",
+    "ShiftCandidate",
+    "chi_squared_shifts",
+    "rank_shifts",
+    "recover_shift",
+    "NgramModel",
+    "SubstitutionResult",
+    "solve_substitution",
+    "DictionaryResult",
+    "KeywordCandidate",
+    "dictionary_attack",
+]
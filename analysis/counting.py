@@ -0,0 +1,95 @@
+"""
+Symbol and n-gram frequency counting over large texts.
+
+Counts are plain lists indexed by alphabet position, so they can be summed
+across chunks and fed straight into the scoring functions. With NumPy the
+text is counted with one `bincount` over its code points; without it,
+`str.count` (small alphabets) or `collections.Counter` is used.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from cipher import vectorized
+
+STR_COUNT_MAX_ALPHABET = 64  # beyond this, one Counter pass beats k str.count passes
+
+
+def count_symbols(text: str, alphabet: Sequence[str]) -> List[int]:
+    """
+    Count occurrences of each alphabet symbol in `text`.
+
+    Returns:
+        List[int]: counts[i] is the number of occurrences of alphabet[i].
+    """
+    if vectorized.HAVE_NUMPY and text:
+        alpha_cps = vectorized.alphabet_codepoints(alphabet)
+        if alpha_cps is not None:
+            np = vectorized.numpy()
+            counts = np.bincount(vectorized.to_codepoints(text))
+            present = alpha_cps < len(counts)
+            out = np.zeros(len(alpha_cps), dtype=np.int64)
+            out[present] = counts[alpha_cps[present]]
+            return out.tolist()
+    if len(alphabet) <= STR_COUNT_MAX_ALPHABET:
+        return [text.count(symbol) for symbol in alphabet]
+    counter = Counter(text)
+    return [counter[symbol] for symbol in alphabet]
+
+
+def count_symbols_stream(chunks: Iterable[str], alphabet: Sequence[str]) -> List[int]:
+    """Sum `count_symbols` over a stream of chunks (memory is one chunk)."""
+    total = [0] * len(alphabet)
+    for chunk in chunks:
+        for i, count in enumerate(count_symbols(chunk, alphabet)):
+            total[i] += count
+    return total
+
+
+def count_ngrams(
+    chunks: Iterable[str],
+    n: int,
+    alphabet: Optional[Sequence[str]] = None,
+    fold_case: bool = True
+) -> Counter:
+    """
+    Count n-grams of consecutive alphabet symbols over a stream of chunks.
+
+    Characters outside `alphabet` are dropped first (so "HE LL" yields "HELL"
+    for n=4), and n-grams spanning chunk boundaries are counted once.
+
+    Args:
+        chunks (Iterable[str]): Text, possibly split into chunks.
+        n (int): N-gram length.
+        alphabet (Optional[Sequence[str]]): Symbols to keep (all if None).
+        fold_case (bool): Count uppercase forms only.
+
+    Returns:
+        Counter: n-gram string -> count.
+    """
+    if n < 1:
+        raise ValueError("N-gram length must be at least 1.")
+    keep = set(alphabet) if alphabet is not None else None
+    counts: Counter = Counter()
+    tail = ""
+    for chunk in chunks:
+        if keep is not None:
+            chunk = "".join(ch for ch in chunk if ch in keep)
+        if fold_case:
+            chunk = chunk.upper()
+        text = tail + chunk
+        if n == 1:
+            counts.update(text)
+        else:
+            counts.update(text[i:i + n] for i in range(len(text) - n + 1))
+        tail = text[-(n - 1):] if n > 1 else ""
+    return counts
+
+
+def fold_counts(counts: Sequence[int], alphabet: Sequence[str]) -> Dict[str, int]:
+    """Merge per-symbol counts into case-insensitive (uppercase) letter counts."""
+    folded: Dict[str, int] = {}
+    for symbol, count in zip(alphabet, counts):
+        letter = symbol.upper()
+        folded[letter] = folded.get(letter, 0) + count
+    return folded
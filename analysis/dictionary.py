@@ -0,0 +1,257 @@
+"""
+Dictionary attack on keyword ciphers (Vigenère, keywordmono).
+
+Every word of a (streamed) wordlist is normalized the way the CLI normalizes
+a `--keyword`, so words that collapse to the same key are tried once:
+
+- `vigenere`: `normalize_keyword` (alphabet symbols only, upper-cased, de-duplicated),
+- `keywordmono`: alphabet symbols only, de-duplicated; both the upper-cased
+  key (`filter_allowed_chars` style, as in `--keyword KRYPTO`) and the key with
+  its case kept are tried, since the key's case selects different symbols.
+
+Each key is compiled into a decryption `CompiledCipher` and scored on a short
+prefix sample of the ciphertext with an n-gram model. Only the best
+`promote` keys are decrypted in full and re-scored; the best of those wins.
+With `jobs > 1` batches of keys are scored in worker processes, with a
+bounded number of batches in flight so the wordlist is never held in memory.
+"""
+
+import heapq
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from analysis.ngrams import NgramModel
+from cipher.charmap_table import CharmapTable
+from cipher.compiled import CompiledCipher
+from cipher.modular_table import ModularTable
+from utils.tools import remove_duplicates
+
+VARIANTS = ("vigenere", "keywordmono")
+DEFAULT_SAMPLE = 300
+DEFAULT_PROMOTE = 20
+BATCH_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class KeywordCandidate:
+    """
+    A scored keyword.
+
+    Attributes:
+        keyword (str): Normalized keyword.
+        sample_score (float): Model score of the decrypted prefix sample.
+        score (float): Model score of the full decryption (promoted keys only).
+    """
+    keyword: str
+    sample_score: float
+    score: float = float("-inf")
+
+
+@dataclass(frozen=True)
+class DictionaryResult:
+    """
+    Outcome of `dictionary_attack`.
+
+    Attributes:
+        candidates (List[KeywordCandidate]): Promoted keys, best first.
+        words_read (int): Wordlist entries read.
+        keys_tried (int): Distinct normalized keys scored.
+        seconds (float): Time spent reading and scoring.
+    """
+    candidates: List[KeywordCandidate]
+    words_read: int
+    keys_tried: int
+    seconds: float
+
+    @property
+    def best(self) -> Optional[KeywordCandidate]:
+        return self.candidates[0] if self.candidates else None
+
+    @property
+    def candidates_per_second(self) -> float:
+        return self.keys_tried / self.seconds if self.seconds else 0.0
+
+
+def candidate_normalizer(variant: str, alphabet: Sequence[str]) -> Callable[[str], Tuple[str, ...]]:
+    """
+    The keys a word stands for under `variant` (empty keys dropped), with the
+    allowed symbols built once (the wordlist is normalized word by word).
+    """
+    if variant == "vigenere":
+        allowed = {symbol.upper() for symbol in alphabet}
+
+        def vigenere_keys(word: str) -> Tuple[str, ...]:
+            key = "".join(dict.fromkeys(c for c in map(str.upper, word) if c in allowed))
+            return (key,) if key else ()
+
+        return vigenere_keys
+    if variant == "keywordmono":
+        symbols = set(alphabet)
+
+        def keywordmono_keys(word: str) -> Tuple[str, ...]:
+            keys = (
+                "".join(remove_duplicates(c for c in map(str.upper, word) if c in symbols)),
+                "".join(remove_duplicates(c for c in word if c in symbols)),
+            )
+            return tuple(key for key in dict.fromkeys(keys) if key)
+
+        return keywordmono_keys
+    raise ValueError(f"Unknown dictionary attack variant '{variant}'; choose from {', '.join(VARIANTS)}.")
+
+
+def compile_decryption(keyword: str, variant: str, alphabet: Sequence[str]) -> CompiledCipher:
+    """Decryption for a normalized keyword, built as the CLI builds it."""
+    alphabet = list(alphabet)
+    if variant == "vigenere":
+        return CompiledCipher.from_table(ModularTable.shared(alphabet, source="analysis"), list(keyword), "decrypt")
+    key = list(keyword)
+    mono_alphabet = key + [c for c in alphabet if c not in key]
+    table = CharmapTable.from_plain_and_cipher_alphabet(alphabet, mono_alphabet, source="analysis")
+    return CompiledCipher.from_table(table, [alphabet[0]], "decrypt")
+
+
+def text_scorer(model: NgramModel) -> Callable[[str], float]:
+    """`model.score_text` with the letter lookup built once."""
+    position = {letter: i for i, letter in enumerate(model.letters)}
+    scores, n, m = model.scores, model.n, len(model.letters)
+    size = m ** n
+
+    def score(text: str) -> float:
+        total, idx, seen = 0.0, 0, 0
+        for ch in text.upper():
+            letter = position.get(ch)
+            if letter is None:
+                continue
+            idx = (idx * m + letter) % size
+            seen += 1
+            if seen >= n:
+                total += scores[idx]
+        return total
+
+    return score
+
+
+def unique_keys(words: Iterable[str], variant: str, alphabet: Sequence[str], counter: List[int]) -> Iterator[str]:
+    """
+    Normalized, de-duplicated keys of a wordlist (one word per line;
+    surrounding whitespace is stripped). counter[0] counts words read.
+    """
+    normalize = candidate_normalizer(variant, alphabet)
+    seen = set()
+    for word in words:
+        counter[0] += 1
+        for key in normalize(word.strip()):
+            if key not in seen:
+                seen.add(key)
+                yield key
+
+
+def score_keys(
+    keys: Sequence[str],
+    sample: str,
+    variant: str,
+    alphabet: Sequence[str],
+    model: NgramModel,
+    keep: int
+) -> List[Tuple[float, str]]:
+    """The `keep` best (sample score, key) pairs of one batch."""
+    score = text_scorer(model)
+    return heapq.nlargest(
+        keep, ((score(compile_decryption(key, variant, alphabet)(sample)), key) for key in keys)
+    )
+
+
+_worker: Optional[tuple] = None
+
+
+def _init_worker(sample, variant, alphabet, model, keep) -> None:
+    global _worker
+    _worker = (sample, variant, alphabet, model, keep)
+
+
+def _score_batch(keys: Sequence[str]) -> List[Tuple[float, str]]:
+    return score_keys(keys, *_worker)
+
+
+def _batches(keys: Iterable[str], size: int) -> Iterator[List[str]]:
+    keys = iter(keys)
+    while True:
+        batch = list(islice(keys, size))
+        if not batch:
+            return
+        yield batch
+
+
+def dictionary_attack(
+    text: str,
+    words: Iterable[str],
+    alphabet: Sequence[str],
+    model: NgramModel,
+    variant: str = "vigenere",
+    sample: int = DEFAULT_SAMPLE,
+    promote: int = DEFAULT_PROMOTE,
+    jobs: int = 1
+) -> DictionaryResult:
+    """
+    Try every keyword of a wordlist against a ciphertext.
+
+    Args:
+        text (str): Ciphertext.
+        words (Iterable[str]): Wordlist lines (streamed).
+        alphabet (Sequence[str]): Cipher alphabet.
+        model (NgramModel): Language model for scoring.
+        variant (str): 'vigenere' or 'keywordmono'.
+        sample (int): Prefix characters scored per key.
+        promote (int): Best sample scores decrypted and re-scored in full.
+        jobs (int): Worker processes for scoring.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown dictionary attack variant '{variant}'; choose from {', '.join(VARIANTS)}.")
+    promote = max(1, promote)
+    head = text[:sample]
+    counter = [0]
+    keys = unique_keys(words, variant, alphabet, counter)
+    best: List[Tuple[float, str]] = []
+    tried = 0
+
+    def merge(batch_best: List[Tuple[float, str]]) -> None:
+        for item in batch_best:
+            if len(best) < promote:
+                heapq.heappush(best, item)
+            elif item > best[0]:
+                heapq.heapreplace(best, item)
+
+    start = time.perf_counter()
+    if jobs > 1:
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker,
+            initargs=(head, variant, list(alphabet), model, promote),
+        ) as pool:
+            pending = deque()
+            for batch in _batches(keys, BATCH_SIZE):
+                tried += len(batch)
+                pending.append(pool.submit(_score_batch, batch))
+                if len(pending) >= 2 * jobs:
+                    merge(pending.popleft().result())
+            while pending:
+                merge(pending.popleft().result())
+    else:
+        for batch in _batches(keys, BATCH_SIZE):
+            tried += len(batch)
+            merge(score_keys(batch, head, variant, alphabet, model, promote))
+    seconds = time.perf_counter() - start
+
+    score = text_scorer(model)
+    candidates = sorted(
+        (
+            KeywordCandidate(key, sample_score, score(compile_decryption(key, variant, alphabet)(text)))
+            for sample_score, key in best
+        ),
+        key=lambda candidate: -candidate.score,
+    )
+    return DictionaryResult(candidates=candidates, words_read=counter[0], keys_tried=tried, seconds=seconds)
@@ -0,0 +1,148 @@
+"""
+Compact on-disk n-gram models, memory-mapped on load.
+
+File layout (little-endian):
+
+    magic    4s   b"CTNG"
+    version  u16
+    n        u16  n-gram length
+    letters  u32  number of letters (m)
+    size     u32  byte length of the UTF-8 letter string
+    floor    f32  score of an unseen n-gram
+    letters       UTF-8, padded with NUL bytes to a multiple of 4
+    scores   f32  m ** n log10 probabilities, in `NgramModel` index order
+
+The score table is used in place through `memoryview.cast('f')` over a
+read-only `mmap`, so loading costs a header parse regardless of table size
+and every process that maps the file shares the same page-cache pages.
+Models are stored per language at `language/ngrams/<lang>.<n>.bin`, indexed
+over the case-folded letters of `language.tools.load_unicode_alphabet(lang)`.
+
+Usage:
+    python -m analysis.ngram_store build --lang en --corpus corpus.txt [--n 4] [--output PATH]
+    python -m analysis.ngram_store info PATH
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from analysis.ngrams import DEFAULT_N, NgramModel
+
+MAGIC = b"CTNG"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIf")
+NGRAM_DIR = Path(__file__).parent.parent / "language" / "ngrams"
+
+
+def default_path(lang: str, n: int = DEFAULT_N) -> Path:
+    """Location of the stored model for `lang`."""
+    return NGRAM_DIR / f"{lang.lower()}.{n}.bin"
+
+
+def _padding(size: int) -> int:
+    return -size % 4
+
+
+def save_model(model: NgramModel, path: Union[str, Path]) -> Path:
+    """Write `model` in the compact format and return the path."""
+    path = Path(path)
+    letters = "".join(model.letters).encode("utf-8")
+    scores = array("f", model.scores)
+    if sys.byteorder != "little":
+        scores.byteswap()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, model.n, len(model.letters), len(letters), model.floor))
+        f.write(letters + b"\0" * _padding(len(letters)))
+        scores.tofile(f)
+    return path
+
+
+def load_model(path: Union[str, Path]) -> NgramModel:
+    """
+    Map a stored model. The returned model's scores are a float32 view of
+    the file; the mapping stays open for as long as the model is referenced.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, n, count, size, floor = HEADER.unpack_from(mapped)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not an n-gram model file (version {VERSION}): {path}")
+    start = HEADER.size
+    letters = tuple(bytes(mapped[start:start + size]).decode("utf-8"))
+    if len(letters) != count:
+        raise ValueError(f"Corrupt letter table in {path}")
+    start += size + _padding(size)
+    end = start + 4 * count ** n
+    if len(mapped) < end:
+        raise ValueError(f"Truncated n-gram table in {path}")
+    if sys.byteorder == "little":
+        scores = memoryview(mapped)[start:end].cast("f")
+    else:
+        scores = array("f", mapped[start:end])
+        scores.byteswap()
+    return NgramModel(letters=letters, n=n, scores=scores, floor=floor, path=path)
+
+
+@lru_cache(maxsize=None)
+def load_language_model(lang: str, n: int = DEFAULT_N) -> NgramModel:
+    """
+    Load the stored model for `lang` (mapped once per process).
+
+    Raises:
+        FileNotFoundError: If no model has been built for the language.
+    """
+    path = default_path(lang, n)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No {n}-gram model for '{lang}' at {path}; build one with "
+            f"`python -m analysis.ngram_store build --lang {lang} --corpus FILE`."
+        )
+    return load_model(path)
+
+
+def build_model(chunks: Iterable[str], lang: str = "en", n: int = DEFAULT_N) -> NgramModel:
+    """Count a (streamed) corpus over the letters of `lang`'s alphabet."""
+    from language.tools import load_unicode_alphabet
+
+    return NgramModel.from_corpus(chunks, load_unicode_alphabet(lang), n)
+
+
+def build(corpus: str, lang: str = "en", n: int = DEFAULT_N, output: Optional[Union[str, Path]] = None) -> Path:
+    """Stream the `corpus` file (or '-' for stdin) into a stored model."""
+    from cli.stream import iter_chunks, open_input
+
+    with open_input(corpus) as src:
+        model = build_model(iter_chunks(src), lang, n)
+    return save_model(model, output or default_path(lang, n))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and inspect stored n-gram models.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="Count a corpus into a stored model")
+    build_cmd.add_argument("--lang", default="en")
+    build_cmd.add_argument("--corpus", required=True, help="Plain-text corpus file, or - for stdin")
+    build_cmd.add_argument("--n", type=int, default=DEFAULT_N)
+    build_cmd.add_argument("--output", help="Defaults to language/ngrams/<lang>.<n>.bin")
+    info_cmd = sub.add_parser("info", help="Print a stored model's header")
+    info_cmd.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        path = build(args.corpus, args.lang, args.n, args.output)
+        print(f"[✓] Wrote {args.n}-gram model: {path}")
+    else:
+        model = load_model(args.path)
+        print(f"n={model.n} letters={''.join(model.letters)} entries={model.size} floor={model.floor:.3f}")
+
+
+if __name__ == "__main__":
+    main()
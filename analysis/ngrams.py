@@ -0,0 +1,169 @@
+"""
+N-gram language models for scoring candidate plaintexts.
+
+A model stores one log10 probability per n-gram of case-folded letters, as a
+dense table indexed in base len(letters): the n-gram l0 l1 ... l(n-1) lives
+at ((l0 * m + l1) * m + ...) * m + l(n-1). Unseen n-grams get a floor score,
+so lookups never miss.
+
+Corpora are counted straight into that dense layout (one `bincount` per chunk
+with NumPy). Models saved with `analysis.ngram_store` are memory-mapped on
+load and pickle as their file path, so worker processes map the same pages.
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from cipher import vectorized
+
+DEFAULT_N = 4
+FLOOR_COUNT = 0.01  # pseudo-count of an unseen n-gram
+
+
+def model_letters(alphabet: Sequence[str]) -> Tuple[str, ...]:
+    """Case-folded letters a model over `alphabet` needs, in a stable order."""
+    return tuple(sorted({symbol.upper() for symbol in alphabet}))
+
+
+def count_ngram_table(chunks: Iterable[str], letters: Sequence[str], n: int = DEFAULT_N) -> List[int]:
+    """
+    Count the n-grams of a (streamed) text in the dense index layout.
+
+    The text is case-folded and every character that is not one of `letters`
+    is dropped first (as in `analysis.counting.count_ngrams`); n-grams spanning
+    chunk boundaries are counted once.
+
+    Returns:
+        List[int]: len(letters) ** n counts.
+    """
+    if n < 1:
+        raise ValueError("N-gram length must be at least 1.")
+    m = len(letters)
+    size = m ** n
+    alpha_cps = vectorized.alphabet_codepoints(letters) if vectorized.HAVE_NUMPY else None
+    if alpha_cps is None:
+        return _count_table_python(chunks, letters, n)
+
+    np = vectorized.numpy()
+    totals = np.zeros(size, dtype=np.int64)
+    tail = np.zeros(0, dtype=np.int64)
+    for chunk in chunks:
+        indices = vectorized.symbol_indices(vectorized.to_codepoints(chunk.upper()), alpha_cps)
+        indices = np.concatenate([tail, indices[indices >= 0]])
+        count = len(indices) - n + 1
+        if count > 0:
+            grams = np.zeros(count, dtype=np.int64)
+            for k in range(n):
+                grams = grams * m + indices[k:k + count]
+            totals += np.bincount(grams, minlength=size)
+        tail = indices[max(0, len(indices) - (n - 1)):] if n > 1 else indices[:0]
+    return totals.tolist()
+
+
+def _count_table_python(chunks: Iterable[str], letters: Sequence[str], n: int) -> List[int]:
+    position = {letter: i for i, letter in enumerate(letters)}
+    size = len(letters) ** n
+    m = len(letters)
+    counts = [0] * size
+    idx, seen = 0, 0
+    for chunk in chunks:
+        for ch in chunk.upper():
+            letter = position.get(ch)
+            if letter is None:
+                continue
+            idx = (idx * m + letter) % size
+            seen += 1
+            if seen >= n:
+                counts[idx] += 1
+    return counts
+
+
+@dataclass(frozen=True, eq=False)
+class NgramModel:
+    """
+    Dense n-gram log-probability table.
+
+    Attributes:
+        letters (Tuple[str, ...]): Uppercase letters, in index order.
+        n (int): N-gram length.
+        scores (Sequence[float]): log10 probability per n-gram index
+            (len(letters) ** n entries, floor for unseen n-grams).
+        floor (float): Score of an unseen n-gram.
+        path (Optional[Path]): File the scores are mapped from, if any.
+    """
+    letters: Tuple[str, ...]
+    n: int
+    scores: Sequence[float]
+    floor: float
+    path: Optional[Path] = None
+
+    def __reduce__(self):
+        if self.path is not None:
+            from analysis.ngram_store import load_model
+            return load_model, (self.path,)
+        return NgramModel, (self.letters, self.n, list(self.scores), self.floor)
+
+    @property
+    def size(self) -> int:
+        return len(self.letters) ** self.n
+
+    def index(self, gram: Sequence[int]) -> int:
+        """Table index of an n-gram given as letter indices."""
+        m = len(self.letters)
+        idx = 0
+        for letter in gram:
+            idx = idx * m + letter
+        return idx
+
+    @classmethod
+    def from_counts(cls, counts: Counter, letters: Sequence[str], n: int = DEFAULT_N) -> 'NgramModel':
+        """
+        Build a model from n-gram counts (n-grams over `letters`; others are ignored).
+        """
+        letters = tuple(letters)
+        position = {letter: i for i, letter in enumerate(letters)}
+        m = len(letters)
+        table = [0] * (m ** n)
+        for gram, count in counts.items():
+            if len(gram) == n and all(ch in position for ch in gram):
+                idx = 0
+                for ch in gram:
+                    idx = idx * m + position[ch]
+                table[idx] += count
+        return cls.from_table(table, letters, n)
+
+    @classmethod
+    def from_table(cls, table: Sequence[int], letters: Sequence[str], n: int = DEFAULT_N) -> 'NgramModel':
+        """Build a model from dense n-gram counts (see `count_ngram_table`)."""
+        total = sum(table)
+        if not total:
+            raise ValueError("Corpus contains no n-grams over the model letters.")
+        floor = math.log10(FLOOR_COUNT / total)
+        log_total = math.log10(total)
+        scores = [math.log10(count) - log_total if count else floor for count in table]
+        return cls(letters=tuple(letters), n=n, scores=scores, floor=floor)
+
+    @classmethod
+    def from_corpus(
+        cls,
+        chunks: Iterable[str],
+        alphabet: Sequence[str],
+        n: int = DEFAULT_N,
+        letters: Optional[Sequence[str]] = None
+    ) -> 'NgramModel':
+        """
+        Count the n-grams of a (streamed) corpus and build a model over the
+        case-folded letters of `alphabet`.
+        """
+        letters = tuple(letters) if letters is not None else model_letters(alphabet)
+        return cls.from_table(count_ngram_table(chunks, letters, n), letters, n)
+
+    def score_text(self, text: str) -> float:
+        """Sum of n-gram scores of `text` (non-letters are skipped, case is folded)."""
+        position = {letter: i for i, letter in enumerate(self.letters)}
+        letters = [position[ch] for ch in text.upper() if ch in position]
+        scores, n = self.scores, self.n
+        return sum(scores[self.index(letters[i:i + n])] for i in range(len(letters) - n + 1))
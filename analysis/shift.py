@@ -0,0 +1,219 @@
+"""
+Shift (Caesar/rot) key recovery by chi-squared scoring.
+
+All n shifts are scored from the ciphertext's symbol counts alone: decrypting
+with shift s moves the count of ciphertext symbol (j + s) mod n to plaintext
+symbol j, so the plaintext letter histogram for every shift is a rotation of
+one count vector. Only the chosen key is ever used to decrypt, except by
+`decrypt_all_shifts`, which encodes the text once and decodes every candidate
+from that one encoding.
+
+Scores compare those histograms (case-folded) against the language's letter
+frequencies; lower chi-squared is a better fit. In mixed-case alphabets such as
+`en` (A-Z then a-z), shifts s and s + 26 differ only by swapping case and get
+the same score; ties are broken in favour of the shift that yields more
+lowercase letters, as in ordinary prose.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from analysis.counting import count_symbols, count_symbols_stream
+from cipher import vectorized
+from language.tools import load_letter_frequencies
+
+
+@dataclass(frozen=True)
+class ShiftCandidate:
+    """
+    One scored shift.
+
+    Attributes:
+        shift (int): Shift that was used to encrypt (alphabet index of the key).
+        key_char (str): Key character for the shift (`alphabet[shift]`).
+        chi2 (float): Chi-squared distance to the language frequencies.
+    """
+    shift: int
+    key_char: str
+    chi2: float
+
+
+def _letter_columns(alphabet: Sequence[str], frequencies: Dict[str, float]):
+    """
+    Map alphabet positions onto scored letters.
+
+    Returns:
+        (letters, expected, columns): the scored letters, their probabilities
+        renormalized over the letters the alphabet can produce, and
+        (alphabet index, letter index) pairs for every symbol that folds
+        onto a scored letter.
+    """
+    letters = sorted({symbol.upper() for symbol in alphabet if frequencies.get(symbol.upper(), 0) > 0})
+    position = {letter: i for i, letter in enumerate(letters)}
+    total = sum(frequencies[letter] for letter in letters)
+    expected = [frequencies[letter] / total for letter in letters]
+    columns = [
+        (j, position[symbol.upper()])
+        for j, symbol in enumerate(alphabet)
+        if symbol.upper() in position
+    ]
+    return letters, expected, columns
+
+
+def chi_squared_shifts(
+    counts: Sequence[int],
+    alphabet: Sequence[str],
+    frequencies: Dict[str, float]
+) -> List[float]:
+    """
+    Chi-squared score of every shift, from ciphertext symbol counts.
+
+    Args:
+        counts (Sequence[int]): Ciphertext count per alphabet symbol.
+        alphabet (Sequence[str]): Cipher alphabet (duplicate-free).
+        frequencies (Dict[str, float]): Uppercase letter -> probability.
+
+    Returns:
+        List[float]: scores[s] for decrypting with shift s (inf if nothing
+        in the text can be scored).
+    """
+    n = len(alphabet)
+    letters, expected, columns = _letter_columns(alphabet, frequencies)
+    if not letters:
+        raise ValueError("No alphabet symbol has a frequency in the language table.")
+
+    if vectorized.HAVE_NUMPY:
+        np = vectorized.numpy()
+        c = np.asarray(counts, dtype=np.float64)
+        observed = np.zeros((n, len(letters)))
+        for j, letter in columns:
+            # observed[s, letter] += counts[(j + s) % n] for every s at once
+            observed[:, letter] += np.roll(c, -j)
+        totals = observed.sum(axis=1, keepdims=True)
+        exp = totals * np.asarray(expected)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(exp > 0, (observed - exp) ** 2 / exp, 0.0).sum(axis=1)
+        scores[totals[:, 0] == 0] = np.inf
+        return scores.tolist()
+
+    scores = []
+    for s in range(n):
+        observed = [0] * len(letters)
+        for j, letter in columns:
+            observed[letter] += counts[(j + s) % n]
+        total = sum(observed)
+        if not total:
+            scores.append(float("inf"))
+            continue
+        scores.append(sum((o - total * e) ** 2 / (total * e) for o, e in zip(observed, expected)))
+    return scores
+
+
+def lowercase_counts(counts: Sequence[int], alphabet: Sequence[str]) -> List[int]:
+    """Number of lowercase plaintext symbols produced by each shift."""
+    n = len(alphabet)
+    lower = [j for j, symbol in enumerate(alphabet) if symbol.islower()]
+    return [sum(counts[(j + s) % n] for j in lower) for s in range(n)]
+
+
+def rank_shifts(
+    counts: Sequence[int],
+    alphabet: Sequence[str],
+    lang: str = "en",
+    top: int = 0,
+    shifts: Optional[Sequence[int]] = None
+) -> List[ShiftCandidate]:
+    """
+    Shifts ordered from best to worst fit (all of them when `top` is 0).
+    `shifts` restricts the ranking to the given candidate shifts.
+    """
+    scores = chi_squared_shifts(counts, alphabet, load_letter_frequencies(lang))
+    lower = lowercase_counts(counts, alphabet)
+    candidates = range(len(scores)) if shifts is None else shifts
+    # Case-swapped shifts score identically up to float rounding.
+    ranked = sorted(candidates, key=lambda s: (round(scores[s], 6), -lower[s]))
+    if top:
+        ranked = ranked[:top]
+    return [ShiftCandidate(shift=s, key_char=alphabet[s], chi2=scores[s]) for s in ranked]
+
+
+def recover_shift(chunks: Iterable[str], alphabet: Sequence[str], lang: str = "en", top: int = 5) -> List[ShiftCandidate]:
+    """
+    Count a (possibly streamed) ciphertext once and return the `top` most
+    likely shifts, best first.
+    """
+    return rank_shifts(count_symbols_stream(chunks, alphabet), alphabet, lang, top)
+
+
+def shift_decoder(text: str, alphabet: Sequence[str]) -> Tuple[List[int], Callable[[int], str]]:
+    """
+    Encode `text` once for decrypting it under many shifts.
+
+    With NumPy the text becomes one code-point array plus the positions and
+    alphabet indices of its symbols; each shift is then a gather through the
+    rotated alphabet and a scatter into a copy of that array. Without it
+    each shift is one `str.translate`.
+
+    Returns:
+        (counts, decode): symbol counts of the text, and a function returning
+        the decryption under a shift.
+    """
+    n = len(alphabet)
+    alpha_cps = vectorized.alphabet_codepoints(alphabet) if vectorized.HAVE_NUMPY else None
+    if alpha_cps is None or not text:
+        def decode(shift: int) -> str:
+            return text.translate(str.maketrans(dict(zip(alphabet, (alphabet[(j - shift) % n] for j in range(n))))))
+
+        return count_symbols(text, alphabet), decode
+
+    np = vectorized.numpy()
+    codepoints = vectorized.to_codepoints(text)
+    indices = vectorized.symbol_indices(codepoints, alpha_cps)
+    positions = np.flatnonzero(indices >= 0)
+    symbols = indices[positions].astype(np.uint8 if n <= 256 else np.int64)
+
+    def decode(shift: int) -> str:
+        out = codepoints.copy()
+        out[positions] = np.roll(alpha_cps, shift % n)[symbols]
+        return vectorized.from_codepoints(out)
+
+    return np.bincount(symbols, minlength=n).tolist(), decode
+
+
+def decrypt_all_shifts(
+    chunks: Iterable[str],
+    alphabet: Sequence[str],
+    lang: str = "en",
+    top: int = 0,
+    sample: int = 0
+) -> Iterator[Tuple[ShiftCandidate, str]]:
+    """
+    Decryptions under every shift, best fit first.
+
+    With `top` 0 the whole text is encoded once (see `shift_decoder`); the
+    shifts are ranked from the counts of that encoding and each plaintext
+    is decoded from it (one plaintext is alive at a time).
+
+    With `top` > 0 the text is streamed: only symbol counts and the first
+    `sample` characters (all of them when 0) are kept, and the `top` best
+    shifts are decoded from that sample.
+    """
+    if not top:
+        counts, decode = shift_decoder("".join(chunks), alphabet)
+        ranked = rank_shifts(counts, alphabet, lang)
+    else:
+        head: List[str] = []
+
+        def tap(chunks: Iterable[str]) -> Iterator[str]:
+            kept = 0
+            for chunk in chunks:
+                if not sample or kept < sample:
+                    part = chunk[:sample - kept] if sample else chunk
+                    head.append(part)
+                    kept += len(part)
+                yield chunk
+
+        ranked = rank_shifts(count_symbols_stream(tap(chunks), alphabet), alphabet, lang, top)
+        _, decode = shift_decoder("".join(head), alphabet)
+    for candidate in ranked:
+        yield candidate, decode(candidate.shift)
@@ -0,0 +1,254 @@
+"""
+Key search for general substitution ciphers (mono, keywordmono).
+
+The ciphertext is reduced once to its distinct n-grams of cipher symbol
+indices, with counts. A key assigns a plaintext symbol to every cipher symbol;
+its score is the sum over those n-grams of count x model score of the decrypted
+(case-folded) n-gram. Swapping the plaintext of two cipher symbols changes
+only the n-grams that contain either symbol, and moves their table indices by
+a precomputed amount, so each candidate key is scored from that short list
+instead of the whole text.
+
+The search is simulated annealing with random restarts (the first restart
+starts from a frequency-ranked key), optionally spread over worker
+processes. Case variants of a letter score the same, so the final key gives
+the lowercase form to the more frequent cipher symbol of each pair.
+"""
+
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from analysis.counting import count_ngrams
+from analysis.ngrams import NgramModel
+from language.tools import load_letter_frequencies
+
+DEFAULT_ITERATIONS = 20_000
+DEFAULT_RESTARTS = 8
+START_TEMPERATURE = 20.0
+
+
+@dataclass(frozen=True)
+class SubstitutionResult:
+    """
+    Best key found by `solve_substitution`.
+
+    Attributes:
+        key (Tuple[int, ...]): Plaintext alphabet index per cipher alphabet index.
+        cipher_alphabet (str): Symbol that plaintext alphabet[j] encrypts to, for
+            every j (usable as a keywordmono keyword).
+        score (float): Model score of the decryption.
+        keys_evaluated (int): Candidate keys scored over all restarts.
+        keys_per_second (float): Search throughput.
+    """
+    key: Tuple[int, ...]
+    cipher_alphabet: str
+    score: float
+    keys_evaluated: int
+    keys_per_second: float
+
+    def decrypt(self, text: str, alphabet: Sequence[str]) -> str:
+        return text.translate(str.maketrans({alphabet[c]: alphabet[p] for c, p in enumerate(self.key)}))
+
+
+class SubstitutionScorer:
+    """
+    Incremental n-gram scorer over an integer-encoded ciphertext.
+
+    Args:
+        cipher_grams (Counter): Counts of ciphertext n-grams (strings of alphabet symbols).
+        alphabet (Sequence[str]): Cipher alphabet.
+        model (NgramModel): Language model; its letters must cover the folded alphabet.
+    """
+
+    def __init__(self, cipher_grams: Counter, alphabet: Sequence[str], model: NgramModel):
+        self.alphabet = list(alphabet)
+        self.model = model
+        index = {symbol: i for i, symbol in enumerate(self.alphabet)}
+        position = {letter: i for i, letter in enumerate(model.letters)}
+        missing = {symbol for symbol in self.alphabet if symbol.upper() not in position}
+        if missing:
+            raise ValueError(f"Model has no letters for: {''.join(sorted(missing))}")
+        # Plaintext alphabet index -> model letter index.
+        self.fold = [position[symbol.upper()] for symbol in self.alphabet]
+
+        self.grams: List[Tuple[int, ...]] = []
+        self.weights: List[int] = []
+        for gram, count in cipher_grams.items():
+            if len(gram) == model.n and all(ch in index for ch in gram):
+                self.grams.append(tuple(index[ch] for ch in gram))
+                self.weights.append(count)
+        # coefs[c]: (n-gram id, positional weight of c in it) for every n-gram containing c
+        m = len(model.letters)
+        self.coefs: List[List[Tuple[int, int]]] = [[] for _ in self.alphabet]
+        for g, gram in enumerate(self.grams):
+            weight_of: Dict[int, int] = {}
+            for k, c in enumerate(gram):
+                weight_of[c] = weight_of.get(c, 0) + m ** (model.n - 1 - k)
+            for c, coef in weight_of.items():
+                self.coefs[c].append((g, coef))
+        self.symbol_counts = [0] * len(self.alphabet)
+        for gram, weight in zip(self.grams, self.weights):
+            self.symbol_counts[gram[0]] += weight
+
+    @classmethod
+    def from_text(cls, chunks: Iterable[str], alphabet: Sequence[str], model: NgramModel) -> 'SubstitutionScorer':
+        """Count the ciphertext's n-grams (streamed) and build a scorer."""
+        return cls(count_ngrams(chunks, model.n, alphabet, fold_case=False), alphabet, model)
+
+    def score(self, key: Sequence[int]) -> float:
+        letters = [self.fold[p] for p in key]
+        scores, index = self.model.scores, self.model.index
+        return sum(w * scores[index([letters[c] for c in gram])] for gram, w in zip(self.grams, self.weights))
+
+    def initial_key(self, lang: str) -> List[int]:
+        """Map cipher symbols to plaintext symbols by frequency rank."""
+        try:
+            frequencies = load_letter_frequencies(lang)
+        except FileNotFoundError:
+            frequencies = {}
+        plain = sorted(
+            range(len(self.alphabet)),
+            key=lambda p: (-frequencies.get(self.alphabet[p].upper(), 0), not self.alphabet[p].islower(), p),
+        )
+        cipher = sorted(range(len(self.alphabet)), key=lambda c: -self.symbol_counts[c])
+        key = [0] * len(self.alphabet)
+        for c, p in zip(cipher, plain):
+            key[c] = p
+        return key
+
+    def anneal(self, key: List[int], iterations: int, rng: random.Random, t0: float = START_TEMPERATURE):
+        """
+        Simulated annealing from `key` with linear cooling.
+
+        Each n-gram's table index is kept up to date: swapping the letters of
+        cipher symbols a and b moves it by (L[b] - L[a]) * (coef_a - coef_b),
+        where coef_c is the positional weight of c in that n-gram.
+
+        Returns:
+            (best_key, best_score, evaluated)
+        """
+        n = len(key)
+        letters = [self.fold[p] for p in key]
+        scores, weights, coefs = self.model.scores, self.weights, self.coefs
+        indices = [self.model.index([letters[c] for c in gram]) for gram in self.grams]
+        current = sum(w * scores[i] for w, i in zip(weights, indices))
+        best, best_key = current, list(key)
+        evaluated = 0
+
+        for step in range(iterations):
+            a, b = rng.randrange(n), rng.randrange(n)
+            d = letters[b] - letters[a]
+            if not d:
+                continue  # same letter (or case variant): score cannot change
+            moved: Dict[int, int] = {}
+            for g, coef in coefs[a]:
+                moved[g] = indices[g] + coef * d
+            for g, coef in coefs[b]:
+                moved[g] = moved.get(g, indices[g]) - coef * d
+            delta = 0.0
+            for g, idx in moved.items():
+                delta += weights[g] * (scores[idx] - scores[indices[g]])
+            evaluated += 1
+
+            temperature = t0 * (1 - step / iterations)
+            if delta >= 0 or (temperature > 0 and rng.random() < math.exp(delta / temperature)):
+                key[a], key[b] = key[b], key[a]
+                letters[a], letters[b] = letters[b], letters[a]
+                for g, idx in moved.items():
+                    indices[g] = idx
+                current += delta
+                if current > best:
+                    best, best_key = current, list(key)
+        return best_key, best, evaluated
+
+    def prefer_lowercase(self, key: List[int]) -> List[int]:
+        """
+        Among cipher symbols decrypting to case variants of one letter, give
+        the lowercase plaintext to the most frequent cipher symbol.
+        """
+        key = list(key)
+        groups: Dict[int, List[int]] = {}
+        for c, p in enumerate(key):
+            groups.setdefault(self.fold[p], []).append(c)
+        for cipher_symbols in groups.values():
+            if len(cipher_symbols) < 2:
+                continue
+            plain = sorted((key[c] for c in cipher_symbols), key=lambda p: not self.alphabet[p].islower())
+            ranked = sorted(cipher_symbols, key=lambda c: -self.symbol_counts[c])
+            for c, p in zip(ranked, plain):
+                key[c] = p
+        return key
+
+
+_scorer: Optional[SubstitutionScorer] = None
+
+
+def _init_worker(scorer: SubstitutionScorer) -> None:
+    global _scorer
+    _scorer = scorer
+
+
+def _restart(args) -> Tuple[List[int], float, int]:
+    seed, start, iterations = args
+    rng = random.Random(seed)
+    key = list(start) if start is not None else rng.sample(range(len(_scorer.alphabet)), len(_scorer.alphabet))
+    return _scorer.anneal(key, iterations, rng)
+
+
+def solve_substitution(
+    chunks: Iterable[str],
+    alphabet: Sequence[str],
+    model: NgramModel,
+    lang: str = "en",
+    restarts: int = DEFAULT_RESTARTS,
+    iterations: int = DEFAULT_ITERATIONS,
+    jobs: int = 1,
+    seed: int = 0
+) -> SubstitutionResult:
+    """
+    Search for the substitution key of a (streamed) ciphertext.
+
+    Args:
+        chunks (Iterable[str]): Ciphertext, possibly split into chunks.
+        alphabet (Sequence[str]): Alphabet shared by plaintext and ciphertext.
+        model (NgramModel): Language model for scoring.
+        lang (str): Language of the letter frequencies for the first start key.
+        restarts (int): Independent annealing runs.
+        iterations (int): Swaps tried per run.
+        jobs (int): Worker processes for the restarts.
+        seed (int): Base random seed.
+    """
+    global _scorer
+    scorer = SubstitutionScorer.from_text(chunks, alphabet, model)
+    tasks = [
+        (seed + i, scorer.initial_key(lang) if i == 0 else None, iterations)
+        for i in range(max(1, restarts))
+    ]
+    start = time.perf_counter()
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(scorer,)) as pool:
+            runs = list(pool.map(_restart, tasks))
+    else:
+        _scorer = scorer
+        runs = [_restart(task) for task in tasks]
+    seconds = time.perf_counter() - start
+
+    best_key, best_score, _ = max(runs, key=lambda run: run[1])
+    evaluated = sum(run[2] for run in runs)
+    key = scorer.prefer_lowercase(best_key)
+    cipher_alphabet = [""] * len(alphabet)
+    for c, p in enumerate(key):
+        cipher_alphabet[p] = alphabet[c]
+    return SubstitutionResult(
+        key=tuple(key),
+        cipher_alphabet="".join(cipher_alphabet),
+        score=best_score,
+        keys_evaluated=evaluated,
+        keys_per_second=evaluated / seconds if seconds else 0.0,
+    )
@@ -0,0 +1,193 @@
+"""
+Vigenère key-length and key recovery.
+
+The ciphertext is read once, as a stream:
+
+1. For the first `sample` characters, symbol counts are kept per column for
+   every candidate period 1..max_period (column = position mod period,
+   counting every character, as the cipher does). The index of coincidence
+   of each period is the mean over its columns; the key length is the
+   smallest period whose IoC is close to the best one, since multiples of
+   the true period score just as high.
+2. The rest of the stream only updates the column counts of the chosen period.
+3. Each column is a shift cipher, so its key character is recovered with the
+   chi-squared scoring in `analysis.shift`.
+
+Memory is bounded by the counts (sum of periods x alphabet size) plus one
+chunk. With NumPy, each period is one `bincount` over the chunk's alphabet
+indices; otherwise strided slices are counted per column.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from analysis.counting import count_symbols
+from analysis.shift import rank_shifts
+from cipher import vectorized
+
+MAX_PERIOD = 100
+DEFAULT_SAMPLE = 1 << 19  # characters used to estimate the key length
+IOC_TOLERANCE = 0.9  # periods within 90% of the best IoC count as candidates
+
+
+@dataclass(frozen=True)
+class PeriodScore:
+    """
+    Key-length candidate.
+
+    Attributes:
+        period (int): Candidate key length.
+        ioc (float): Mean index of coincidence over the period's columns.
+    """
+    period: int
+    ioc: float
+
+
+@dataclass(frozen=True)
+class VigenereAnalysis:
+    """
+    Result of `analyze_vigenere`.
+
+    Attributes:
+        period (int): Chosen key length.
+        keyword (str): Recovered key characters, one per column.
+        chi2 (Tuple[float, ...]): Chi-squared score of each column's key.
+        periods (Tuple[PeriodScore, ...]): Candidate periods, best IoC first.
+        length (int): Characters analysed.
+    """
+    period: int
+    keyword: str
+    chi2: Tuple[float, ...]
+    periods: Tuple[PeriodScore, ...]
+    length: int
+
+
+def index_of_coincidence(counts: Sequence[int]) -> float:
+    """Probability that two symbols drawn without replacement are equal."""
+    total = sum(counts)
+    if total < 2:
+        return 0.0
+    return sum(c * (c - 1) for c in counts) / (total * (total - 1))
+
+
+class ColumnCounts:
+    """
+    Streaming per-column symbol counts for a set of periods.
+
+    Args:
+        alphabet (Sequence[str]): Cipher alphabet (duplicate-free).
+        periods (Iterable[int]): Periods to track.
+    """
+
+    def __init__(self, alphabet: Sequence[str], periods: Iterable[int]):
+        self.alphabet = list(alphabet)
+        self.position = 0
+        n = len(self.alphabet)
+        self.counts: Dict[int, List[List[int]]] = {p: [[0] * n for _ in range(p)] for p in periods}
+        self._alpha_cps = vectorized.alphabet_codepoints(self.alphabet) if vectorized.HAVE_NUMPY else None
+
+    def keep(self, periods: Iterable[int]) -> None:
+        """Stop tracking every period not in `periods`."""
+        keep = set(periods)
+        self.counts = {p: c for p, c in self.counts.items() if p in keep}
+
+    def update(self, chunk: str) -> None:
+        if not chunk:
+            return
+        if self._alpha_cps is not None:
+            self._update_vectorized(chunk)
+        else:
+            for period, columns in self.counts.items():
+                for col in range(min(period, len(chunk))):
+                    # first character of the chunk in this column
+                    start = (col - self.position) % period
+                    for i, c in enumerate(count_symbols(chunk[start::period], self.alphabet)):
+                        columns[col][i] += c
+        self.position += len(chunk)
+
+    def _update_vectorized(self, chunk: str) -> None:
+        np = vectorized.numpy()
+        n = len(self.alphabet)
+        indices = vectorized.symbol_indices(vectorized.to_codepoints(chunk), self._alpha_cps)
+        positions = np.arange(self.position, self.position + len(chunk), dtype=np.int64)
+        mask = indices >= 0
+        indices, positions = indices[mask], positions[mask]
+        for period, columns in self.counts.items():
+            flat = np.bincount((positions % period) * n + indices, minlength=period * n)
+            for col, row in enumerate(flat.reshape(period, n).tolist()):
+                column = columns[col]
+                for i, c in enumerate(row):
+                    column[i] += c
+
+    def ioc(self, period: int) -> float:
+        columns = self.counts[period]
+        return sum(index_of_coincidence(column) for column in columns) / period
+
+
+def choose_period(scores: Sequence[PeriodScore], tolerance: float = IOC_TOLERANCE) -> int:
+    """Smallest period whose IoC is within `tolerance` of the best one."""
+    best = max(score.ioc for score in scores)
+    return min(score.period for score in scores if score.ioc >= tolerance * best)
+
+
+def _split_at(chunks: Iterable[str], limit: int) -> Iterator[Tuple[str, bool]]:
+    """Yield (piece, in_sample) so that exactly `limit` characters are in the sample."""
+    seen = 0
+    for chunk in chunks:
+        if seen < limit:
+            head = chunk[:limit - seen]
+            seen += len(head)
+            yield head, True
+            chunk = chunk[len(head):]
+        if chunk:
+            yield chunk, False
+
+
+def analyze_vigenere(
+    chunks: Iterable[str],
+    alphabet: Sequence[str],
+    lang: str = "en",
+    max_period: int = MAX_PERIOD,
+    sample: int = DEFAULT_SAMPLE,
+    period: int = 0
+) -> VigenereAnalysis:
+    """
+    Estimate the key length and recover the keyword from a streamed ciphertext.
+
+    Args:
+        chunks (Iterable[str]): Ciphertext, possibly split into chunks.
+        alphabet (Sequence[str]): Cipher alphabet.
+        lang (str): Language of the plaintext (frequency table).
+        max_period (int): Largest key length considered.
+        sample (int): Characters used to estimate the key length.
+        period (int): Known key length (skips estimation when > 0).
+
+    Returns:
+        VigenereAnalysis: Chosen period, keyword and per-period IoC scores.
+    """
+    if max_period < 1:
+        raise ValueError("max_period must be at least 1.")
+    periods = [period] if period > 0 else range(1, max_period + 1)
+    counts = ColumnCounts(alphabet, periods)
+    scores: List[PeriodScore] = []
+
+    for piece, in_sample in _split_at(chunks, sample):
+        if not in_sample and not scores:
+            scores = [PeriodScore(p, counts.ioc(p)) for p in counts.counts]
+            period = period or choose_period(scores)
+            counts.keep([period])
+        counts.update(piece)
+    if not scores:
+        scores = [PeriodScore(p, counts.ioc(p)) for p in counts.counts]
+        period = period or choose_period(scores)
+
+    # Keywords are normalized to uppercase, so only those key characters can occur.
+    allowed = [s for s, symbol in enumerate(alphabet) if symbol == symbol.upper()]
+    key = [rank_shifts(column, alphabet, lang, top=1, shifts=allowed)[0] for column in counts.counts[period]]
+    return VigenereAnalysis(
+        period=period,
+        keyword="".join(candidate.key_char for candidate in key),
+        chi2=tuple(candidate.chi2 for candidate in key),
+        periods=tuple(sorted(scores, key=lambda score: score.ioc, reverse=True)),
+        length=counts.position,
+    )
@@ -0,0 +1,3 @@
+"""
+Benchmarks for CryptoTractatus: tables, ciphers and CLI.
+"""
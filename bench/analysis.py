@@ -0,0 +1,91 @@
+"""
+Cryptanalysis throughput: shift recovery and Vigenère key recovery.
+
+Usage:
+    python -m bench.analysis [--size-mb 100] [--lang en] [--keyword ABSTRACTION]
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List
+
+from analysis.counting import count_symbols
+from analysis.shift import rank_shifts
+from analysis.vigenere import analyze_vigenere
+from bench.common import best_of, measure, report
+from cipher.compiled import CompiledCipher
+from cipher.modular_table import ModularTable
+from cipher.vigenere import normalize_keyword
+from utils.alphabet_loader import load_alphabet
+
+
+SAMPLE = Path(__file__).parent.parent / "README.md"
+
+
+def sample_text(size: int) -> str:
+    """English-like plaintext of `size` characters (the project README, repeated)."""
+    block = SAMPLE.read_text(encoding="utf-8")
+    return (block * (size // len(block) + 1))[:size]
+
+
+def bench_shift(size_mb: float = 100, lang: str = "en", repeat: int = 1) -> List[Dict[str, Any]]:
+    alphabet = load_alphabet(lang)
+    table = ModularTable.shared(alphabet, source="bench")
+    shift = 7
+    text = CompiledCipher.from_table(table, [alphabet[shift]])(sample_text(int(size_mb * 1024 * 1024)))
+
+    counts = count_symbols(text, alphabet)
+    recovered = rank_shifts(counts, alphabet, lang, top=1)[0].shift
+    count_s = best_of(lambda: count_symbols(text, alphabet), repeat)
+    score_s = best_of(lambda: rank_shifts(counts, alphabet, lang), repeat)
+    return [{
+        "bench": "analysis",
+        "attack": "shift",
+        "lang": lang,
+        "size_mb": size_mb,
+        "count_seconds": round(count_s, 4),
+        "score_seconds": round(score_s, 6),
+        "mb_per_s": round(size_mb / (count_s + score_s), 2),
+        "recovered": recovered == shift,
+    }]
+
+
+def bench_vigenere(
+    size_mb: float = 100,
+    lang: str = "en",
+    keyword: str = "ABSTRACTION",
+    chunk_size: int = 1 << 20
+) -> List[Dict[str, Any]]:
+    alphabet = load_alphabet(lang)
+    table = ModularTable.shared(alphabet, source="bench")
+    key = normalize_keyword(keyword, table)
+    text = CompiledCipher.from_table(table, key)(sample_text(int(size_mb * 1024 * 1024)))
+
+    chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+    result, seconds, peak = measure(lambda: analyze_vigenere(chunks, alphabet, lang))
+    return [{
+        "bench": "analysis",
+        "attack": "vigenere",
+        "lang": lang,
+        "size_mb": size_mb,
+        "period": result.period,
+        "seconds": round(seconds, 3),
+        "mb_per_s": round(size_mb / seconds, 2),
+        "peak_mb": round(peak / 2**20, 1),
+        "recovered": result.keyword == "".join(key),
+    }]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--keyword", default="ABSTRACTION")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+    report(bench_shift(args.size_mb, args.lang, args.repeat))
+    report(bench_vigenere(args.size_mb, args.lang, args.keyword))
+
+
+if __name__ == "__main__":
+    main()
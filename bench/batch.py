@@ -0,0 +1,74 @@
+"""
+Many short records: per-record Vigenère objects vs. the batch API.
+
+"per_record" builds a `Vigenere` (keyword normalization, validation) for every
+record, as a naive service would; "many" compiles once and runs each record
+through the compiled cipher; "many_concat" additionally joins records into
+batches (and uses NumPy for shift schedules when `--fast` is given).
+
+Usage:
+    python -m bench.batch [--records 1000000] [--size 100] [--keyword LEMON] [--fast]
+"""
+
+import argparse
+from typing import Any, Dict, List
+
+from bench.common import best_of, report
+from bench.mono import make_text
+from cipher.batch import encrypt_many
+from cipher.modular_table import ModularTable
+from cipher.vigenere import Vigenere
+from utils.alphabet_loader import load_alphabet
+
+
+def bench_batch(
+    records: int = 1_000_000,
+    size: int = 100,
+    keyword: str = "LEMON",
+    lang: str = "en",
+    fast: bool = False,
+    repeat: int = 1
+) -> List[Dict[str, Any]]:
+    alphabet = load_alphabet(lang)
+    table = ModularTable.shared(alphabet, source="bench")
+    text = make_text(alphabet, records * size)
+    texts = [text[i:i + size] for i in range(0, records * size, size)]
+
+    paths = {
+        "per_record": lambda: [
+            "".join(Vigenere(text=record, keyword=list(keyword), alphabet=alphabet, table=table).encrypt())
+            for record in texts
+        ],
+        "many": lambda: list(encrypt_many(texts, keyword, alphabet, table, fast=fast)),
+        "many_concat": lambda: list(encrypt_many(texts, keyword, alphabet, table, concat=True, fast=fast)),
+    }
+    results = []
+    for name, run in paths.items():
+        seconds = best_of(run, repeat)
+        results.append({
+            "bench": "batch",
+            "path": name,
+            "records": records,
+            "record_size": size,
+            "keyword": keyword,
+            "fast": fast,
+            "seconds": round(seconds, 4),
+            "records_per_s": round(records / seconds),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--keyword", default="LEMON")
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--fast", action="store_true")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+    report(bench_batch(args.records, args.size, args.keyword, args.lang, args.fast, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Byte-mode file encryption: throughput and peak RSS.
+
+The transform runs in a child process so its peak resident set size can be
+read from RUSAGE_CHILDREN without counting the benchmark's own memory.
+
+Usage:
+    python -m bench.bytemode [--size-mb 4096] [--keyword SECRET] [--dir /tmp]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from bench.common import report
+
+_CHILD = """
+import sys
+from cipher.bytemode import ByteCipher
+from cipher.modular_table import ModularTable
+from cipher.vigenere import Vigenere
+from utils.alphabet_loader import load_alphabet
+
+src, dst, keyword, lang = sys.argv[1:5]
+alphabet = load_alphabet(lang)
+table = ModularTable.from_alphabet(alphabet, source="bench")
+compiled = Vigenere(text="x", keyword=list(keyword), alphabet=alphabet, table=table).compile()
+ByteCipher.from_compiled(compiled).transform_file(src, dst)
+"""
+
+
+def write_input(path: str, size: int, block: int = 16 << 20) -> None:
+    """Write `size` bytes of ASCII text in blocks, without holding the file in memory."""
+    pattern = (b"The quick brown fox jumps over the lazy dog. 0123456789\n" * (block // 56 + 1))[:block]
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            f.write(pattern[:min(block, remaining)])
+            remaining -= block
+
+
+def bench_bytemode(size_mb: float, keyword: str = "SECRET", lang: str = "en", directory: str = None) -> List[Dict[str, Any]]:
+    size = int(size_mb * 1024 * 1024)
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        src, dst = os.path.join(tmp, "in.bin"), os.path.join(tmp, "out.bin")
+        write_input(src, size)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", _CHILD, src, dst, keyword, lang], check=True)
+        seconds = time.perf_counter() - start
+    max_rss_kib = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return [{
+        "bench": "bytemode",
+        "size_mb": size_mb,
+        "seconds": round(seconds, 3),
+        "mb_per_s": round(size_mb / seconds, 2),
+        "max_rss_mb": round(max_rss_kib / 1024, 1),
+    }]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=4096)
+    parser.add_argument("--keyword", default="SECRET")
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--dir", default=None, help="Directory for the temporary files")
+    args = parser.parse_args(argv)
+    report(bench_bytemode(args.size_mb, args.keyword, args.lang, args.dir))
+
+
+if __name__ == "__main__":
+    main()
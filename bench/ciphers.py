@@ -0,0 +1,112 @@
+"""
+Cipher throughput across text sizes and alphabets: MonoalphabeticCipher,
+Vigenère, multi-stage CipherTransformer pipelines (on strings and, as
+`pipeline_<n>_encoded`, encoded once into alphabet indices) and `rot_text`.
+
+Alphabets are language codes (`en`, `sv`) or `unicode-<size>` for a synthetic
+alphabet of consecutive supplementary-plane code points.
+
+Usage:
+    python -m bench.ciphers [--sizes-mb 0.1 1 10] [--alphabets en sv unicode-4096]
+                            [--stages 1 3] [--repeat 1]
+"""
+
+import argparse
+from typing import Any, Callable, Dict, List, Sequence
+
+from bench.common import best_of, report, synthetic_alphabet
+from bench.mono import make_text
+from cipher.charmap_table import CharmapTable
+from cipher.modular_table import ModularTable
+from cipher.monoalphabetic import MonoalphabeticCipher
+from cipher.transformer import CipherTransformer
+from cipher.vigenere import Vigenere
+from utils.alphabet_loader import load_alphabet
+from utils.quick import rot_text
+
+DEFAULT_SIZES_MB = [0.1, 1, 10]
+DEFAULT_ALPHABETS = ["en", "sv", "unicode-4096"]
+DEFAULT_STAGES = [1, 3]
+
+
+def bench_alphabet(name: str) -> List[str]:
+    """Resolve a language code or `unicode-<size>` to an alphabet."""
+    if name.startswith("unicode-"):
+        return synthetic_alphabet(int(name.split("-", 1)[1]))
+    return load_alphabet(name)
+
+
+def pipeline_stages(text: str, alphabet: List[str], stages: int) -> List:
+    """
+    `stages` ciphers cycling through rot, Vigenère and a keyword substitution,
+    so pipelines mix fusable shift stages with table-lookup stages.
+    """
+    modular = ModularTable.shared(alphabet, source="bench")
+    keyword = alphabet[7::-1]
+    mono_alphabet = keyword + [c for c in alphabet if c not in keyword]
+    charmap = CharmapTable.from_plain_and_cipher_alphabet(alphabet, mono_alphabet, source="bench")
+    factories = [
+        lambda: MonoalphabeticCipher(text=text, key_char=alphabet[3], alphabet=alphabet, table=modular),
+        lambda: Vigenere(text=text, keyword=alphabet[1:12:2], alphabet=alphabet, table=modular),
+        lambda: MonoalphabeticCipher(text=text, key_char=alphabet[0], alphabet=mono_alphabet, table=charmap),
+    ]
+    return [factories[i % len(factories)]() for i in range(stages)]
+
+
+def bench_ciphers(
+    sizes_mb: Sequence[float] = DEFAULT_SIZES_MB,
+    alphabets: Sequence[str] = DEFAULT_ALPHABETS,
+    stages: Sequence[int] = DEFAULT_STAGES,
+    repeat: int = 1
+) -> List[Dict[str, Any]]:
+    results = []
+    for name in alphabets:
+        alphabet = bench_alphabet(name)
+        table = ModularTable.shared(alphabet, source="bench")
+        keyword = alphabet[1:12:2]
+        for size_mb in sizes_mb:
+            text = make_text(alphabet, int(size_mb * 1024 * 1024))
+            cases: Dict[str, Callable[[], Any]] = {
+                "mono": lambda: MonoalphabeticCipher(
+                    text=text, key_char=alphabet[3], alphabet=alphabet, table=table
+                ).translate(),
+                "vigenere": lambda: Vigenere(
+                    text=text, keyword=keyword, alphabet=alphabet, table=table
+                ).encrypt(),
+                "vigenere_fast": lambda: Vigenere(
+                    text=text, keyword=keyword, alphabet=alphabet, table=table, fast=True
+                ).encrypt(),
+                "rot_text": lambda: rot_text(text, 3, alphabet),
+            }
+            for count in stages:
+                pipeline = CipherTransformer(pipeline_stages(text, alphabet, count))
+                cases[f"pipeline_{count}"] = lambda pipeline=pipeline: pipeline("encrypt")
+                encoded = CipherTransformer(pipeline_stages(text, alphabet, count), encode=True)
+                cases[f"pipeline_{count}_encoded"] = lambda pipeline=encoded: pipeline("encrypt")
+
+            for case, run in cases.items():
+                seconds = best_of(run, repeat)
+                results.append({
+                    "bench": "ciphers",
+                    "case": case,
+                    "alphabet": name,
+                    "alphabet_size": len(alphabet),
+                    "size_mb": size_mb,
+                    "seconds": round(seconds, 4),
+                    "mb_per_s": round(size_mb / seconds, 2),
+                })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=DEFAULT_SIZES_MB)
+    parser.add_argument("--alphabets", nargs="+", default=DEFAULT_ALPHABETS)
+    parser.add_argument("--stages", type=int, nargs="+", default=DEFAULT_STAGES)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+    report(bench_ciphers(args.sizes_mb, args.alphabets, args.stages, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+CLI start-up time with a cold vs. warm compiled-alphabet cache.
+
+Each run spawns a fresh interpreter for one CLI invocation. "cold" points the
+cache at an empty directory every time, "warm" reuses a populated one and
+"disabled" turns the disk cache off.
+
+Usage:
+    python -m bench.cli_startup [--runs 20] [--lang en]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence
+
+from bench.common import report
+from utils.alphabet_loader import CACHE_DIR_ENV
+
+DEFAULT_COMMAND = ["encrypt", "rot", "--text", "HELLO", "--shift", "3"]
+
+
+def time_cli(argv: Sequence[str], env: Dict[str, str]) -> float:
+    """Wall time in seconds of one `python -m cli.main` invocation."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "cli.main", *argv], env=env, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def summarize(name: str, timings: List[float]) -> Dict[str, Any]:
+    return {
+        "bench": "cli_startup",
+        "cache": name,
+        "runs": len(timings),
+        "mean_ms": round(statistics.mean(timings) * 1e3, 2),
+        "min_ms": round(min(timings) * 1e3, 2),
+    }
+
+
+def bench_cli_startup(runs: int = 20, lang: str = "en", argv: Sequence[str] = DEFAULT_COMMAND) -> List[Dict[str, Any]]:
+    argv = [*argv, "--lang", lang]
+    results = []
+    with tempfile.TemporaryDirectory() as warm_dir:
+        warm_env = {**os.environ, CACHE_DIR_ENV: warm_dir}
+        time_cli(argv, warm_env)  # populate
+
+        cold = []
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as cold_dir:
+                cold.append(time_cli(argv, {**os.environ, CACHE_DIR_ENV: cold_dir}))
+        results.append(summarize("cold", cold))
+        results.append(summarize("warm", [time_cli(argv, warm_env) for _ in range(runs)]))
+        results.append(summarize(
+            "disabled", [time_cli(argv, {**os.environ, CACHE_DIR_ENV: ""}) for _ in range(runs)]
+        ))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--lang", default="en")
+    args = parser.parse_args(argv)
+    report(bench_cli_startup(args.runs, args.lang))
+
+
+if __name__ == "__main__":
+    main()
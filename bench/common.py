@@ -0,0 +1,58 @@
+"""
+Shared helpers for the benchmark modules.
+
+Each benchmark produces a list of flat result dicts so they can be printed as
+JSON lines and compared between runs.
+"""
+
+import json
+import string
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def synthetic_alphabet(size: int) -> List[str]:
+    """
+    Return an alphabet of `size` distinct symbols.
+
+    Sizes up to 26 use ASCII uppercase; larger sizes use consecutive code
+    points from the supplementary plane (no surrogates, up to 65 536 symbols).
+    """
+    if size <= 26:
+        return list(string.ascii_uppercase[:size])
+    return [chr(0x10000 + i) for i in range(size)]
+
+
+def measure(fn: Callable[[], Any], trace_memory: bool = True) -> Tuple[Any, float, int]:
+    """
+    Call `fn` once and return (result, seconds, peak_bytes).
+    Peak memory is measured with tracemalloc and is 0 when disabled.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = fn()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 3) -> float:
+    """Return the fastest wall time in seconds over `repeat` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(results: Iterable[Dict[str, Any]]) -> None:
+    """Print results as JSON lines."""
+    for row in results:
+        print(json.dumps(row, ensure_ascii=False))
@@ -0,0 +1,87 @@
+"""
+Import cost of one CLI invocation, measured with `python -X importtime`.
+
+Reports the total import time and the most expensive top-level packages, and
+exits non-zero when the total exceeds `--max-ms`, so it can guard against
+start-up regressions (e.g. a command module pulling in a heavy dependency at
+import time).
+
+Usage:
+    python -m bench.importtime [--runs 5] [--top 10] [--max-ms 150]
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence, Tuple
+
+from bench.common import report
+
+DEFAULT_COMMAND = ["encrypt", "rot", "--text", "HELLO", "--shift", "3", "--lang", "en"]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse `-X importtime` output into (module, self_us, cumulative_us) rows.
+    Nested imports are indented under their parent; the module name keeps its
+    dotted form.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def importtime_cli(argv: Sequence[str]) -> List[Tuple[str, int, int]]:
+    """Run one CLI invocation under `-X importtime` and return the parsed rows."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "cli.main", *argv],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def bench_importtime(runs: int = 5, top: int = 10, argv: Sequence[str] = DEFAULT_COMMAND) -> List[Dict[str, Any]]:
+    """
+    Best-of-`runs` total import time plus the `top` packages by self time,
+    aggregated on the first dotted component.
+    """
+    best_total = None
+    best_packages: Dict[str, int] = {}
+    for _ in range(runs):
+        rows = importtime_cli(argv)
+        total = sum(self_us for _, self_us, _ in rows)
+        if best_total is None or total < best_total:
+            best_total = total
+            packages = defaultdict(int)
+            for name, self_us, _ in rows:
+                packages[name.split(".")[0]] += self_us
+            best_packages = packages
+
+    results = [{"bench": "importtime", "scope": "total", "runs": runs, "ms": round(best_total / 1e3, 2)}]
+    ranked = sorted(best_packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    results += [
+        {"bench": "importtime", "scope": package, "ms": round(us / 1e3, 2)}
+        for package, us in ranked
+    ]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, help="Fail if the total import time exceeds this budget")
+    args = parser.parse_args(argv)
+    results = bench_importtime(args.runs, args.top)
+    report(results)
+    if args.max_ms is not None and results[0]["ms"] > args.max_ms:
+        sys.exit(f"import time {results[0]['ms']} ms exceeds budget of {args.max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+MonoalphabeticCipher throughput: list path vs. str.translate path.
+
+Usage:
+    python -m bench.mono [--size-mb 100] [--lang en] [--repeat 1]
+"""
+
+import argparse
+import random
+from typing import Any, Dict, List
+
+from bench.common import best_of, report
+from cipher.modular_table import ModularTable
+from cipher.monoalphabetic import MonoalphabeticCipher
+from utils.alphabet_loader import load_alphabet
+
+
+def make_text(alphabet: List[str], size: int, seed: int = 0) -> str:
+    """Random text of `size` characters drawn from the alphabet plus spaces."""
+    rng = random.Random(seed)
+    block = "".join(rng.choice(alphabet + [" "]) for _ in range(65536))
+    return (block * (size // len(block) + 1))[:size]
+
+
+def bench_mono(size_mb: float, lang: str = "en", repeat: int = 1) -> List[Dict[str, Any]]:
+    alphabet = load_alphabet(lang)
+    table = ModularTable.from_alphabet(alphabet, source="bench")
+    text = make_text(alphabet, int(size_mb * 1024 * 1024))
+    key_char = alphabet[3]
+
+    paths = {
+        "list": lambda: "".join(MonoalphabeticCipher(
+            text=list(text), key_char=key_char, alphabet=alphabet, table=table
+        ).encrypt()),
+        "translate": lambda: MonoalphabeticCipher(
+            text=text, key_char=key_char, alphabet=alphabet, table=table
+        ).translate(),
+    }
+    results = []
+    for name, run in paths.items():
+        seconds = best_of(run, repeat)
+        results.append({
+            "bench": "mono",
+            "path": name,
+            "lang": lang,
+            "size_mb": size_mb,
+            "seconds": round(seconds, 4),
+            "mb_per_s": round(size_mb / seconds, 2),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+    report(bench_mono(args.size_mb, args.lang, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Scaling of CipherTransformer(parallel=N) from 1 worker to all cores.
+
+Usage:
+    python -m bench.parallel [--size-mb 50] [--keyword SECRET] [--lang en]
+"""
+
+import argparse
+from typing import Any, Dict, List, Optional, Sequence
+
+from bench.common import best_of, report
+from bench.mono import make_text
+from cipher.modular_table import ModularTable
+from cipher.parallel import default_jobs, parallel_transform
+from cipher.vigenere import Vigenere
+from utils.alphabet_loader import load_alphabet
+
+
+def bench_parallel(
+    size_mb: float,
+    keyword: str = "SECRET",
+    lang: str = "en",
+    jobs: Optional[Sequence[int]] = None,
+    repeat: int = 1
+) -> List[Dict[str, Any]]:
+    alphabet = load_alphabet(lang)
+    table = ModularTable.from_alphabet(alphabet, source="bench")
+    text = make_text(alphabet, int(size_mb * 1024 * 1024))
+    compiled = Vigenere(text=text, keyword=list(keyword), alphabet=alphabet, table=table).compile()
+
+    results = []
+    baseline = None
+    for n in jobs or range(1, default_jobs() + 1):
+        seconds = best_of(lambda: parallel_transform(compiled, text, n), repeat)
+        baseline = baseline or seconds
+        results.append({
+            "bench": "parallel",
+            "jobs": n,
+            "size_mb": size_mb,
+            "seconds": round(seconds, 4),
+            "mb_per_s": round(size_mb / seconds, 2),
+            "speedup": round(baseline / seconds, 2),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=50)
+    parser.add_argument("--keyword", default="SECRET")
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--jobs", type=int, nargs="+")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+    report(bench_parallel(args.size_mb, args.keyword, args.lang, args.jobs, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
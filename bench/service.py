@@ -0,0 +1,145 @@
+"""
+Load test for the asyncio cipher service (`serve --socket`).
+
+Starts `python -m cli.main serve` on a temporary Unix socket, then runs
+`--clients` concurrent connections that each send `--requests` Vigenère
+requests with up to `--window` in flight (pipelined). Reports client-side
+throughput and p50/p99 latency, followed by the server's own counters.
+
+Usage:
+    python -m bench.service [--clients 16] [--requests 2000] [--window 32]
+                            [--workers 4] [--pool thread] [--size 100]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from bench.common import report
+from bench.mono import make_text
+from cli.service import percentile
+from utils.alphabet_loader import load_alphabet
+
+
+async def _client(path: str, requests: List[bytes], window: int, latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_unix_connection(path)
+    sent_at: List[float] = []
+    in_flight = asyncio.Semaphore(window)
+
+    async def send():
+        for line in requests:
+            await in_flight.acquire()
+            sent_at.append(time.perf_counter())
+            writer.write(line)
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for i in range(len(requests)):
+        response = json.loads(await reader.readline())
+        latencies.append((time.perf_counter() - sent_at[i]) * 1e3)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        in_flight.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+
+
+async def _stats(path: str) -> Dict[str, Any]:
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(b'{"operation": "stats"}\n')
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response["result"]
+
+
+async def _load(path: str, clients: int, requests: List[bytes], window: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(path, requests, window, latencies) for _ in range(clients)))
+    seconds = time.perf_counter() - start
+    return {
+        "requests": len(latencies),
+        "seconds": round(seconds, 3),
+        "throughput_rps": round(len(latencies) / seconds, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "server": await _stats(path),
+    }
+
+
+def _wait_for(path: str, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if proc.poll() is not None or time.monotonic() > deadline:
+            raise RuntimeError("service did not start")
+        time.sleep(0.02)
+
+
+def bench_service(
+    clients: int = 16,
+    requests: int = 2000,
+    window: int = 32,
+    workers: int = 4,
+    pool: str = "thread",
+    size: int = 100,
+    keyword: str = "LEMON",
+    lang: str = "en",
+) -> List[Dict[str, Any]]:
+    text = make_text(load_alphabet(lang), requests * size)
+    lines = [
+        (json.dumps({
+            "id": i,
+            "operation": "encrypt",
+            "cipher": "vigenere",
+            "args": {"keyword": keyword, "lang": lang},
+            "text": text[i * size:(i + 1) * size],
+        }) + "\n").encode()
+        for i in range(requests)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "service.sock")
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "cli.main", "serve", "--socket", path,
+             "--workers", str(workers), "--pool", pool],
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for(path, proc)
+            result = asyncio.run(_load(path, clients, lines, window))
+        finally:
+            proc.terminate()
+            proc.wait()
+    server = result.pop("server")
+    return [
+        {"bench": "service", "side": "client", "clients": clients, "window": window,
+         "workers": workers, "pool": pool, "record_size": size, **result},
+        {"bench": "service", "side": "server", **server},
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per client")
+    parser.add_argument("--window", type=int, default=32, help="Pipelined requests in flight per client")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--pool", choices=("thread", "process"), default="thread")
+    parser.add_argument("--size", type=int, default=100, help="Characters per request")
+    parser.add_argument("--keyword", default="LEMON")
+    parser.add_argument("--lang", default="en")
+    args = parser.parse_args(argv)
+    report(bench_service(
+        args.clients, args.requests, args.window, args.workers, args.pool, args.size, args.keyword, args.lang
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Substitution key search throughput (keys evaluated per second) and n-gram
+model build/load times.
+
+The quadgram model is built from `--corpus` (default: the repository's
+Markdown files); the ciphertext is `--chars` characters of the same sample
+text under a random substitution key.
+
+Usage:
+    python -m bench.substitution [--corpus FILE] [--chars 3000] [--lang en]
+                                 [--restarts 4] [--iterations 20000] [--jobs N]
+"""
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from analysis.ngram_store import load_model, save_model
+from analysis.ngrams import NgramModel
+from analysis.substitution import solve_substitution
+from bench.analysis import sample_text
+from bench.common import best_of, measure, report
+from cipher.parallel import default_jobs
+from utils.alphabet_loader import load_alphabet
+
+ROOT = Path(__file__).parent.parent
+
+
+def repo_corpus() -> Iterable[str]:
+    """The repository's Markdown files, one chunk each."""
+    for path in sorted(ROOT.rglob("*.md")):
+        yield path.read_text(encoding="utf-8")
+
+
+def corpus_chunks(corpus: Optional[str]) -> Iterable[str]:
+    return [Path(corpus).read_text(encoding="utf-8")] if corpus else repo_corpus()
+
+
+def bench_model_store(corpus: Optional[str] = None, lang: str = "en", repeat: int = 5) -> List[Dict[str, Any]]:
+    """Build a model from the corpus, save it, and time mapping it back."""
+    alphabet = load_alphabet(lang)
+    chunks = list(corpus_chunks(corpus))
+    model, build_s, _ = measure(lambda: NgramModel.from_corpus(chunks, alphabet), trace_memory=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = save_model(model, Path(tmp) / f"{lang}.{model.n}.bin")
+        load_s = best_of(lambda: load_model(path), repeat)
+        size = path.stat().st_size
+    return [{
+        "bench": "ngram_store",
+        "lang": lang,
+        "corpus_mb": round(sum(map(len, chunks)) / 2**20, 2),
+        "entries": model.size,
+        "file_mb": round(size / 2**20, 2),
+        "build_seconds": round(build_s, 3),
+        "load_ms": round(load_s * 1000, 3),
+    }]
+
+
+def bench_substitution(
+    corpus: Optional[str] = None,
+    chars: int = 3000,
+    lang: str = "en",
+    restarts: int = 4,
+    iterations: int = 20_000,
+    jobs: Optional[int] = None,
+    seed: int = 1
+) -> List[Dict[str, Any]]:
+    alphabet = load_alphabet(lang)
+    model = NgramModel.from_corpus(corpus_chunks(corpus), alphabet)
+
+    plain = sample_text(chars)
+    key = random.Random(seed).sample(alphabet, len(alphabet))
+    text = plain.translate(str.maketrans(dict(zip(alphabet, key))))
+
+    results = []
+    for workers in sorted({1, jobs or default_jobs()}):
+        result = solve_substitution([text], alphabet, model, lang, restarts, iterations, workers, seed)
+        decrypted = result.decrypt(text, alphabet)
+        results.append({
+            "bench": "substitution",
+            "lang": lang,
+            "chars": chars,
+            "restarts": restarts,
+            "iterations": iterations,
+            "jobs": workers,
+            "keys_evaluated": result.keys_evaluated,
+            "keys_per_s": round(result.keys_per_second),
+            "correct_chars": round(sum(a == b for a, b in zip(decrypted, plain)) / len(plain), 4),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus")
+    parser.add_argument("--chars", type=int, default=3000)
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--restarts", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--jobs", type=int)
+    args = parser.parse_args(argv)
+    report(bench_model_store(args.corpus, args.lang))
+    report(bench_substitution(args.corpus, args.chars, args.lang, args.restarts, args.iterations, args.jobs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Run the benchmark modules as one suite and emit a single JSON document.
+
+The document records the environment (Python, platform, CPU count, NumPy,
+git revision) next to every benchmark's result rows, so runs from different
+releases can be diffed. `--compare BASELINE.json` matches rows by benchmark
+and position and reports every timing or throughput that got worse by more
+than `--threshold` (exit status 1 if any did).
+
+Profiles: `quick` uses small inputs (under a minute in total), `full` uses
+each module's own defaults (large inputs; minutes to hours).
+
+Usage:
+    python -m bench.suite [NAME ...] [--profile quick] [--output FILE]
+                          [--compare BASELINE.json] [--threshold 0.1] [--list]
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+FORMAT_VERSION = 1
+PROFILES = ("quick", "full")
+DEFAULT_THRESHOLD = 0.10
+
+# name -> (module, function, quick kwargs, full kwargs)
+BENCHMARKS: Dict[str, Tuple[str, str, Dict[str, Any], Dict[str, Any]]] = {
+    "tables": ("bench.tables", "bench_tables", {"sizes": [26, 256, 4096, 65536]}, {"sizes": [26, 256, 1024, 4096, 16384, 65536]}),
+    "ciphers": ("bench.ciphers", "bench_ciphers", {"sizes_mb": [0.1, 1]}, {"sizes_mb": [0.1, 1, 10, 100]}),
+    "mono": ("bench.mono", "bench_mono", {"size_mb": 4}, {"size_mb": 100}),
+    "parallel": ("bench.parallel", "bench_parallel", {"size_mb": 4}, {"size_mb": 50}),
+    "batch": ("bench.batch", "bench_batch", {"records": 20_000}, {"records": 1_000_000}),
+    "bytemode": ("bench.bytemode", "bench_bytemode", {"size_mb": 16}, {"size_mb": 4096}),
+    "cli_startup": ("bench.cli_startup", "bench_cli_startup", {"runs": 5}, {"runs": 20}),
+    "importtime": ("bench.importtime", "bench_importtime", {"runs": 3}, {"runs": 5}),
+    "service": ("bench.service", "bench_service", {"clients": 4, "requests": 500}, {}),
+    "analysis": ("bench.analysis", "bench_shift", {"size_mb": 4}, {"size_mb": 100}),
+    "vigenere_analysis": ("bench.analysis", "bench_vigenere", {"size_mb": 4}, {"size_mb": 100}),
+    "ngram_store": ("bench.substitution", "bench_model_store", {}, {}),
+    "substitution": ("bench.substitution", "bench_substitution", {"restarts": 2, "jobs": 1}, {}),
+}
+
+HIGHER_IS_BETTER = ("per_s", "_rps", "speedup")
+LOWER_IS_BETTER = ("seconds", "_ms", "_kib", "peak_mb", "rss_mb")
+MIN_TIMING_MS = 1.0  # shorter baseline timings are too noisy to compare
+
+
+def environment() -> Dict[str, Any]:
+    """Where the suite ran."""
+    from cipher import vectorized
+
+    numpy_version = vectorized.numpy().__version__ if vectorized.HAVE_NUMPY else None
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "numpy": numpy_version,
+        "revision": revision,
+    }
+
+
+def run_benchmark(name: str, profile: str = "quick") -> Dict[str, Any]:
+    """Run one benchmark; failures are recorded instead of raised."""
+    module, function, quick, full = BENCHMARKS[name]
+    kwargs = quick if profile == "quick" else full
+    start = time.perf_counter()
+    try:
+        results = getattr(importlib.import_module(module), function)(**kwargs)
+    except Exception as exc:
+        traceback.print_exc(file=sys.stderr)
+        return {"seconds": round(time.perf_counter() - start, 3), "error": f"{type(exc).__name__}: {exc}"}
+    return {"seconds": round(time.perf_counter() - start, 3), "results": results}
+
+
+def run_suite(names: Optional[Sequence[str]] = None, profile: str = "quick") -> Dict[str, Any]:
+    """Run the selected benchmarks (all by default) and return the suite document."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile '{profile}'; choose from {', '.join(PROFILES)}.")
+    names = list(names or BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}; choose from {', '.join(BENCHMARKS)}.")
+    document = {
+        "format": FORMAT_VERSION,
+        "profile": profile,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "benchmarks": {},
+    }
+    for name in names:
+        print(f"[bench] {name} ...", file=sys.stderr, flush=True)
+        document["benchmarks"][name] = run_benchmark(name, profile)
+    return document
+
+
+def metric_direction(key: str) -> int:
+    """+1 if larger values are better, -1 if smaller are, 0 if `key` is not a metric."""
+    if key.endswith(HIGHER_IS_BETTER):
+        return 1
+    if key.endswith(LOWER_IS_BETTER):
+        return -1
+    return 0
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Metrics that regressed by more than `threshold` (relative) between two
+    suite documents. Rows are matched by benchmark name and position, and
+    skipped when their string fields (case, lang, ...) differ; timings under
+    a millisecond are not compared.
+    """
+    regressions = []
+    for name, current_run in current["benchmarks"].items():
+        baseline_run = baseline.get("benchmarks", {}).get(name, {})
+        for i, (old, new) in enumerate(zip(baseline_run.get("results", []), current_run.get("results", []))):
+            labels = {k: v for k, v in new.items() if isinstance(v, str)}
+            if labels != {k: v for k, v in old.items() if isinstance(v, str)}:
+                continue
+            for key, value in new.items():
+                direction = metric_direction(key)
+                before = old.get(key)
+                if not direction or not isinstance(value, (int, float)) or not isinstance(before, (int, float)) or not before:
+                    continue
+                if key.endswith("_ms") and before < MIN_TIMING_MS or key.endswith("seconds") and before * 1e3 < MIN_TIMING_MS:
+                    continue
+                change = (value - before) / before * direction
+                if change < -threshold:
+                    regressions.append({
+                        "bench": name, "row": i, **labels,
+                        "metric": key, "baseline": before, "current": value,
+                        "change": round(change, 3),
+                    })
+    return regressions
+
+
+def run(
+    names: Optional[Sequence[str]] = None,
+    profile: str = "quick",
+    output: Optional[str] = None,
+    baseline: Optional[str] = None,
+    threshold: float = DEFAULT_THRESHOLD
+) -> int:
+    """Run the suite, write the document and compare it; returns an exit status."""
+    document = run_suite(names, profile)
+    text = json.dumps(document, indent=2, ensure_ascii=False)
+    if output and output != "-":
+        Path(output).write_text(text + "\n", encoding="utf-8")
+        print(f"[✓] Wrote benchmark results: {output}", file=sys.stderr)
+    else:
+        print(text)
+
+    status = 1 if any("error" in result for result in document["benchmarks"].values()) else 0
+    if baseline:
+        regressions = compare(json.loads(Path(baseline).read_text(encoding="utf-8")), document, threshold)
+        for row in regressions:
+            print(json.dumps(row, ensure_ascii=False), file=sys.stderr)
+        print(f"[bench] {len(regressions)} regression(s) beyond {threshold:.0%}", file=sys.stderr)
+        if regressions:
+            status = 1
+    return status
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Suite options, shared by `python -m bench.suite` and the CLI's `bench` command."""
+    parser.add_argument("names", nargs="*", metavar="NAME", help="Benchmarks to run (default: all)")
+    parser.add_argument("--profile", choices=PROFILES, default="quick", help="Input sizes (default: quick)")
+    parser.add_argument("--output", help="Write the JSON document here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="Report regressions against a previous document")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown reported as a regression (default: 0.1)")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    return run_args(parser.parse_args(argv))
+
+
+def run_args(args: argparse.Namespace) -> int:
+    if args.list:
+        for name, (module, function, _, _) in BENCHMARKS.items():
+            print(f"{name}\t{module}.{function}")
+        return 0
+    return run(args.names, args.profile, args.output, args.compare, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Construction time and memory of cipher tables across alphabet sizes.
+
+Usage:
+    python -m bench.tables [--sizes 26 256 4096 65536] [--eager-limit 2048]
+"""
+
+import argparse
+from typing import Any, Dict, List, Sequence
+
+from bench.common import measure, report, synthetic_alphabet
+from cipher.charmap_table import CharmapTable
+from cipher.modular_table import ModularTable
+
+DEFAULT_SIZES = [26, 256, 1024, 4096, 16384, 65536]
+
+
+def bench_tables(sizes: Sequence[int], eager_limit: int = 2048) -> List[Dict[str, Any]]:
+    """
+    Build an eager CharmapTable and a lazy ModularTable for each size and
+    fetch one row from each. Eager tables above `eager_limit` are skipped,
+    since they grow quadratically.
+    """
+    results = []
+    for size in sizes:
+        alphabet = synthetic_alphabet(size)
+        key_char = alphabet[size // 2]
+        builders = [("modular", ModularTable.from_alphabet)]
+        if size <= eager_limit:
+            builders.insert(0, ("eager", CharmapTable.from_alphabet))
+        else:
+            results.append({"bench": "tables", "table": "eager", "size": size, "skipped": True})
+
+        for name, build in builders:
+            table, build_s, peak = measure(lambda: build(alphabet, source="bench"))
+            _, row_s, _ = measure(lambda: table.get_map(key_char), trace_memory=False)
+            results.append({
+                "bench": "tables",
+                "table": name,
+                "size": size,
+                "build_ms": round(build_s * 1e3, 3),
+                "first_row_ms": round(row_s * 1e3, 3),
+                "peak_kib": round(peak / 1024, 1),
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--eager-limit", type=int, default=2048)
+    args = parser.parse_args(argv)
+    report(bench_tables(args.sizes, args.eager_limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@ from .monoalphabetic import MonoalphabeticCipher
 from .vigenere import Vigenere
 from .transformer import CipherTransformer
 from .charmap_table import CharmapTable
+from .modular_table import ModularTable
+from .profiling import Profiler, StageProfile
+from .encoded import EncodedText
+from .cache import CipherCache, CacheStats, compile_cached, default_cache
 
 __all__ = [
     "CipherBit",
@@ -10,4 +14,12 @@ __all__ = [
     "Vigenere",
     "CipherTransformer",
     "CharmapTable",
+    "ModularTable",
+    "Profiler",
+    "StageProfile",
+    "EncodedText",
+    "CipherCache",
+    "CacheStats",
+    "compile_cached",
+    "default_cache",
 ]
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List
-from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
 
+from cipher import profiling
+from cipher.encoded import EncodedText
+from cipher.interfaces import CompiledTransform
+from utils.range_alphabet import RangeAlphabet
 from utils.validators import ensure_not_empty
 
 @dataclass
@@ -10,32 +14,82 @@ class CipherBit(ABC):
     Abstract base class for cipher components ("cipher bits").
     Each subclass must implement `encrypt()` and `decrypt()` methods.
     Attributes:
-        text (List[str]): The input to be transformed.
+        text (List[str]): The input to be transformed (a `str` or an `EncodedText`
+            is also accepted; ciphers given an `EncodedText` return one).
         alphabet (List[str]): The working alphabet used for mapping.
         fast (bool): Optional performance hint for downstream implementations.
     """
     text: List[str]
     alphabet: List[str]
     fast: bool = False
+    _compiled: Dict[str, CompiledTransform] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """
         Normalize and validate inputs.
-        Ensures that text and alphabet are both non-empty lists.
+        Ensures that text and alphabet are both non-empty sequences.
+        A `str` or `EncodedText` is kept as-is (both are immutable sequences);
+        any other iterable is converted to a list. Likewise a `RangeAlphabet`
+        is kept as-is rather than expanded into a list.
         """
-        self.text = list(self.text)
-        self.alphabet = list(self.alphabet)
+        if not isinstance(self.text, (str, EncodedText)):
+            self.text = list(self.text)
+        if not isinstance(self.alphabet, RangeAlphabet):
+            self.alphabet = list(self.alphabet)
 
         ensure_not_empty(self.text, "Text must not be empty.")
         ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
 
+    def as_string(self) -> str:
+        """Return the input text as a single string."""
+        if isinstance(self.text, EncodedText):
+            return self.text.decode()
+        return self.text if isinstance(self.text, str) else "".join(self.text)
+
+    def _transform_encoded(self, decrypt: bool) -> EncodedText:
+        """Transform an `EncodedText` input on its indices, via the compiled form."""
+        mode = "decrypt" if decrypt else "encrypt"
+        if mode not in self._compiled:
+            self._compiled[mode] = self.compile(mode)
+        return self._compiled[mode].transform_encoded(self.text)[0]
+
     def __call__(self, mode: str = "encrypt") -> List[str]:
         """
         Enable instance to be called as a function:
         >>> cipher() == cipher.encrypt()
         >>> cipher("decrypt") == cipher.decrypt()
+        Recorded as one stage when a `cipher.profiling.Profiler` is active.
+        """
+        profiler = profiling.current()
+        if profiler is None:
+            return self.encrypt() if mode == "encrypt" else self.decrypt()
+        with profiler.stage(type(self).__name__, mode, len(self.text)):
+            return self.encrypt() if mode == "encrypt" else self.decrypt()
+
+    def compile(self, mode: str = "encrypt") -> CompiledTransform:
+        """
+        Return a stateless compiled form of this cipher for the given mode.
+        The compiled transform ignores `text`; callers feed chunks to it instead.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no compiled form.")
+
+    def transform(self, chunk: str, offset: int = 0, mode: str = "encrypt") -> Tuple[str, int]:
+        """
+        Transform one chunk independently of `text`, using the compiled form for
+        `mode` (compiled once and reused).
+
+        Returns:
+            Tuple[str, int]: The transformed chunk and the offset for the next chunk.
         """
-        return self.encrypt() if mode == "encrypt" else self.decrypt()
+        if mode not in self._compiled:
+            self._compiled[mode] = self.compile(mode)
+        profiler = profiling.current()
+        if profiler is None:
+            return self._compiled[mode].transform(chunk, offset)
+        with profiler.stage(f"{type(self).__name__}.transform", mode, len(chunk)):
+            return self._compiled[mode].transform(chunk, offset)
 
     @abstractmethod
     def encrypt(self) -> List[str]:
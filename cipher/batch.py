@@ -0,0 +1,130 @@
+"""
+Batch API: transform many short messages with one compiled cipher.
+
+The table, keyword normalization and validation are paid once in
+`compile_key`; every message is then transformed from key position 0 by the
+shared `CompiledCipher`, without building a `CipherBit` per record.
+
+With `concat=True` records are processed in batches joined into one buffer,
+so the per-call overhead is paid per batch rather than per record:
+
+- period 1 (monoalphabetic keys): one `str.translate` over the whole batch;
+- longer periods: each record is padded to a multiple of the period so every
+  record starts at key position 0, the batch runs through the strided
+  translate path, and the padding is dropped when splitting.
+"""
+
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from cipher.cache import compile_cached
+from cipher.compiled import CompiledCipher
+from cipher.interfaces import CipherTable, CompiledTransform
+from cipher.modular_table import ModularTable
+from cipher.vigenere import normalize_keyword
+from utils.validators import ensure_not_empty
+
+DEFAULT_BATCH_RECORDS = 4096
+_PAD = " "  # padding is transformed and then discarded, so any symbol works
+
+
+def compile_key(
+    key: Sequence[str],
+    alphabet: Sequence[str],
+    mode: str = "encrypt",
+    table: Optional[CipherTable] = None,
+    fast: bool = False
+) -> CompiledCipher:
+    """
+    Compile `key` once for batch use.
+
+    The key is normalized like a Vigenère keyword (filtered to the alphabet,
+    de-duplicated); a single-character key is a monoalphabetic shift.
+
+    Args:
+        key (Sequence[str]): Keyword or key character.
+        alphabet (Sequence[str]): Alphabet of the table.
+        mode (str): 'encrypt' or 'decrypt'.
+        table (Optional[CipherTable]): Table to use; defaults to the shared
+            `ModularTable` for the alphabet.
+        fast (bool): Allow the NumPy engine for shift schedules.
+    """
+    table = table or ModularTable.shared(alphabet, source="batch")
+    keyword = normalize_keyword(key, table)
+    ensure_not_empty(keyword, "Keyword must not be empty")
+    return compile_cached(table, keyword, mode, fast=fast)
+
+
+def _split(out: str, starts: Sequence[int], lengths: Sequence[int]) -> List[str]:
+    return [out[start:start + length] for start, length in zip(starts, lengths)]
+
+
+def _concat_batch(compiled: CompiledTransform, batch: List[str]) -> List[str]:
+    """Transform a batch of records as one buffer, each from key position 0."""
+    lengths = [len(text) for text in batch]
+    period = getattr(compiled, "period", 1)
+
+    if period == 1:
+        starts = [0, *accumulate(lengths)][:-1]
+        return _split(compiled("".join(batch)), starts, lengths)
+
+    padded = [text + _PAD * (-len(text) % period) for text in batch]
+    starts = [0, *accumulate(len(text) for text in padded)][:-1]
+    return _split(compiled("".join(padded)), starts, lengths)
+
+
+def transform_many(
+    compiled: CompiledTransform,
+    texts: Iterable[str],
+    concat: bool = False,
+    batch_records: int = DEFAULT_BATCH_RECORDS
+) -> Iterator[str]:
+    """
+    Transform every message in `texts` independently (key position 0 each).
+
+    Args:
+        compiled (CompiledTransform): Compiled cipher or pipeline.
+        texts (Iterable[str]): Messages; may be a lazy iterator.
+        concat (bool): Process `batch_records` messages per buffer.
+        batch_records (int): Messages per concatenated batch.
+
+    Yields:
+        str: Transformed messages, in input order.
+    """
+    if not concat:
+        for text in texts:
+            yield compiled.transform(text, 0)[0]
+        return
+
+    if batch_records < 1:
+        raise ValueError("batch_records must be at least 1.")
+    texts = iter(texts)
+    while True:
+        batch = list(islice(texts, batch_records))
+        if not batch:
+            return
+        yield from _concat_batch(compiled, batch)
+
+
+def encrypt_many(
+    texts: Iterable[str],
+    key: Sequence[str],
+    alphabet: Sequence[str],
+    table: Optional[CipherTable] = None,
+    concat: bool = False,
+    fast: bool = False
+) -> Iterator[str]:
+    """Encrypt each message with `key`; see `compile_key` and `transform_many`."""
+    return transform_many(compile_key(key, alphabet, "encrypt", table, fast), texts, concat)
+
+
+def decrypt_many(
+    texts: Iterable[str],
+    key: Sequence[str],
+    alphabet: Sequence[str],
+    table: Optional[CipherTable] = None,
+    concat: bool = False,
+    fast: bool = False
+) -> Iterator[str]:
+    """Decrypt each message with `key`; see `compile_key` and `transform_many`."""
+    return transform_many(compile_key(key, alphabet, "decrypt", table, fast), texts, concat)
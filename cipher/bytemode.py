@@ -0,0 +1,145 @@
+"""
+Byte-oriented ciphers for binary and ASCII workloads.
+
+Each byte is treated as the code point of the same value (Latin-1), so any
+alphabet whose symbols are all below U+0100 maps directly onto byte values.
+A compiled cipher becomes one 256-byte `bytes.translate` table per key
+position; files are processed through `mmap` into a preallocated output file
+in bounded chunks, without creating per-character Python objects.
+"""
+
+import mmap
+import os
+from dataclasses import dataclass
+from math import lcm
+from typing import BinaryIO, Sequence, Tuple
+
+from cipher.compiled import CompiledCipher, CompiledPipeline
+from cipher.interfaces import CompiledTransform
+
+DEFAULT_CHUNK_BYTES = 8 << 20
+_IDENTITY = bytes(range(256))
+
+
+def ensure_byte_alphabet(alphabet: Sequence[str]) -> None:
+    """Raise ValueError unless every symbol is a single character below U+0100."""
+    if any(len(char) != 1 or ord(char) > 0xFF for char in alphabet):
+        raise ValueError("Byte mode requires an alphabet of single characters below U+0100.")
+
+
+def _byte_table(table: dict) -> bytes:
+    """Convert a `str.maketrans` table to a 256-byte `bytes.translate` table."""
+    out = bytearray(_IDENTITY)
+    for src, dst in table.items():
+        if src > 0xFF:
+            continue  # never present in byte input
+        if len(dst) != 1 or ord(dst) > 0xFF:
+            raise ValueError("Byte mode requires substitutions within U+0000..U+00FF.")
+        out[src] = ord(dst)
+    return bytes(out)
+
+
+@dataclass(frozen=True, eq=False)
+class ByteCipher:
+    """
+    Periodic byte substitution: position i uses `tables[i % period]`.
+    """
+    tables: Tuple[bytes, ...]
+
+    @property
+    def period(self) -> int:
+        return len(self.tables)
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledTransform) -> 'ByteCipher':
+        """
+        Convert a CompiledCipher, or a CompiledPipeline of them, to byte tables.
+        Pipeline stages are composed into a single schedule.
+        """
+        if isinstance(compiled, CompiledCipher):
+            ensure_byte_alphabet(compiled.alphabet)
+            return cls(tables=tuple(_byte_table(t) for t in compiled.tables))
+        if isinstance(compiled, CompiledPipeline):
+            stages = [cls.from_compiled(stage) for stage in compiled.stages]
+            period = lcm(*(stage.period for stage in stages))
+            tables = []
+            for p in range(period):
+                table = _IDENTITY
+                for stage in stages:
+                    table = table.translate(stage.tables[p % stage.period])
+                tables.append(table)
+            return cls(tables=tuple(tables))
+        raise TypeError(f"Cannot run {type(compiled).__name__} in byte mode.")
+
+    def _apply(self, data: bytes, offset: int):
+        period = self.period
+        if period == 1:
+            return data.translate(self.tables[0])
+        out = bytearray(len(data))
+        for j in range(min(period, len(data))):
+            out[j::period] = data[j::period].translate(self.tables[(offset + j) % period])
+        return out
+
+    def transform(self, data: bytes, offset: int = 0) -> Tuple[bytes, int]:
+        """Transform `data`, whose first byte sits at key position `offset`."""
+        return bytes(self._apply(data, offset)), offset + len(data)
+
+    def _step(self, chunk_size: int) -> int:
+        # Keep chunk starts aligned to both the key period and the page size.
+        unit = lcm(self.period, mmap.PAGESIZE)
+        return max(1, -(-chunk_size // unit)) * unit
+
+    def transform_file(self, src: str, dst: str, chunk_size: int = DEFAULT_CHUNK_BYTES, offset: int = 0) -> int:
+        """
+        Transform file `src` into `dst` via memory maps, chunk by chunk.
+        Processed pages are released as the job advances, so resident memory
+        stays around two chunks regardless of file size.
+
+        Returns:
+            int: Number of bytes processed.
+        """
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise ValueError("Input and output must be different files.")
+        step = self._step(chunk_size)
+        with open(src, "rb") as fin, open(dst, "w+b") as fout:
+            size = os.fstat(fin.fileno()).st_size
+            fout.truncate(size)
+            if size == 0:
+                return 0
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as src_map, \
+                    mmap.mmap(fout.fileno(), size) as dst_map:
+                for start in range(0, size, step):
+                    end = min(start + step, size)
+                    dst_map[start:end] = self._apply(src_map[start:end], offset + start)
+                    _release(src_map, start, end - start)
+                    _release(dst_map, start, end - start)
+                dst_map.flush()
+        return size
+
+    def transform_stream(
+        self,
+        reader: BinaryIO,
+        writer: BinaryIO,
+        chunk_size: int = DEFAULT_CHUNK_BYTES,
+        offset: int = 0
+    ) -> int:
+        """
+        Transform a binary stream (e.g. stdin) chunk by chunk; for non-seekable I/O.
+
+        Returns:
+            int: Number of bytes processed.
+        """
+        step = self._step(chunk_size)
+        position = offset
+        while True:
+            data = reader.read(step)
+            if not data:
+                return position - offset
+            writer.write(self._apply(data, position))
+            position += len(data)
+
+
+def _release(mapping: mmap.mmap, start: int, length: int) -> None:
+    """Drop processed pages from the process's resident set (Linux/BSD only)."""
+    if hasattr(mmap, "MADV_DONTNEED"):
+        mapping.madvise(mmap.MADV_DONTNEED, start, length)
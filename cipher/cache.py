@@ -0,0 +1,229 @@
+"""
+Process-wide cache of compiled ciphers.
+
+Compiling a key builds one `str.maketrans` table per key position, which is
+the dominant cost of short messages. `CipherCache` keeps compiled ciphers
+keyed by (table fingerprint, keyword, mode, fast) so a key that comes back,
+in the next CLI chunk, service request or batch, is compiled once per
+process.
+
+A table fingerprint identifies the rows a table produces, not the table
+object: every modular table over one alphabet (`ModularTable`, or a
+`CharmapTable.from_alphabet` with its shift index) shares one fingerprint,
+and a keyword table from `CharmapTable.from_plain_and_cipher_alphabet` is
+identified by its plain and cipher alphabets. Other tables are compiled
+without caching.
+
+Entries are evicted least recently used first once their estimated size
+exceeds `max_bytes`. All operations take one lock, so the cache can be
+shared by service threads; worker processes each have their own.
+"""
+
+import hashlib
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from cipher.charmap_table import CharmapTable
+from cipher.compiled import CompiledCipher, is_decrypt
+from cipher.interfaces import CipherTable
+from cipher.modular_table import ModularTable
+from utils.range_alphabet import RangeAlphabet
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def alphabet_fingerprint(alphabet: Sequence[str]) -> str:
+    """Digest of an alphabet's symbols in order (of its ranges for a `RangeAlphabet`)."""
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(alphabet, RangeAlphabet):
+        digest.update(repr((alphabet.ranges, alphabet.extras)).encode("utf-8", "surrogatepass"))
+    else:
+        digest.update("\x00".join(alphabet).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+_fingerprints: Dict[int, Tuple["weakref.ref", Optional[Tuple[str, ...]]]] = {}
+_fingerprints_lock = threading.Lock()
+
+
+def table_fingerprint(table: CipherTable) -> Optional[Tuple[str, ...]]:
+    """
+    Identity of the rows `table` produces, or None if it cannot be cached.
+    Computed once per live table object (tables are not modified after construction).
+    """
+    key = id(table)
+    with _fingerprints_lock:
+        known = _fingerprints.get(key)
+    if known is not None and known[0]() is table:
+        return known[1]
+    fingerprint = _fingerprint(table)
+    try:
+        ref = weakref.ref(table, lambda _, key=key: _forget(key))
+    except TypeError:
+        return fingerprint
+    with _fingerprints_lock:
+        _fingerprints[key] = (ref, fingerprint)
+    return fingerprint
+
+
+def _forget(key: int) -> None:
+    with _fingerprints_lock:
+        known = _fingerprints.get(key)
+        if known is not None and known[0]() is None:
+            del _fingerprints[key]
+
+
+def _fingerprint(table: CipherTable) -> Optional[Tuple[str, ...]]:
+    if isinstance(table, ModularTable) or isinstance(table, CharmapTable) and table.index:
+        return ("modular", alphabet_fingerprint(table.base_alphabet))
+    if isinstance(table, CharmapTable) and len(table.forward_maps) == 1:
+        forward = table.forward_maps[table.default_keyword]
+        plain = table.base_alphabet
+        return ("keyword", alphabet_fingerprint(plain), alphabet_fingerprint(list(map(forward.get, plain, plain))))
+    return None
+
+
+def estimate_size(compiled: CompiledCipher) -> int:
+    """Approximate bytes held by a compiled cipher's tables (shared symbols not counted)."""
+    return sys.getsizeof(compiled.alphabet) + sum(sys.getsizeof(table) for table in compiled.tables)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of a `CipherCache`.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that compiled.
+        evictions (int): Entries dropped to stay within `max_bytes`.
+        entries (int): Entries currently held.
+        bytes (int): Estimated size of the held entries.
+        max_bytes (int): Size budget.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class CipherCache:
+    """
+    Thread-safe LRU of compiled ciphers, bounded by estimated memory.
+
+    Args:
+        max_bytes (int): Size budget; 0 disables caching.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[CompiledCipher, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = self._misses = self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get_or_compile(self, key: Hashable, compile: Callable[[], CompiledCipher]) -> CompiledCipher:
+        """
+        Return the entry for `key`, compiling and storing it on a miss.
+        Compilation runs outside the lock; concurrent misses on one key may
+        compile twice, and the first stored result wins.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        compiled = compile()
+        size = estimate_size(compiled)
+        if size > self.max_bytes:
+            return compiled
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry[0]
+            self._entries[key] = (compiled, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._evictions += 1
+        return compiled
+
+    def compile(
+        self,
+        table: CipherTable,
+        keyword: Sequence[str],
+        mode: str = "encrypt",
+        fast: bool = False
+    ) -> CompiledCipher:
+        """
+        `CompiledCipher.from_table(table, keyword, mode, fast)`, cached when the
+        table has a fingerprint. The keyword is used as given (normalize it first).
+        """
+        decrypt = is_decrypt(mode)
+        fingerprint = table_fingerprint(table)
+        build = lambda: CompiledCipher.from_table(table, keyword, mode, fast=fast)
+        if fingerprint is None:
+            return build()
+        return self.get_or_compile((fingerprint, tuple(keyword), decrypt, fast), build)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+
+_default = CipherCache()
+
+
+def default_cache() -> CipherCache:
+    """The process-wide cache used by the ciphers, the batch API and the CLI."""
+    return _default
+
+
+def compile_cached(
+    table: CipherTable,
+    keyword: Sequence[str],
+    mode: str = "encrypt",
+    fast: bool = False
+) -> CompiledCipher:
+    """Compile through the process-wide cache (see `CipherCache.compile`)."""
+    return _default.compile(table, keyword, mode, fast)
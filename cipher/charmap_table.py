@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List, Dict
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
 
 from utils.tools import rotate, get_ascii_alphabet
 from utils.alphabet_loader import load_alphabet
@@ -13,6 +13,10 @@ class CharmapTable(CipherTable):
     forward_maps: Dict[str, Dict[str, str]]
     reverse_maps: Dict[str, Dict[str, str]]
     source: str  # e.g., "yaml:config/alpha/en.yaml", "ascii_fallback"
+    index: Dict[str, int] = field(default_factory=dict)  # only set for rotated (modular) tables
+    _translations: Dict[Tuple[str, bool], Dict[int, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def base_alphabet(self) -> List[str]:
@@ -55,13 +59,15 @@ class CharmapTable(CipherTable):
             shifted = rotate(alphabet, -i)
             forward[key] = dict(zip(alphabet, shifted))
             reverse[key] = dict(zip(shifted, alphabet))
-        
+
+        index = {char: i for i, char in enumerate(alphabet)}
         return cls(
             _base_alphabet=alphabet,
             _default_keyword=alphabet[0],
             forward_maps=forward,
             reverse_maps=reverse,
-            source=source
+            source=source,
+            index=index if len(index) == len(alphabet) else {}
         )
 
     def get_map(self, key_char: str, decrypt: bool = False) -> Dict[str, str]:
@@ -71,6 +77,28 @@ class CharmapTable(CipherTable):
         maps = self.reverse_maps if decrypt else self.forward_maps
         return maps.get(key_char, {})
 
+    def get_translation(self, key_char: str, decrypt: bool = False) -> Dict[int, str]:
+        """
+        Get the `str.maketrans` table for a key character, compiled once and cached.
+        """
+        cache_key = (key_char, decrypt)
+        translation = self._translations.get(cache_key)
+        if translation is None:
+            translation = str.maketrans(self.get_map(key_char, decrypt=decrypt))
+            self._translations[cache_key] = translation
+        return translation
+
+    def contains(self, symbol: str) -> bool:
+        if self.index:
+            return symbol in self.index
+        return symbol in self.forward_maps.get(self._default_keyword, {})
+
+    def shift_of(self, key_char: str) -> Optional[int]:
+        """
+        Return the shift of the row for `key_char` (rotated tables only).
+        """
+        return self.index.get(key_char)
+
 
     @classmethod
     def from_plain_and_cipher_alphabet(cls, plain_alphabet: list, cipher_alphabet: list, source: str) -> 'CharmapTable':
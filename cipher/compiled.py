@@ -0,0 +1,256 @@
+"""
+Stateless compiled ciphers.
+
+`CompiledCipher` is a periodic substitution schedule: one `str.maketrans`
+table per key position. Position i of the key stream uses table
+`i % period`, which covers monoalphabetic ciphers (period 1) and Vigenère
+(period = keyword length). `CompiledPipeline` chains compiled stages; `fuse()` first merges consecutive
+shift stages over the same alphabet into one schedule (period = lcm of the
+stage periods), so they run in a single pass.
+
+Both are immutable after construction and carry no text, so they can be
+reused across chunks, threads and processes; validation happens once, when
+compiling.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from math import lcm
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cipher import vectorized
+from cipher.encoded import EncodedText, translation_permutation
+from cipher.interfaces import CipherTable, CompiledTransform
+from utils.range_alphabet import RangeAlphabet
+from utils.validators import ensure_not_empty
+
+MODES = ("encrypt", "decrypt")
+MAX_FUSED_PERIOD = 4096  # larger schedules stay staged to bound table memory
+
+
+def is_decrypt(mode: str) -> bool:
+    """Validate `mode` and return True for 'decrypt'."""
+    if mode not in MODES:
+        raise ValueError("Mode must be 'encrypt' or 'decrypt'.")
+    return mode == "decrypt"
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledCipher(CompiledTransform):
+    """
+    Periodic substitution schedule over an alphabet.
+
+    Attributes:
+        alphabet (Tuple[str, ...]): Alphabet the schedule was compiled for.
+        tables (Tuple[Dict[int, str], ...]): `str.maketrans` table per key position.
+        shifts (Optional[Tuple[int, ...]]): Signed shift per key position when every
+            table is a pure shift of the alphabet, else None.
+        fast (bool): Use the NumPy engine for shift schedules when available.
+    """
+    alphabet: Tuple[str, ...]
+    tables: Tuple[Dict[int, str], ...]
+    shifts: Optional[Tuple[int, ...]] = None
+    fast: bool = False
+
+    @property
+    def period(self) -> int:
+        return len(self.tables)
+
+    @classmethod
+    def from_table(
+        cls,
+        table: CipherTable,
+        keyword: Sequence[str],
+        mode: str = "encrypt",
+        fast: bool = False
+    ) -> 'CompiledCipher':
+        """
+        Compile the rows of `table` selected by `keyword` for the given mode.
+
+        Args:
+            table (CipherTable): Source of the substitution rows.
+            keyword (Sequence[str]): Key characters; one row per position.
+            mode (str): 'encrypt' or 'decrypt'.
+            fast (bool): Allow the NumPy engine for shift schedules.
+
+        Raises:
+            NotImplementedError: If an alphabet symbol is not a single character
+                (`str.translate` cannot express it; callers fall back to the staged path).
+        """
+        decrypt = is_decrypt(mode)
+        if not isinstance(table.base_alphabet, RangeAlphabet) \
+                and any(len(symbol) != 1 for symbol in table.base_alphabet):
+            raise NotImplementedError("Alphabets with multi-character symbols have no compiled form.")
+        keyword = list(keyword)
+        ensure_not_empty(keyword, "Keyword must not be empty")
+
+        shifts: Optional[List[int]] = [table.shift_of(k) for k in keyword]
+        if any(s is None for s in shifts):
+            shifts = None
+        else:
+            shifts = [-s if decrypt else s for s in shifts]
+
+        return cls(
+            alphabet=tuple(table.base_alphabet),
+            tables=tuple(table.get_translation(k, decrypt=decrypt) for k in keyword),
+            shifts=tuple(shifts) if shifts is not None else None,
+            fast=fast,
+        )
+
+    @classmethod
+    def from_shifts(
+        cls,
+        alphabet: Sequence[str],
+        shifts: Sequence[int],
+        fast: bool = False
+    ) -> 'CompiledCipher':
+        """
+        Compile a periodic shift schedule over a duplicate-free alphabet:
+        position i maps alphabet[j] -> alphabet[(j + shifts[i % period]) % n].
+        """
+        alphabet = tuple(alphabet)
+        n = len(alphabet)
+        ensure_not_empty(alphabet, "Alphabet must not be empty.")
+        ensure_not_empty(shifts, "Shift schedule must not be empty.")
+        shifts = tuple(s % n for s in shifts)
+        return cls(
+            alphabet=alphabet,
+            tables=tuple(
+                str.maketrans(dict(zip(alphabet, alphabet[s:] + alphabet[:s]))) for s in shifts
+            ),
+            shifts=shifts,
+            fast=fast,
+        )
+
+    def rebased(self, offset: int) -> 'CompiledCipher':
+        """Return the same schedule starting at key position `offset`."""
+        start = offset % self.period
+        if not start:
+            return self
+        return CompiledCipher(
+            alphabet=self.alphabet,
+            tables=self.tables[start:] + self.tables[:start],
+            shifts=self.shifts[start:] + self.shifts[:start] if self.shifts is not None else None,
+            fast=self.fast,
+        )
+
+    def transform(self, chunk: str, offset: int = 0) -> Tuple[str, int]:
+        """
+        Transform `chunk`, whose first character sits at key position `offset`.
+        """
+        end = offset + len(chunk)
+        period = self.period
+        if period == 1:
+            return chunk.translate(self.tables[0]), end
+        if self.fast and self.shifts is not None and vectorized.HAVE_NUMPY \
+                and vectorized.alphabet_codepoints(self.alphabet) is not None:
+            return vectorized.shift_text(chunk, self.alphabet, self.shifts, offset), end
+
+        # Translate each key column as one strided slice, then interleave.
+        out: List[str] = [""] * len(chunk)
+        for j in range(min(period, len(chunk))):
+            out[j::period] = chunk[j::period].translate(self.tables[(offset + j) % period])
+        return "".join(out), end
+
+    @cached_property
+    def permutations(self) -> Optional[Tuple[List[int], ...]]:
+        """Index permutation per key position, or None if a table leaves the alphabet."""
+        if self.shifts is not None:
+            n = len(self.alphabet)
+            return tuple([(j + s) % n for j in range(n)] for s in self.shifts)
+        perms = [translation_permutation(table, self.alphabet) for table in self.tables]
+        return None if any(perm is None for perm in perms) else tuple(perms)
+
+    def transform_encoded(self, encoded: EncodedText, offset: int = 0) -> Tuple[EncodedText, int]:
+        """
+        Transform integer-encoded text directly on its indices (no decoding),
+        when it is encoded over this schedule's alphabet.
+        """
+        if encoded.alphabet != self.alphabet or self.permutations is None:
+            return super().transform_encoded(encoded, offset)
+        return encoded.permute(self.permutations, offset), offset + len(encoded)
+
+
+def _is_shift(stage: CompiledTransform) -> bool:
+    return isinstance(stage, CompiledCipher) and stage.shifts is not None
+
+
+def plan_fusion(stages: Sequence[CompiledTransform]) -> List[Tuple[int, ...]]:
+    """
+    Group consecutive stages that can be fused: pure shift schedules over the
+    same alphabet whose combined period stays within MAX_FUSED_PERIOD.
+
+    Returns:
+        List[Tuple[int, ...]]: Stage indices per group, in order.
+    """
+    groups: List[List[int]] = []
+    period = 0
+    for i, stage in enumerate(stages):
+        if groups and _is_shift(stage) and _is_shift(stages[groups[-1][0]]):
+            head = stages[groups[-1][0]]
+            combined = lcm(period, stage.period)
+            if stage.alphabet == head.alphabet and combined <= MAX_FUSED_PERIOD:
+                groups[-1].append(i)
+                period = combined
+                continue
+        groups.append([i])
+        period = stage.period if _is_shift(stage) else 0
+    return [tuple(group) for group in groups]
+
+
+def fuse_shifts(stages: Sequence[CompiledCipher]) -> CompiledCipher:
+    """
+    Compose shift schedules into one equivalent schedule: position p is
+    shifted by the sum of every stage's shift at p, over the lcm of periods.
+    """
+    period = lcm(*(stage.period for stage in stages))
+    shifts = [
+        sum(stage.shifts[p % stage.period] for stage in stages)
+        for p in range(period)
+    ]
+    return CompiledCipher.from_shifts(
+        stages[0].alphabet, shifts, fast=any(stage.fast for stage in stages)
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledPipeline(CompiledTransform):
+    """
+    Compiled stages applied in sequence. Every stage sees the same key position,
+    since substitution stages preserve length.
+
+    Attributes:
+        stages (Tuple[CompiledTransform, ...]): Stages as executed.
+        groups (Tuple[Tuple[int, ...], ...]): Source stage indices behind each
+            executed stage (more than one index means the stages were fused).
+    """
+    stages: Tuple[CompiledTransform, ...]
+    groups: Tuple[Tuple[int, ...], ...] = ()
+
+    @property
+    def period(self) -> int:
+        """Key stream period of the whole pipeline (lcm of the stage periods)."""
+        return lcm(*(getattr(stage, "period", 1) for stage in self.stages))
+
+    @classmethod
+    def fuse(cls, stages: Sequence[CompiledTransform]) -> 'CompiledPipeline':
+        """
+        Build a pipeline where compatible consecutive shift stages are fused
+        into a single pass; incompatible stages run as-is.
+        """
+        groups = plan_fusion(stages)
+        executed = [
+            fuse_shifts([stages[i] for i in group]) if len(group) > 1 else stages[group[0]]
+            for group in groups
+        ]
+        return cls(stages=tuple(executed), groups=tuple(groups))
+
+    def transform(self, chunk: str, offset: int = 0) -> Tuple[str, int]:
+        for stage in self.stages:
+            chunk, _ = stage.transform(chunk, offset)
+        return chunk, offset + len(chunk)
+
+    def transform_encoded(self, encoded: EncodedText, offset: int = 0) -> Tuple[EncodedText, int]:
+        for stage in self.stages:
+            encoded, _ = stage.transform_encoded(encoded, offset)
+        return encoded, offset + len(encoded)
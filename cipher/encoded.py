@@ -0,0 +1,203 @@
+"""
+Integer-encoded text: alphabet indices in a compact array.
+
+`EncodedText` stores one index per character in the smallest array type that
+fits the alphabet ('B' up to 255 symbols, 'H' up to 65 535, else 'I').
+Characters outside the alphabet are stored as the sentinel index `len(alphabet)`;
+the characters themselves are kept, in order, in a separate string, so the
+passthrough mask is implicit and costs nothing for text without them.
+
+Encoding and decoding each take a few C-level passes (`re.sub`,
+`str.translate`, a codec), with no per-character Python objects. Substitution
+stages then work on the indices: a periodic permutation is a strided
+`bytes.translate` for 'B' arrays and a NumPy gather otherwise. A pipeline
+therefore encodes once at entry and decodes once at exit.
+"""
+
+import re
+import sys
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cipher import vectorized
+
+_CODECS = {"B": "latin-1", "H": "utf-16-le", "I": "utf-32-le"}
+_ERRORS = "surrogatepass"
+
+
+def index_typecode(size: int) -> str:
+    """Smallest array typecode holding indices 0..size (size is the sentinel)."""
+    if size < 1 << 8:
+        return "B"
+    if size < 1 << 16:
+        return "H"
+    return "I"
+
+
+@lru_cache(maxsize=32)
+def _codec(alphabet: Tuple[str, ...]):
+    """
+    Per-alphabet translation tables.
+
+    Returns:
+        (placeholder, outside, encode_table, decode_table): a character outside
+        the alphabet that stands in for passthrough characters, a regex
+        matching any non-alphabet character, and the symbol <-> chr(index)
+        tables (placeholder <-> sentinel).
+    """
+    if any(len(symbol) != 1 for symbol in alphabet):
+        raise ValueError("EncodedText requires single-character alphabet symbols.")
+    if len(set(alphabet)) != len(alphabet):
+        raise ValueError("EncodedText requires a duplicate-free alphabet.")
+    symbols = set(alphabet)
+    placeholder = next(chr(cp) for cp in chain(range(0xE000, 0xF900), range(0xF0000, 0x110000)) if chr(cp) not in symbols)
+    outside = _negated_class(alphabet)
+    n = len(alphabet)
+    encode_table = {ord(symbol): i for i, symbol in enumerate(alphabet)}
+    encode_table[ord(placeholder)] = n
+    decode_table = {i: symbol for i, symbol in enumerate(alphabet)}
+    decode_table[n] = placeholder
+    return placeholder, outside, encode_table, decode_table
+
+
+def _negated_class(alphabet: Sequence[str]) -> "re.Pattern":
+    """Regex matching any character outside `alphabet` (code points grouped into ranges)."""
+    ranges = []
+    for cp in sorted(map(ord, alphabet)):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    parts = (
+        re.escape(chr(lo)) if lo == hi else f"{re.escape(chr(lo))}-{re.escape(chr(hi))}"
+        for lo, hi in ranges
+    )
+    return re.compile("[^" + "".join(parts) + "]")
+
+
+def _to_array(typecode: str, coded: str) -> array:
+    indices = array(typecode)
+    indices.frombytes(coded.encode(_CODECS[typecode], _ERRORS))
+    if typecode != "B" and sys.byteorder != "little":
+        indices.byteswap()
+    return indices
+
+
+def _from_array(indices: array) -> str:
+    if indices.typecode != "B" and sys.byteorder != "little":
+        indices = array(indices.typecode, indices)
+        indices.byteswap()
+    return indices.tobytes().decode(_CODECS[indices.typecode], _ERRORS)
+
+
+@dataclass(frozen=True, eq=False)
+class EncodedText:
+    """
+    Text as alphabet indices plus the characters outside the alphabet.
+
+    Attributes:
+        alphabet (Tuple[str, ...]): Duplicate-free, single-character symbols.
+        indices (array): Index per character; `len(alphabet)` marks passthrough.
+        passthrough (str): Out-of-alphabet characters, in text order.
+    """
+    alphabet: Tuple[str, ...]
+    indices: array
+    passthrough: str = ""
+
+    @classmethod
+    def encode(cls, text: Sequence[str], alphabet: Sequence[str]) -> 'EncodedText':
+        """Encode a string (or a sequence of characters) over `alphabet`."""
+        alphabet = tuple(alphabet)
+        text = text if isinstance(text, str) else "".join(text)
+        placeholder, outside, encode_table, _ = _codec(alphabet)
+        passthrough = "".join(outside.findall(text))
+        if passthrough:
+            text = outside.sub(placeholder, text)
+        coded = text.translate(encode_table)
+        return cls(alphabet, _to_array(index_typecode(len(alphabet)), coded), passthrough)
+
+    def decode(self) -> str:
+        """The original (or transformed) text as a string."""
+        placeholder, _, _, decode_table = _codec(self.alphabet)
+        text = _from_array(self.indices).translate(decode_table)
+        if not self.passthrough:
+            return text
+        parts = text.split(placeholder)
+        return "".join(chain.from_iterable(zip(parts, self.passthrough))) + parts[-1]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __str__(self) -> str:
+        return self.decode()
+
+    def permute(self, permutations: Sequence[Sequence[int]], offset: int = 0) -> 'EncodedText':
+        """
+        Apply a periodic substitution: position i maps index j to
+        `permutations[(i + offset) % period][j]`. Passthrough positions are
+        kept and still advance the period, as in the string ciphers.
+        """
+        n = len(self.alphabet)
+        period = len(permutations)
+        if not period:
+            raise ValueError("Permutation schedule must not be empty.")
+        if any(len(perm) != n for perm in permutations):
+            raise ValueError("Every permutation must cover the whole alphabet.")
+        source = self.indices
+        length = len(source)
+        tc = source.typecode
+
+        if tc == "B":
+            tables = [bytes(perm) + bytes(range(n, 256)) for perm in permutations]
+            data = source.tobytes()
+            if period == 1:
+                out = bytearray(data.translate(tables[0]))
+            else:
+                out = bytearray(length)
+                for j in range(min(period, length)):
+                    out[j::period] = data[j::period].translate(tables[(offset + j) % period])
+            return EncodedText(self.alphabet, array("B", out), self.passthrough)
+
+        if vectorized.HAVE_NUMPY:
+            np = vectorized.numpy()
+            lookup = np.empty((period, n + 1), dtype=np.uint32)
+            lookup[:, :n] = np.asarray(permutations, dtype=np.uint32)
+            lookup[:, n] = n
+            idx = np.frombuffer(source, dtype=np.uint16 if tc == "H" else np.uint32)
+            if period == 1:
+                mapped = lookup[0][idx]
+            else:
+                rows = (np.arange(length, dtype=np.int64) + offset) % period
+                mapped = lookup[rows, idx]
+            return EncodedText(self.alphabet, array(tc, mapped.astype(idx.dtype).tobytes()), self.passthrough)
+
+        tables = [list(perm) + [n] for perm in permutations]
+        out = array(tc, bytes(length * source.itemsize))
+        for j in range(min(period, length)):
+            out[j::period] = array(tc, map(tables[(offset + j) % period].__getitem__, source[j::period]))
+        return EncodedText(self.alphabet, out, self.passthrough)
+
+    def shift(self, shifts: Sequence[int], offset: int = 0) -> 'EncodedText':
+        """Periodic shift: position i maps index j to (j + shifts[(i + offset) % period]) % n."""
+        n = len(self.alphabet)
+        return self.permute([[(j + s) % n for j in range(n)] for s in shifts], offset)
+
+
+def translation_permutation(table: Dict[int, str], alphabet: Sequence[str]) -> Optional[List[int]]:
+    """
+    Express a `str.maketrans` table as an index permutation of `alphabet`, or
+    None if it maps an alphabet symbol outside the alphabet.
+    """
+    position = {symbol: i for i, symbol in enumerate(alphabet)}
+    perm = []
+    for symbol in alphabet:
+        target = table.get(ord(symbol), symbol)
+        if isinstance(target, int):
+            target = chr(target)
+        if target not in position:
+            return None
+        perm.append(position[target])
+    return perm
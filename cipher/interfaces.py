@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from cipher.encoded import EncodedText
 
 class CipherTable(ABC):
     """
@@ -39,3 +42,71 @@ class CipherTable(ABC):
         Default key character used when no specific key is provided.
         """
         pass
+
+    def contains(self, symbol: str) -> bool:
+        """
+        Whether `symbol` is in the base alphabet.
+
+        The default scans `base_alphabet` (constant time for a `RangeAlphabet`);
+        tables with a symbol index override it with a lookup.
+        """
+        return symbol in self.base_alphabet
+
+    def shift_of(self, key_char: str) -> Optional[int]:
+        """
+        Return the shift applied by the row for `key_char`, if the table is modular.
+
+        A modular table maps alphabet[j] -> alphabet[(j + shift) % n] for every row,
+        which lets fast paths work on symbol indices instead of per-row maps.
+
+        Returns:
+            Optional[int]: The forward shift, or None if the row is not a pure shift.
+        """
+        return None
+
+    def get_translation(self, key_char: str, decrypt: bool = False) -> Dict[int, str]:
+        """
+        Return the row for `key_char` compiled with `str.maketrans`, for use with `str.translate`.
+
+        Implementations are encouraged to cache the result; this default rebuilds it.
+        """
+        return str.maketrans(self.get_map(key_char, decrypt=decrypt))
+
+
+class CompiledTransform(ABC):
+    """
+    Interface for stateless, precompiled cipher transforms.
+
+    A compiled transform holds everything needed to transform text (tables, key
+    schedule, mode) and no text. The position in the key stream is passed in and
+    returned explicitly, so one instance can be shared across chunks, threads
+    and processes.
+    """
+
+    @abstractmethod
+    def transform(self, chunk: str, offset: int = 0) -> Tuple[str, int]:
+        """
+        Transform one chunk of text.
+
+        Args:
+            chunk (str): Text to transform.
+            offset (int): Key stream position of the first character.
+
+        Returns:
+            Tuple[str, int]: The transformed chunk and the offset for the next chunk.
+        """
+        pass
+
+    def transform_encoded(self, encoded: "EncodedText", offset: int = 0) -> Tuple["EncodedText", int]:
+        """
+        Transform an `EncodedText` over the same alphabet. This default decodes,
+        transforms and re-encodes; index-based transforms override it.
+        """
+        from cipher.encoded import EncodedText
+
+        text, end = self.transform(encoded.decode(), offset)
+        return EncodedText.encode(text, encoded.alphabet), end
+
+    def __call__(self, text: str) -> str:
+        """Transform a complete text starting at position 0."""
+        return self.transform(text)[0]
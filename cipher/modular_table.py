@@ -0,0 +1,118 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from cipher.interfaces import CipherTable
+from utils.range_alphabet import RangeAlphabet
+from utils.validators import ensure_not_empty
+
+DEFAULT_MAX_ROWS = 64
+SHARED_TABLES = 32
+
+
+@dataclass
+class ModularTable(CipherTable):
+    """
+    Tabula recta that stores only a symbol -> index map.
+
+    Rows are computed with modular arithmetic on demand and kept in a bounded
+    LRU cache, so construction is O(n) instead of the O(n²) dict entries that
+    `CharmapTable.from_alphabet` builds eagerly. Rows are identical to the ones
+    `CharmapTable.from_alphabet` would produce for the same alphabet.
+
+    Attributes:
+        index (Dict[str, int]): Symbol -> position in the base alphabet (for a
+            `RangeAlphabet` base, the alphabet itself).
+        max_rows (int): Number of materialized rows kept per direction.
+    """
+    _base_alphabet: List[str]
+    _default_keyword: str
+    index: Dict[str, int]
+    source: str
+    max_rows: int = DEFAULT_MAX_ROWS
+    _rows: Callable[[int, bool], Dict[str, str]] = field(init=False, repr=False, compare=False)
+    _translations: Callable[[int, bool], Dict[int, str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._rows = lru_cache(maxsize=self.max_rows)(self._build_row)
+        self._translations = lru_cache(maxsize=self.max_rows)(
+            lambda shift, decrypt: str.maketrans(self._rows(shift, decrypt))
+        )
+
+    @property
+    def base_alphabet(self) -> List[str]:
+        return self._base_alphabet
+
+    @property
+    def default_keyword(self) -> str:
+        return self._default_keyword
+
+    @classmethod
+    def from_alphabet(cls, alphabet: List[str], source: str, max_rows: int = DEFAULT_MAX_ROWS) -> 'ModularTable':
+        """
+        Construct a ModularTable from a given alphabet (list of chars).
+        Only the symbol -> index map is built up front; a `RangeAlphabet` is
+        kept as is and answers index lookups itself, so nothing is built.
+        """
+        if not isinstance(alphabet, RangeAlphabet):
+            alphabet = list(alphabet)
+        ensure_not_empty(alphabet, "Alphabet must not be empty.")
+        return cls(
+            _base_alphabet=alphabet,
+            _default_keyword=alphabet[0],
+            index=alphabet if isinstance(alphabet, RangeAlphabet) else {char: i for i, char in enumerate(alphabet)},
+            source=source,
+            max_rows=max_rows,
+        )
+
+    @classmethod
+    def shared(cls, alphabet: Sequence[str], source: str) -> 'ModularTable':
+        """
+        Return a process-wide table for `alphabet`, built on first use and then
+        reused (including its cached rows) by every caller with the same alphabet.
+        """
+        return _shared_table(alphabet if isinstance(alphabet, RangeAlphabet) else tuple(alphabet), source)
+
+    def _build_row(self, shift: int, decrypt: bool) -> Dict[str, str]:
+        symbols = list(self._base_alphabet)
+        rotated = symbols[shift:] + symbols[:shift]
+        if decrypt:
+            return dict(zip(rotated, symbols))
+        return dict(zip(symbols, rotated))
+
+    def contains(self, symbol: str) -> bool:
+        return self.index.get(symbol) is not None
+
+    def index_of(self, char: str) -> Optional[int]:
+        """Return the position of `char` in the base alphabet, or None."""
+        return self.index.get(char)
+
+    def shift_of(self, key_char: str) -> Optional[int]:
+        """Rows are pure shifts as long as the alphabet has no duplicate symbols."""
+        if len(self.index) != len(self._base_alphabet):
+            return None
+        return self.index.get(key_char)
+
+    def get_map(self, key_char: str, decrypt: bool = False) -> Dict[str, str]:
+        """
+        Get substitution map for a specific key character, depending on mode.
+        Rows are materialized lazily; unknown key characters yield an empty map.
+        """
+        shift = self.index.get(key_char)
+        if shift is None:
+            return {}
+        return self._rows(shift, decrypt)
+
+    def get_translation(self, key_char: str, decrypt: bool = False) -> Dict[int, str]:
+        """
+        Get the `str.maketrans` table for a key character (LRU-cached like rows).
+        """
+        shift = self.index.get(key_char)
+        if shift is None:
+            return {}
+        return self._translations(shift, decrypt)
+
+
+@lru_cache(maxsize=SHARED_TABLES)
+def _shared_table(alphabet: Union[Tuple[str, ...], RangeAlphabet], source: str) -> ModularTable:
+    return ModularTable.from_alphabet(alphabet, source=source)
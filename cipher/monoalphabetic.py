@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import List
 
 from cipher.base import CipherBit
+from cipher.cache import compile_cached
+from cipher.compiled import CompiledCipher
+from cipher.encoded import EncodedText
 from cipher.interfaces import CipherTable
 from utils.validators import ensure_not_empty
 
@@ -10,20 +13,42 @@ class MonoalphabeticCipher(CipherBit):
     """
     A simple monoalphabetic substitution cipher.
     Uses a single substitution map derived from a CipherTable.
+
+    `translate()` is a string-in/string-out fast path built on `str.translate`
+    and the table's cached `str.maketrans` table; `fast=True` routes
+    `encrypt()`/`decrypt()` through it when the alphabet allows (single-character
+    symbols), and falls back to the symbol map otherwise.
     """
     key_char: str
     table: CipherTable
 
     def __post_init__(self):
         super().__post_init__()
-        if self.key_char not in self.table.base_alphabet:
+        if not self.table.contains(self.key_char):
             raise ValueError(f"Key character '{self.key_char}' not in table's alphabet.")
         ensure_not_empty(self.table.base_alphabet, "Cipher table alphabet must not be empty.")
 
+    def translate(self, decrypt: bool = False) -> str:
+        """
+        Transform the text with `str.translate`, without per-character Python objects.
+        """
+        return self.as_string().translate(self.table.get_translation(self.key_char, decrypt=decrypt))
+
     def _transform(self, decrypt: bool) -> List[str]:
+        if isinstance(self.text, EncodedText):
+            return self._transform_encoded(decrypt)
+        if self.fast:
+            try:
+                return list(self.translate(decrypt))
+            except ValueError:  # multi-character symbols have no str.maketrans table
+                pass
         cmap = self.table.get_map(self.key_char, decrypt=decrypt)
         return [cmap.get(c, c) for c in self.text]
 
+    def compile(self, mode: str = "encrypt") -> CompiledCipher:
+        """Compile the key character's row for `mode` (period 1)."""
+        return compile_cached(self.table, [self.key_char], mode)
+
     def encrypt(self) -> List[str]:
         return self._transform(decrypt=False)
 
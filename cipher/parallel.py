@@ -0,0 +1,168 @@
+"""
+Multiprocess execution of compiled transforms.
+
+Substitution output at position i depends only on the character and on
+i mod period, so text can be split into independent shards. The input is
+encoded once as UTF-32 into a shared memory buffer; each worker decodes its
+shard, transforms it with the shard's key offset and writes the result into
+a shared output buffer at the same position. Shard boundaries are multiples
+of the key period, and the output is reassembled in order by construction.
+
+A `ShardPool` keeps the worker processes and shared buffers between calls, so
+a stream of chunks (`--input --jobs N`) starts one pool per command instead
+of one per chunk.
+"""
+
+import os
+from typing import Any, List, Optional, Tuple
+
+from cipher.interfaces import CompiledTransform
+
+CODEC = "utf-32-le"
+ERRORS = "surrogatepass"
+CHAR_BYTES = 4
+MIN_PARALLEL_CHARS = 1 << 16  # below this a pool costs more than it saves
+
+_worker_state: dict = {}  # per worker process: attached shared buffers
+
+
+def default_jobs() -> int:
+    """Number of usable cores."""
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+
+
+def _attach(in_name: str, out_name: str) -> Tuple[Any, Any]:
+    """The shared buffers `in_name`/`out_name`, attached once per worker (replacing older ones)."""
+    from multiprocessing import shared_memory
+    if _worker_state.get("names") != (in_name, out_name):
+        for shm in _worker_state.get("buffers", ()):
+            shm.close()
+        # Pool workers share the parent's resource tracker; only the parent unlinks.
+        _worker_state["buffers"] = (
+            shared_memory.SharedMemory(name=in_name), shared_memory.SharedMemory(name=out_name)
+        )
+        _worker_state["names"] = (in_name, out_name)
+    return _worker_state["buffers"]
+
+
+def _run_shard(
+    compiled: CompiledTransform, in_name: str, out_name: str, start: int, end: int, offset: int
+) -> int:
+    src, dst = _attach(in_name, out_name)
+    lo, hi = start * CHAR_BYTES, end * CHAR_BYTES
+    chunk = bytes(src.buf[lo:hi]).decode(CODEC, ERRORS)
+    out, _ = compiled.transform(chunk, offset + start)
+    encoded = out.encode(CODEC, ERRORS)
+    if len(encoded) != hi - lo:
+        raise ValueError("Parallel transform requires length-preserving stages.")
+    dst.buf[lo:hi] = encoded
+    return end - start
+
+
+def shard_bounds(length: int, jobs: int, period: int = 1) -> List[Tuple[int, int]]:
+    """
+    Split `length` positions into at most `jobs` contiguous shards whose
+    boundaries are multiples of `period`.
+    """
+    if length <= 0:
+        return []
+    period = max(period, 1)
+    size = -(-length // jobs)               # ceil(length / jobs)
+    size = -(-size // period) * period      # round up to the key period
+    return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+class ShardPool:
+    """
+    Worker processes and shared buffers for `parallel_transform`, reused across
+    calls. The process pool is started on the first input large enough to shard;
+    buffers grow to the largest input seen. Use as a context manager.
+
+    Args:
+        jobs (Optional[int]): Worker processes; defaults to all cores.
+    """
+
+    def __init__(self, jobs: Optional[int] = None):
+        if jobs is not None and jobs < 0:
+            raise ValueError("Jobs must not be negative.")
+        self.jobs = jobs or default_jobs()
+        self._executor = None
+        self._buffers: Optional[Tuple[Any, Any]] = None
+
+    def __enter__(self) -> 'ShardPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _reserve(self, size: int) -> Tuple[Any, Any]:
+        from multiprocessing import shared_memory
+        if self._buffers is None or self._buffers[0].size < size:
+            self._release()
+            self._buffers = (
+                shared_memory.SharedMemory(create=True, size=size),
+                shared_memory.SharedMemory(create=True, size=size),
+            )
+        return self._buffers
+
+    def _release(self) -> None:
+        for shm in self._buffers or ():
+            shm.close()
+            shm.unlink()
+        self._buffers = None
+
+    def transform(self, compiled: CompiledTransform, text: str, offset: int = 0) -> str:
+        """Same result as `compiled.transform(text, offset)[0]`, sharded over the pool."""
+        if self.jobs <= 1 or len(text) < MIN_PARALLEL_CHARS:
+            return compiled.transform(text, offset)[0]
+        if self._executor is None:
+            # Imported here: process pools are costly to import and rarely needed.
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.jobs)
+
+        encoded = text.encode(CODEC, ERRORS)
+        src, dst = self._reserve(len(encoded))
+        src.buf[:len(encoded)] = encoded
+        del encoded
+        bounds = shard_bounds(len(text), self.jobs, getattr(compiled, "period", 1))
+        futures = [
+            self._executor.submit(_run_shard, compiled, src.name, dst.name, start, end, offset)
+            for start, end in bounds
+        ]
+        for future in futures:
+            future.result()
+        return bytes(dst.buf[:len(text) * CHAR_BYTES]).decode(CODEC, ERRORS)
+
+    def close(self) -> None:
+        """Stop the workers and free the shared buffers."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release()
+
+
+def parallel_transform(
+    compiled: CompiledTransform,
+    text: str,
+    jobs: Optional[int] = None,
+    offset: int = 0,
+    pool: Optional[ShardPool] = None
+) -> str:
+    """
+    Transform `text` with `compiled` across a process pool.
+
+    Args:
+        compiled (CompiledTransform): Stateless transform (must be picklable).
+        text (str): Input text.
+        jobs (Optional[int]): Worker processes; defaults to all cores.
+        offset (int): Key stream position of the first character.
+        pool (Optional[ShardPool]): Pool to reuse (its size overrides `jobs`);
+            without one, a pool is started and stopped for this call.
+
+    Returns:
+        str: Same result as `compiled.transform(text, offset)[0]`.
+    """
+    if pool is not None:
+        return pool.transform(compiled, text, offset)
+    with ShardPool(jobs) as pool:
+        return pool.transform(compiled, text, offset)
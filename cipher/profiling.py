@@ -0,0 +1,186 @@
+"""
+Opt-in instrumentation for cipher pipelines.
+
+A `Profiler` records one `StageProfile` per instrumented stage: wall time,
+characters processed and, optionally, tracemalloc allocations. It can also
+capture a cProfile of everything that runs while it is active.
+
+Instrumented call sites (`CipherTransformer.run`, `CipherBit.__call__` and
+`CipherBit.transform`) look up the active profiler once per call and take
+their normal path when there is none, so disabled profiling costs one
+context-variable lookup per call, never per character.
+
+    with Profiler(callback=print, trace_memory=True) as profiler:
+        CipherTransformer([vigenere, mono])("encrypt")
+    print(profiler.report())
+"""
+
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+PROFILE_MODES = ("time", "memory", "cprofile", "all")
+
+_ACTIVE: ContextVar[Optional["Profiler"]] = ContextVar("cipher_profiler", default=None)
+
+
+def current() -> Optional["Profiler"]:
+    """The profiler active in this context, or None."""
+    return _ACTIVE.get()
+
+
+@dataclass
+class StageProfile:
+    """
+    Measurements of one stage execution.
+
+    Attributes:
+        name (str): Stage label (e.g. "stage 0: Vigenere").
+        mode (str): Operation ('encrypt', 'decrypt', ...).
+        seconds (float): Wall time.
+        chars (int): Characters processed.
+        calls (int): Executions merged into this record (see `Profiler.summary`).
+        alloc_peak (Optional[int]): Peak bytes allocated above the stage's starting
+            point, when memory tracing is on.
+        alloc_net (Optional[int]): Bytes still allocated when the stage ended.
+    """
+    name: str
+    mode: str
+    seconds: float = 0.0
+    chars: int = 0
+    calls: int = 1
+    alloc_peak: Optional[int] = None
+    alloc_net: Optional[int] = None
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / self.seconds if self.seconds else 0.0
+
+
+class Profiler:
+    """
+    Collects stage measurements while active (use as a context manager).
+
+    Args:
+        callback (Optional[Callable[[StageProfile], None]]): Called with every
+            finished stage.
+        trace_memory (bool): Record allocations per stage with tracemalloc.
+        cprofile (bool): Capture a cProfile of the active period.
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[StageProfile], None]] = None,
+        trace_memory: bool = False,
+        cprofile: bool = False
+    ):
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.stages: List[StageProfile] = []
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._started_tracing = False
+        self._open: List[List[int]] = []  # [start bytes, peak bytes] per open stage
+        self._token = None
+
+    @classmethod
+    def for_mode(cls, mode: str, callback: Optional[Callable[[StageProfile], None]] = None) -> 'Profiler':
+        """Profiler for a CLI `--profile` mode: time, memory, cprofile or all."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}'; choose from {', '.join(PROFILE_MODES)}.")
+        return cls(callback, trace_memory=mode in ("memory", "all"), cprofile=mode in ("cprofile", "all"))
+
+    def __enter__(self) -> 'Profiler':
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._token = _ACTIVE.set(self)
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        _ACTIVE.reset(self._token)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _sync_peak(self) -> None:
+        """Fold the traced peak into every open stage before it is reset."""
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self._open:
+            frame[1] = max(frame[1], peak)
+
+    @contextmanager
+    def stage(self, name: str, mode: str = "encrypt", chars: int = 0) -> Iterator[StageProfile]:
+        """
+        Measure the enclosed block as one stage. The yielded record can be
+        updated inside the block (e.g. `record.chars` once it is known).
+        """
+        record = StageProfile(name=name, mode=mode, chars=chars)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            self._sync_peak()
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            self._open.append([start_bytes, start_bytes])
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            if tracing:
+                self._sync_peak()
+                start_bytes, peak = self._open.pop()
+                record.alloc_peak = peak - start_bytes
+                record.alloc_net = tracemalloc.get_traced_memory()[0] - start_bytes
+            self.stages.append(record)
+            if self.callback is not None:
+                self.callback(record)
+
+    def summary(self) -> List[StageProfile]:
+        """Stages merged by (name, mode), in first-seen order."""
+        merged: Dict[Tuple[str, str], StageProfile] = {}
+        for record in self.stages:
+            key = (record.name, record.mode)
+            if key not in merged:
+                merged[key] = StageProfile(name=record.name, mode=record.mode, calls=0)
+            total = merged[key]
+            total.seconds += record.seconds
+            total.chars += record.chars
+            total.calls += 1
+            if record.alloc_peak is not None:
+                total.alloc_peak = max(total.alloc_peak or 0, record.alloc_peak)
+                total.alloc_net = (total.alloc_net or 0) + record.alloc_net
+        return list(merged.values())
+
+    def cprofile_stats(self, limit: int = 20, sort: str = "cumulative") -> str:
+        """Top `limit` functions of the cProfile capture ('' if not enabled)."""
+        if self._cprofile is None:
+            return ""
+        out = io.StringIO()
+        pstats.Stats(self._cprofile, stream=out).sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def report(self, limit: int = 20) -> str:
+        """Human-readable table of `summary()`, plus the cProfile capture if any."""
+        lines = ["stage\tmode\tcalls\tms\tchars\tchars/s\tpeak_kib\tnet_kib"]
+        for record in self.summary():
+            memory = ["-", "-"] if record.alloc_peak is None else [
+                f"{record.alloc_peak / 1024:.1f}", f"{record.alloc_net / 1024:.1f}"
+            ]
+            lines.append("\t".join([
+                record.name, record.mode, str(record.calls), f"{record.seconds * 1e3:.3f}",
+                str(record.chars), f"{record.chars_per_second:,.0f}", *memory,
+            ]))
+        stats = self.cprofile_stats(limit)
+        if stats:
+            lines += ["", stats.rstrip()]
+        return "\n".join(lines)
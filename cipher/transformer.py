@@ -1,19 +1,53 @@
-from typing import Sequence, List
+from typing import Dict, Optional, Sequence, List, Tuple, Union
+from cipher import profiling
 from cipher.base import CipherBit
+from cipher.encoded import EncodedText
+from cipher.compiled import CompiledPipeline, is_decrypt
+from cipher.parallel import ShardPool, parallel_transform
 
 class CipherTransformer:
     """
     Executes one or more CipherBit objects in sequence, transforming the text through a pipeline.
 
     This mimics Unix-style piping: each CipherBit takes the output of the previous as input.
+
+    When every stage can be compiled, `run()` executes the compiled pipeline, in which
+    consecutive shift stages over a shared alphabet (rot, caesar, mono, Vigenère) are
+    fused into one periodic shift schedule and applied in a single pass. `explain()`
+    reports the resulting plan.
+
+    With `parallel=N` (N > 1), large inputs are sharded across N worker processes
+    (those of `pool`, if given, so that repeated runs reuse one process pool).
+
+    With a `profiler` (or inside an active `cipher.profiling.Profiler`), `run()`
+    records the whole run and every executed stage (fused groups count as one).
+
+    If the first stage's text is an `EncodedText`, every stage runs on the alphabet
+    indices and `run()` returns an `EncodedText`. With `encode=True`, string input is
+    encoded once at entry and decoded once at exit, which pays off for pipelines of
+    several table-lookup stages over non-ASCII or large alphabets.
     """
 
-    def __init__(self, ciphers: Sequence[CipherBit]):
+    def __init__(
+        self,
+        ciphers: Sequence[CipherBit],
+        parallel: int = 1,
+        profiler: Optional[profiling.Profiler] = None,
+        encode: bool = False,
+        pool: Optional[ShardPool] = None
+    ):
         if not ciphers:
             raise ValueError("Pipeline must contain at least one CipherBit.")
+        if parallel < 1:
+            raise ValueError("Parallelism must be at least 1.")
         self.pipeline: List[CipherBit] = list(ciphers)
+        self.parallel = parallel
+        self.profiler = profiler
+        self.encode = encode
+        self.pool = pool
+        self._compiled: Dict[str, CompiledPipeline] = {}
 
-    def run(self, mode: str = "encrypt") -> List[str]:
+    def run(self, mode: str = "encrypt") -> Union[List[str], EncodedText]:
         """
         Run the transformation pipeline in the given mode.
 
@@ -21,20 +55,132 @@ class CipherTransformer:
             mode (str): Either 'encrypt' or 'decrypt'.
 
         Returns:
-            List[str]: The final transformed text.
+            List[str] | EncodedText: The final transformed text (encoded if the
+            input was).
         """
-        if mode not in {"encrypt", "decrypt"}:
-            raise ValueError("Mode must be 'encrypt' or 'decrypt'.")
+        is_decrypt(mode)
+        profiler = self.profiler or profiling.current()
+        if profiler is not None:
+            with profiler.stage(type(self).__name__, mode, len(self.pipeline[0].text)):
+                return self._run(mode, profiler)
+        return self._run(mode)
+
+    def _run(self, mode: str, profiler: Optional[profiling.Profiler] = None) -> Union[List[str], EncodedText]:
+        source = self.pipeline[0].text
+        try:
+            compiled = self.compile(mode)
+        except NotImplementedError:
+            if isinstance(source, EncodedText):
+                return EncodedText.encode(self._run_staged(mode, profiler, source.decode()), source.alphabet)
+            return self._run_staged(mode, profiler)
+        if isinstance(source, EncodedText):
+            return self._run_encoded(compiled, source, mode, profiler)
+        text = self.pipeline[0].as_string()
+        alphabet = getattr(compiled.stages[0], "alphabet", None)
+        if self.encode and alphabet is not None:
+            encoded = EncodedText.encode(text, alphabet)
+            return list(self._run_encoded(compiled, encoded, mode, profiler).decode())
+        if self.parallel > 1:
+            return list(parallel_transform(compiled, text, self.parallel, pool=self.pool))
+        if profiler is None:
+            return list(compiled(text))
+        for group, stage in zip(compiled.groups, compiled.stages):
+            with profiler.stage(self._stage_label(group), mode, len(text)):
+                text, _ = stage.transform(text, 0)
+        return list(text)
 
-        text = self.pipeline[0].text
-        for cipher in self.pipeline:
+    def _run_encoded(
+        self,
+        compiled: CompiledPipeline,
+        encoded: EncodedText,
+        mode: str,
+        profiler: Optional[profiling.Profiler] = None
+    ) -> EncodedText:
+        """Run every executed stage on the indices (`parallel` does not apply)."""
+        if profiler is None:
+            return compiled.transform_encoded(encoded)[0]
+        for group, stage in zip(compiled.groups, compiled.stages):
+            with profiler.stage(self._stage_label(group), mode, len(encoded)):
+                encoded, _ = stage.transform_encoded(encoded, 0)
+        return encoded
+
+    def _run_staged(
+        self,
+        mode: str,
+        profiler: Optional[profiling.Profiler] = None,
+        text: Optional[Sequence[str]] = None
+    ) -> List[str]:
+        """Run each CipherBit on the previous stage's full output."""
+        text = self.pipeline[0].text if text is None else text
+        for i, cipher in enumerate(self.pipeline):
             cipher.text = text  # rebind input for next cipher
-            text = cipher.encrypt() if mode == "encrypt" else cipher.decrypt()
+            if profiler is None:
+                text = cipher.encrypt() if mode == "encrypt" else cipher.decrypt()
+                continue
+            with profiler.stage(f"{self._stage_label((i,))} (staged)", mode, len(text)):
+                text = cipher.encrypt() if mode == "encrypt" else cipher.decrypt()
 
         return text
 
+    def _stage_label(self, group: Tuple[int, ...]) -> str:
+        names = "+".join(type(self.pipeline[i]).__name__ for i in group)
+        if len(group) > 1:
+            return f"stages {group[0]}-{group[-1]}: {names} (fused)"
+        return f"stage {group[0]}: {names}"
+
+    def compile(self, mode: str = "encrypt") -> CompiledPipeline:
+        """
+        Compile every stage for `mode` into a stateless pipeline, fusing compatible
+        consecutive shift stages. Stages keep the same order as the pipeline.
+
+        Raises:
+            NotImplementedError: If a stage has no compiled form.
+        """
+        is_decrypt(mode)
+        if mode not in self._compiled:
+            self._compiled[mode] = CompiledPipeline.fuse(
+                [cipher.compile(mode) for cipher in self.pipeline]
+            )
+        return self._compiled[mode]
+
+    def explain(self, mode: str = "encrypt") -> str:
+        """
+        Describe how the pipeline executes: which stages were fused into a
+        single shift schedule and which run on their own.
+        """
+        try:
+            compiled = self.compile(mode)
+        except NotImplementedError:
+            return "\n".join(
+                f"stage {i}: {type(cipher).__name__} (staged, no compiled form)"
+                for i, cipher in enumerate(self.pipeline)
+            )
+
+        lines = []
+        for group, stage in zip(compiled.groups, compiled.stages):
+            names = ", ".join(type(self.pipeline[i]).__name__ for i in group)
+            if len(group) > 1:
+                lines.append(
+                    f"stages {group[0]}-{group[-1]}: fused ({names}) into one shift schedule, "
+                    f"period {stage.period}"
+                )
+            else:
+                kind = "shift schedule" if getattr(stage, "shifts", None) is not None else "table lookup"
+                lines.append(f"stage {group[0]}: {names} ({kind}, period {stage.period})")
+        return "\n".join(lines)
+
+    def transform(self, chunk: str, offset: int = 0, mode: str = "encrypt") -> Tuple[str, int]:
+        """
+        Transform one chunk through the compiled pipeline.
+
+        Returns:
+            Tuple[str, int]: The transformed chunk and the offset for the next chunk.
+        """
+        return self.compile(mode).transform(chunk, offset)
+
     def __call__(self, mode: str = "encrypt") -> str:
         """
         Callable interface, returns joined string for user display.
         """
-        return "".join(self.run(mode))
+        result = self.run(mode)
+        return result.decode() if isinstance(result, EncodedText) else "".join(result)
@@ -0,0 +1,124 @@
+"""
+Optional NumPy engine for modular (shift-based) substitution.
+
+Text is encoded once to an integer index array over the alphabet, the periodic
+shift schedule is tiled across it and `(p + k) % n` is evaluated in one shot.
+Characters outside the alphabet are passed through unchanged via a mask.
+
+NumPy is not a hard dependency: check `HAVE_NUMPY` before calling into this
+module, and fall back to the pure-Python path when it is False. NumPy is only
+imported on first use, so importing `cipher` stays cheap.
+"""
+
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+HAVE_NUMPY = find_spec("numpy") is not None
+
+
+def numpy():
+    """Import and return NumPy (raises ImportError if it is not installed)."""
+    import numpy
+    return numpy
+
+
+_CODEC = "utf-32-le"
+_ERRORS = "surrogatepass"
+
+
+def to_codepoints(text: str) -> "np.ndarray":
+    """Return the code points of `text` as a uint32 array (zero-copy view of the encoded buffer)."""
+    np = numpy()
+    return np.frombuffer(text.encode(_CODEC, _ERRORS), dtype=np.uint32)
+
+
+def from_codepoints(codepoints: "np.ndarray") -> str:
+    """Inverse of `to_codepoints`."""
+    np = numpy()
+    return np.ascontiguousarray(codepoints, dtype=np.uint32).tobytes().decode(_CODEC, _ERRORS)
+
+
+def alphabet_codepoints(alphabet: Sequence[str]) -> Optional["np.ndarray"]:
+    """
+    Return the code points of a single-character alphabet, or None if any
+    symbol is not exactly one character (such alphabets are not vectorizable).
+    """
+    if any(len(char) != 1 for char in alphabet):
+        return None
+    np = numpy()
+    return np.fromiter((ord(char) for char in alphabet), dtype=np.uint32, count=len(alphabet))
+
+
+def encode_indices(codepoints: "np.ndarray", alpha_cps: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Map code points to alphabet indices.
+
+    Returns:
+        (indices, mask): `indices` is an int64 array of alphabet positions,
+        `mask` is True where the character belongs to the alphabet.
+        Positions outside the mask hold an arbitrary index.
+    """
+    np = numpy()
+    order = np.argsort(alpha_cps, kind="stable")
+    sorted_cps = alpha_cps[order]
+    pos = np.searchsorted(sorted_cps, codepoints)
+    np.minimum(pos, len(sorted_cps) - 1, out=pos)
+    mask = sorted_cps[pos] == codepoints
+    return order[pos].astype(np.int64), mask
+
+
+def shift_schedule(shifts: Sequence[int], length: int, offset: int = 0) -> "np.ndarray":
+    """Tile a periodic shift schedule over `length` positions starting at `offset`."""
+    np = numpy()
+    schedule = np.asarray(shifts, dtype=np.int64)
+    return np.resize(np.roll(schedule, -(offset % len(schedule))), length)
+
+
+def shift_text(text: str, alphabet: Sequence[str], shifts: Sequence[int], offset: int = 0) -> str:
+    """
+    Apply a periodic shift schedule to `text` over a duplicate-free alphabet.
+
+    Position i (counting from `offset`, including passthrough characters) is
+    shifted by `shifts[i % len(shifts)]`, matching the pure-Python Vigenère loop.
+
+    Args:
+        text (str): Input text.
+        alphabet (Sequence[str]): Single-character symbols, no duplicates.
+        shifts (Sequence[int]): Signed shift per keyword position.
+        offset (int): Keyword position of the first character.
+
+    Returns:
+        str: Transformed text.
+    """
+    if not text:
+        return text
+    alpha_cps = alphabet_codepoints(alphabet)
+    if alpha_cps is None:
+        raise ValueError("Vectorized shift requires a single-character alphabet.")
+
+    np = numpy()
+    cps = to_codepoints(text)
+    indices, mask = encode_indices(cps, alpha_cps)
+    indices += shift_schedule(shifts, len(cps), offset)
+    indices %= len(alpha_cps)
+    return from_codepoints(np.where(mask, alpha_cps[indices], cps))
+
+
+def symbol_indices(codepoints: "np.ndarray", alpha_cps: "np.ndarray") -> "np.ndarray":
+    """
+    Map code points to alphabet indices through a dense lookup table
+    (one entry per code point up to the alphabet's largest), which is
+    cheaper than a sorted search for large inputs.
+
+    Returns:
+        np.ndarray: int64 alphabet positions, -1 where the character is not
+        in the alphabet.
+    """
+    np = numpy()
+    size = int(alpha_cps.max()) + 2
+    lookup = np.full(size, -1, dtype=np.int64)
+    lookup[alpha_cps] = np.arange(len(alpha_cps), dtype=np.int64)
+    return lookup[np.minimum(codepoints, size - 1)]
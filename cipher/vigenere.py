@@ -1,11 +1,28 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, List, Optional
 
 from cipher.base import CipherBit
+from cipher.cache import compile_cached
+from cipher.compiled import CompiledCipher
+from cipher.encoded import EncodedText
 from cipher.interfaces import CipherTable
-from utils.tools import remove_duplicates, filter_allowed_chars
+from cipher import vectorized
+from utils.tools import remove_duplicates
 from utils.validators import ensure_not_empty
 
+def normalize_keyword(keyword: Iterable[str], table: CipherTable) -> List[str]:
+    """
+    Keep only keyword characters found in the table's alphabet, upper-cased and
+    de-duplicated. Characters are compared upper-cased, as `filter_allowed_chars`
+    does, but looked up with `table.contains` instead of a set of the alphabet.
+    """
+    kept = []
+    for c in keyword:
+        upper = c.upper()
+        if any(s.upper() == upper and table.contains(s) for s in (upper, c, upper.lower())):
+            kept.append(upper)
+    return remove_duplicates(kept)
+
 @dataclass(kw_only=True)
 class Vigenere(CipherBit):
     """
@@ -13,29 +30,66 @@ class Vigenere(CipherBit):
 
     This class does not construct its own tabula recta; instead, it delegates
     all key-based mapping logic to the provided CipherTable object.
+
+    With `fast=True` and NumPy installed, modular tables are processed by the
+    vectorized engine in `cipher.vectorized`; output is identical to the
+    pure-Python path.
+
+    `offset` is the keyword position of the first character, so a long text can
+    be processed in chunks: pass `offset = total characters already processed`.
     """
     keyword: List[str]
     table: CipherTable
+    offset: int = 0
 
     def __post_init__(self):
         super().__post_init__()
-        self.keyword = remove_duplicates(
-            filter_allowed_chars(self.keyword, set(self.table.base_alphabet))
-        )
+        self.keyword = normalize_keyword(self.keyword, self.table)
         ensure_not_empty(self.keyword, "Keyword must not be empty")
 
+    def _shifts(self, decrypt: bool) -> Optional[List[int]]:
+        """Signed shift per keyword position, or None if the table is not modular."""
+        shifts = [self.table.shift_of(k) for k in self.keyword]
+        if any(s is None for s in shifts):
+            return None
+        return [-s if decrypt else s for s in shifts]
+
+    def _transform_vectorized(self, decrypt: bool) -> Optional[List[str]]:
+        shifts = self._shifts(decrypt)
+        if shifts is None:
+            return None
+        alphabet = self.table.base_alphabet
+        if vectorized.alphabet_codepoints(alphabet) is None:
+            return None
+        return list(vectorized.shift_text(self.as_string(), alphabet, shifts, self.offset))
+
     def _transform(self, decrypt: bool) -> List[str]:
+        if isinstance(self.text, EncodedText):
+            return self._transform_encoded(decrypt)
+        if self.fast and vectorized.HAVE_NUMPY:
+            result = self._transform_vectorized(decrypt)
+            if result is not None:
+                return result
+
         result = []
         key = self.keyword
         klen = len(key)
 
-        for i, char in enumerate(self.text):
+        for i, char in enumerate(self.text, start=self.offset):
             key_char = key[i % klen]
             cmap = self.table.get_map(key_char, decrypt=decrypt)
             result.append(cmap.get(char, char))
 
         return result
 
+    def compile(self, mode: str = "encrypt") -> CompiledCipher:
+        """
+        Compile the keyword rows for `mode`. The schedule starts at `self.offset`,
+        so `transform(chunk, 0)` continues where `encrypt()` would.
+        """
+        compiled = compile_cached(self.table, self.keyword, mode, fast=self.fast)
+        return compiled.rebased(self.offset)
+
     def encrypt(self) -> List[str]:
         return self._transform(decrypt=False)
 
@@ -1,5 +1,6 @@
-from cli.registry import register_command
-from .mono_helpers import run_mono_variant
+from cli.registry import register_command, register_compiler
+from cli.stream import iter_input_chunks
+from .mono_helpers import all_shifts_variant, compile_mono_variant, run_mono_variant
 
 @register_command("encrypt", "caesar")
 def caesar_encrypt(args):
@@ -7,4 +8,10 @@ def caesar_encrypt(args):
 
 @register_command("decrypt", "caesar")
 def caesar_decrypt(args):
+    if args.all_shifts:
+        return all_shifts_variant(args, iter_input_chunks(args))
     return run_mono_variant(args, mode="decrypt", variant="caesar")
+
+@register_compiler("caesar")
+def caesar_compile(args, mode):
+    return compile_mono_variant(args, mode, variant="caesar")
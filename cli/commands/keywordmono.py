@@ -1,5 +1,8 @@
-from cli.registry import register_command
-from .mono_helpers import run_mono_variant
+from cli.registry import register_command, register_compiler
+from cli.stream import iter_input_chunks
+from .mono_helpers import (
+    analyze_dictionary_variant, analyze_substitution_variant, compile_mono_variant, run_mono_variant
+)
 
 @register_command("encrypt", "keywordmono")
 def keywordmono_encrypt(args):
@@ -8,3 +11,13 @@ def keywordmono_encrypt(args):
 @register_command("decrypt", "keywordmono")
 def keywordmono_decrypt(args):
     return run_mono_variant(args, mode="decrypt", variant="keywordmono")
+
+@register_command("analyze", "keywordmono")
+def keywordmono_analyze(args):
+    if args.wordlist:
+        return analyze_dictionary_variant(args, iter_input_chunks(args), "keywordmono")
+    return analyze_substitution_variant(args, iter_input_chunks(args))
+
+@register_compiler("keywordmono")
+def keywordmono_compile(args, mode):
+    return compile_mono_variant(args, mode, variant="keywordmono")
@@ -1,5 +1,6 @@
-from cli.registry import register_command
-from .mono_helpers import run_mono_variant
+from cli.registry import register_command, register_compiler
+from cli.stream import iter_input_chunks
+from .mono_helpers import analyze_substitution_variant, compile_mono_variant, run_mono_variant
 
 @register_command("encrypt", "mono")
 def mono_encrypt(args):
@@ -8,3 +9,11 @@ def mono_encrypt(args):
 @register_command("decrypt", "mono")
 def mono_decrypt(args):
     return run_mono_variant(args, mode="decrypt", variant="mono")
+
+@register_command("analyze", "mono")
+def mono_analyze(args):
+    return analyze_substitution_variant(args, iter_input_chunks(args))
+
+@register_compiler("mono")
+def mono_compile(args, mode):
+    return compile_mono_variant(args, mode, variant="mono")
@@ -1,26 +1,32 @@
+from cipher import profiling
+from cipher.cache import compile_cached
+from cipher.compiled import CompiledCipher
 from cipher.monoalphabetic import MonoalphabeticCipher
+from cipher.parallel import default_jobs, parallel_transform
 from cipher.charmap_table import CharmapTable
-from utils.alphabet_loader import load_alphabet
+from cipher.modular_table import ModularTable
+from utils.alphabet_loader import load_alphabet, load_alphabet_view
 from utils.tools import remove_duplicates
 
-def run_mono_variant(args, mode, variant):
+def build_mono_table(args, variant):
     """
-    Generic handler for monoalphabetic cipher variants.
+    Build the substitution table for a monoalphabetic cipher variant.
     :param args: CLI arguments namespace
-    :param mode: "encrypt" or "decrypt"
     :param variant: One of "rot", "caesar", "keywordmono", "mono"
-    :return: str (resulting ciphertext or plaintext)
+    :return: (table, key_char, mono_alphabet)
     """
-    alphabet = load_alphabet(getattr(args, "lang", None))
+    alphabet = load_alphabet_view(getattr(args, "lang", None))
 
     if variant == "rot":
+        if args.shift is None:
+            raise ValueError("--shift is required (or use --all-shifts to try every shift).")
         key_char = alphabet[args.shift % len(alphabet)]
         mono_alphabet = alphabet
-        table = CharmapTable.from_alphabet(mono_alphabet, source="cli")
+        table = ModularTable.shared(mono_alphabet, source="cli")
     elif variant == "caesar":
         key_char = alphabet[3 % len(alphabet)]
         mono_alphabet = alphabet
-        table = CharmapTable.from_alphabet(mono_alphabet, source="cli")
+        table = ModularTable.shared(mono_alphabet, source="cli")
     elif variant == "keywordmono":
         keyword = list(args.keyword)
         mono_alphabet = remove_duplicates(keyword) + [c for c in alphabet if c not in keyword]
@@ -30,15 +36,194 @@ def run_mono_variant(args, mode, variant):
     elif variant == "mono":
         key_char = args.key_char
         mono_alphabet = alphabet
-        table = CharmapTable.from_alphabet(mono_alphabet, source="cli")
+        table = ModularTable.shared(mono_alphabet, source="cli")
     else:
         raise ValueError(f"Unknown mono variant: {variant}")
+    return table, key_char, mono_alphabet
+
+def compile_mono_variant(args, mode, variant):
+    """
+    Compile a monoalphabetic cipher variant without any input text.
+    :return: CompiledCipher
+    """
+    table, key_char, _ = build_mono_table(args, variant)
+    if not table.contains(key_char):
+        raise ValueError(f"Key character '{key_char}' not in table's alphabet.")
+    return compile_cached(table, [key_char], mode)
 
+def run_mono_variant(args, mode, variant):
+    """
+    Generic handler for monoalphabetic cipher variants.
+    :param args: CLI arguments namespace
+    :param mode: "encrypt" or "decrypt"
+    :param variant: One of "rot", "caesar", "keywordmono", "mono"
+    :return: str (resulting ciphertext or plaintext)
+    """
+    table, key_char, mono_alphabet = build_mono_table(args, variant)
     cipher = MonoalphabeticCipher(
-        text=list(args.text),
+        text=args.text,
         key_char=key_char,
         alphabet=mono_alphabet,
         table=table
     )
-    func = getattr(cipher, "encrypt" if mode == "encrypt" else "decrypt")
-    return "".join(func())
+    jobs = getattr(args, "jobs", 1) or default_jobs()
+    profiler = profiling.current()
+    if profiler is None:
+        return _run_mono(cipher, mode, jobs, getattr(args, "shard_pool", None))
+    with profiler.stage(type(cipher).__name__, mode, len(args.text)):
+        return _run_mono(cipher, mode, jobs, getattr(args, "shard_pool", None))
+
+def _run_mono(cipher, mode, jobs, pool):
+    try:
+        if jobs > 1:
+            return parallel_transform(cipher.compile(mode), cipher.text, jobs, pool=pool)
+        return cipher.translate(decrypt=(mode == "decrypt"))
+    except (NotImplementedError, ValueError):
+        # Alphabets with multi-character symbols have no str.translate table.
+        return "".join(cipher.decrypt() if mode == "decrypt" else cipher.encrypt())
+
+PREVIEW_CHARS = 80
+
+def analyze_shift_variant(args, chunks):
+    """
+    Recover the shift of a rot/caesar-style ciphertext by frequency analysis.
+    Every shift is scored from one pass of symbol counts; only the preview of
+    the best candidate is decrypted.
+    :param args: CLI arguments namespace (lang, top)
+    :param chunks: Iterable of ciphertext chunks
+    :return: str (ranked candidates and a preview)
+    """
+    from analysis.shift import recover_shift
+    from cli.config.settings import get_default_lang
+
+    alphabet = load_alphabet(getattr(args, "lang", None))
+    head = []
+
+    def tap(chunks):
+        for chunk in chunks:
+            if sum(map(len, head)) < PREVIEW_CHARS:
+                head.append(chunk[:PREVIEW_CHARS])
+            yield chunk
+
+    lang = getattr(args, "lang", None) or get_default_lang()
+    candidates = recover_shift(tap(chunks), alphabet, lang, top=getattr(args, "top", 5))
+    lines = ["shift\tkey\tchi2"]
+    lines += [f"{c.shift}\t{c.key_char}\t{c.chi2:.2f}" for c in candidates]
+    if candidates:
+        best = candidates[0]
+        table = ModularTable.shared(alphabet, source="cli")
+        preview = CompiledCipher.from_table(table, [best.key_char], "decrypt")("".join(head)[:PREVIEW_CHARS])
+        lines.append(f"preview (shift {best.shift}): {preview}")
+    return "\n".join(lines)
+
+def load_scoring_model(args, alphabet, lang):
+    """
+    The n-gram model for an analysis: --model (a stored model file), else
+    --corpus (counted on the fly), else the stored model for the language.
+    """
+    from analysis.ngram_store import load_language_model, load_model
+    from analysis.ngrams import NgramModel
+    from cli.stream import iter_chunks, open_input
+
+    if getattr(args, "model", None):
+        return load_model(args.model)
+    if getattr(args, "corpus", None):
+        with open_input(args.corpus) as corpus:
+            return NgramModel.from_corpus(iter_chunks(corpus), alphabet)
+    return load_language_model(lang)
+
+def analyze_dictionary_variant(args, chunks, variant):
+    """
+    Try every keyword of --wordlist (streamed, one per line) against the
+    ciphertext. Keys are scored on a --sample prefix; the --promote best
+    are decrypted in full and re-scored. Scoring runs in parallel with --jobs.
+    :param args: CLI arguments namespace (lang, wordlist, sample, promote, top, model, corpus, jobs)
+    :param chunks: Iterable of ciphertext chunks
+    :param variant: "vigenere" or "keywordmono"
+    :return: str (ranked keywords, search stats and a preview)
+    """
+    from analysis.dictionary import compile_decryption, dictionary_attack
+    from cli.config.settings import get_default_lang
+    from cli.stream import open_input
+
+    alphabet = load_alphabet(getattr(args, "lang", None))
+    lang = getattr(args, "lang", None) or get_default_lang()
+    model = load_scoring_model(args, alphabet, lang)
+    text = "".join(chunks)
+    with open_input(args.wordlist) as words:
+        result = dictionary_attack(
+            text, words, alphabet, model, variant,
+            sample=args.sample,
+            promote=args.promote,
+            jobs=getattr(args, "jobs", 1) or default_jobs(),
+        )
+    lines = ["keyword\tsample\tscore"]
+    lines += [f"{c.keyword}\t{c.sample_score:.2f}\t{c.score:.2f}" for c in result.candidates[:getattr(args, "top", 5)]]
+    lines.append(
+        f"keywords: {result.words_read} read, {result.keys_tried} distinct "
+        f"({result.candidates_per_second:,.0f}/s)"
+    )
+    if result.best:
+        preview = compile_decryption(result.best.keyword, variant, alphabet)(text[:PREVIEW_CHARS])
+        lines.append(f"preview ({result.best.keyword}): {preview}")
+    return "\n".join(lines)
+
+def all_shifts_variant(args, chunks):
+    """
+    Decrypt a rot/caesar ciphertext under every shift, best chi-squared fit
+    first. With --top the input is streamed and only the --sample prefix of
+    the --top best shifts is decrypted.
+    :param args: CLI arguments namespace (lang, top, sample)
+    :param chunks: Iterable of ciphertext chunks
+    :return: Iterator[str] (a header line and the plaintext per shift)
+    """
+    from analysis.shift import decrypt_all_shifts
+    from cli.config.settings import get_default_lang
+
+    alphabet = load_alphabet(getattr(args, "lang", None))
+    lang = getattr(args, "lang", None) or get_default_lang()
+    top = getattr(args, "top", 0)
+    candidates = decrypt_all_shifts(chunks, alphabet, lang, top=top, sample=getattr(args, "sample", 0) if top else 0)
+    for i, (candidate, plaintext) in enumerate(candidates):
+        if i:
+            yield "\n"
+        yield f"--- shift {candidate.shift} (key {candidate.key_char}, chi2 {candidate.chi2:.2f}) ---\n"
+        yield plaintext
+
+def analyze_substitution_variant(args, chunks):
+    """
+    Search for a general substitution key (mono, keywordmono) by simulated
+    annealing over quadgram scores. The ciphertext is read once into n-gram
+    counts; restarts run in parallel with --jobs.
+    The model is the stored one for the language unless --model (a stored
+    model file) or --corpus (counted on the fly) is given.
+    :param args: CLI arguments namespace (lang, model, corpus, restarts, iterations, jobs)
+    :param chunks: Iterable of ciphertext chunks
+    :return: str (recovered cipher alphabet, search stats and a preview)
+    """
+    from analysis.substitution import solve_substitution
+    from cli.config.settings import get_default_lang
+
+    alphabet = load_alphabet(getattr(args, "lang", None))
+    lang = getattr(args, "lang", None) or get_default_lang()
+    model = load_scoring_model(args, alphabet, lang)
+    head = []
+
+    def tap(chunks):
+        for chunk in chunks:
+            if sum(map(len, head)) < PREVIEW_CHARS:
+                head.append(chunk[:PREVIEW_CHARS])
+            yield chunk
+
+    result = solve_substitution(
+        tap(chunks), alphabet, model, lang,
+        restarts=args.restarts,
+        iterations=args.iterations,
+        jobs=getattr(args, "jobs", 1) or default_jobs(),
+    )
+    return "\n".join([
+        f"cipher alphabet: {result.cipher_alphabet}",
+        f"score: {result.score:.2f}",
+        f"keys evaluated: {result.keys_evaluated} ({result.keys_per_second:,.0f}/s)",
+        f"preview: {result.decrypt(''.join(head)[:PREVIEW_CHARS], alphabet)}",
+    ])
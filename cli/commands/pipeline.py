@@ -1,21 +1,25 @@
 from cli.registry import register_command
+from cli.config.settings import is_fast_mode_enabled
 from cipher.vigenere import Vigenere
 from cipher.monoalphabetic import MonoalphabeticCipher
-from cipher.charmap_table import CharmapTable
+from cipher.modular_table import ModularTable
 from cipher.transformer import CipherTransformer
-from utils.alphabet_loader import load_alphabet
+from cipher.parallel import default_jobs
+from utils.alphabet_loader import load_alphabet_view
 
 @register_command("encrypt", "pipeline")
 def pipeline_encrypt(args):
     ciphers = []
-    alphabet = load_alphabet(args.lang)
-    table = CharmapTable.from_alphabet(alphabet, source="cli")
+    alphabet = load_alphabet_view(args.lang)
+    table = ModularTable.shared(alphabet, source="cli")
     if args.use_vigenere:
         ciphers.append(Vigenere(
             text=list(args.text),
             keyword=list(args.keyword),
             alphabet=alphabet,
-            table=table
+            table=table,
+            fast=is_fast_mode_enabled(),
+            offset=getattr(args, "offset", 0)
         ))
     if args.use_mono:
         ciphers.append(MonoalphabeticCipher(
@@ -24,5 +28,9 @@ def pipeline_encrypt(args):
             alphabet=alphabet,
             table=table
         ))
-    pipeline = CipherTransformer(ciphers)
+    pipeline = CipherTransformer(
+        ciphers,
+        parallel=getattr(args, "jobs", 1) or default_jobs(),
+        pool=getattr(args, "shard_pool", None),
+    )
     return pipeline("encrypt")
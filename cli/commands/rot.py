@@ -1,5 +1,6 @@
-from cli.registry import register_command
-from .mono_helpers import run_mono_variant
+from cli.registry import register_command, register_compiler
+from cli.stream import iter_input_chunks
+from .mono_helpers import all_shifts_variant, analyze_shift_variant, compile_mono_variant, run_mono_variant
 
 @register_command("encrypt", "rot")
 def rot_encrypt(args):
@@ -7,4 +8,14 @@ def rot_encrypt(args):
 
 @register_command("decrypt", "rot")
 def rot_decrypt(args):
+    if args.all_shifts:
+        return all_shifts_variant(args, iter_input_chunks(args))
     return run_mono_variant(args, mode="decrypt", variant="rot")
+
+@register_command("analyze", "rot")
+def rot_analyze(args):
+    return analyze_shift_variant(args, iter_input_chunks(args))
+
+@register_compiler("rot")
+def rot_compile(args, mode):
+    return compile_mono_variant(args, mode, variant="rot")
@@ -1,31 +1,88 @@
-from cli.registry import register_command
-from cipher.vigenere import Vigenere
-from cipher.charmap_table import CharmapTable
+from cli.registry import register_command, register_compiler
+from cli.config.settings import get_default_lang, is_fast_mode_enabled
+from cli.stream import iter_input_chunks
+from cipher.cache import compile_cached
+from cipher.compiled import CompiledCipher
+from cipher.vigenere import Vigenere, normalize_keyword
+from cipher.modular_table import ModularTable
 from cipher.transformer import CipherTransformer
-from utils.alphabet_loader import load_alphabet
+from cipher.parallel import default_jobs
+from utils.alphabet_loader import load_alphabet, load_alphabet_view
+from utils.validators import ensure_not_empty
+from .mono_helpers import analyze_dictionary_variant
 
 @register_command("encrypt", "vigenere")
 def vigenere_encrypt(args):
-    alphabet = load_alphabet(args.lang)  # eller "en", eller Path(...)
-    table = CharmapTable.from_alphabet(alphabet, source="cli")
+    alphabet = load_alphabet_view(args.lang)  # eller "en", eller Path(...)
+    table = ModularTable.shared(alphabet, source="cli")
     cipher = Vigenere(
-        text=list(args.text),
+        text=args.text,
         keyword=list(args.keyword),
         alphabet=alphabet,
-        table=table
+        table=table,
+        fast=is_fast_mode_enabled(),
+        offset=getattr(args, "offset", 0)
+    )
+    pipeline = CipherTransformer(
+        [cipher],
+        parallel=getattr(args, "jobs", 1) or default_jobs(),
+        pool=getattr(args, "shard_pool", None),
     )
-    pipeline = CipherTransformer([cipher])
     return pipeline("encrypt")
 
 @register_command("decrypt", "vigenere")
 def vigenere_decrypt(args):
-    alphabet = load_alphabet(args.lang)
-    table = CharmapTable.from_alphabet(alphabet, source="cli")
+    alphabet = load_alphabet_view(args.lang)
+    table = ModularTable.shared(alphabet, source="cli")
     cipher = Vigenere(
-        text=list(args.text),
+        text=args.text,
         keyword=list(args.keyword),
         alphabet=alphabet,
-        table=table
+        table=table,
+        fast=is_fast_mode_enabled(),
+        offset=getattr(args, "offset", 0)
+    )
+    pipeline = CipherTransformer(
+        [cipher],
+        parallel=getattr(args, "jobs", 1) or default_jobs(),
+        pool=getattr(args, "shard_pool", None),
     )
-    pipeline = CipherTransformer([cipher])
     return pipeline("decrypt")
+
+@register_command("analyze", "vigenere")
+def vigenere_analyze(args):
+    from analysis.vigenere import analyze_vigenere
+
+    if args.wordlist:
+        return analyze_dictionary_variant(args, iter_input_chunks(args), "vigenere")
+    alphabet = load_alphabet(args.lang)
+    head = []
+
+    def tap(chunks):
+        for chunk in chunks:
+            if not head:
+                head.append(chunk[:80])
+            yield chunk
+
+    result = analyze_vigenere(
+        tap(iter_input_chunks(args)),
+        alphabet,
+        lang=args.lang or get_default_lang(),
+        max_period=args.max_period,
+        period=args.period,
+    )
+    table = ModularTable.shared(alphabet, source="cli")
+    preview = CompiledCipher.from_table(table, list(result.keyword), "decrypt")("".join(head))
+    lines = ["period\tioc"]
+    lines += [f"{score.period}\t{score.ioc:.4f}" for score in result.periods[:args.top]]
+    lines.append(f"keyword: {result.keyword} (period {result.period})")
+    lines.append(f"preview: {preview}")
+    return "\n".join(lines)
+
+@register_compiler("vigenere")
+def vigenere_compile(args, mode):
+    alphabet = load_alphabet_view(args.lang)
+    table = ModularTable.shared(alphabet, source="cli")
+    keyword = normalize_keyword(args.keyword, table)
+    ensure_not_empty(keyword, "Keyword must not be empty")
+    return compile_cached(table, keyword, mode, fast=is_fast_mode_enabled())
@@ -1,14 +1,22 @@
+from functools import lru_cache
 from pathlib import Path
-import yaml
 
 CONFIG_PATH = Path(__file__).parent / "default.yaml"
 
-with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-    CONFIG = yaml.safe_load(f)
+@lru_cache(maxsize=None)
+def get_config():
+    """Read default.yaml on first use (not at import time) and cache it."""
+    from utils.load import load_yaml
+    return load_yaml(CONFIG_PATH) or {}
+
+def __getattr__(name):
+    # Backwards compatibility: `settings.CONFIG` is loaded lazily.
+    if name == "CONFIG":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_default_lang():
-    return CONFIG.get("lang", "en")
+    return get_config().get("lang", "en")
 
 def is_fast_mode_enabled():
-    return CONFIG.get("fast_mode", True)
-
+    return get_config().get("fast_mode", True)
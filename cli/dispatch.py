@@ -1,14 +1,44 @@
-from cli.registry import COMMAND_REGISTRY
+from cli.registry import COMMAND_REGISTRY, COMPILER_REGISTRY, resolve
 from utils.errors import UnknownCommandError
 
 def dispatch(args):
     """
     Dispatch parsed CLI arguments to the registered cipher handler.
+    Handlers registered by entry-point name are imported on first use.
 
     Raises:
         UnknownCommandError: If no matching handler is found.
     """
     try:
-        return COMMAND_REGISTRY[args.operation][args.cipher](args)
+        handler = resolve(COMMAND_REGISTRY, args.operation, args.cipher)
     except KeyError:
         raise UnknownCommandError(args.operation, args.cipher)
+    return handler(args)
+
+
+def compile_command(args):
+    """
+    Build the compiled transform for the parsed cipher and operation.
+
+    Raises:
+        UnknownCommandError: If the cipher has no registered compiler.
+    """
+    try:
+        compiler = resolve(COMPILER_REGISTRY, args.cipher)
+    except KeyError:
+        raise UnknownCommandError(args.operation, args.cipher)
+    return compiler(args, args.operation)
+
+
+def compile_streaming(args):
+    """
+    The compiled transform for streaming `args`, or None when the command must
+    be dispatched per chunk instead (no registered compiler, or an alphabet
+    without a compiled form such as one with multi-character symbols).
+    """
+    if args.cipher not in COMPILER_REGISTRY:
+        return None
+    try:
+        return compile_command(args)
+    except NotImplementedError:
+        return None
@@ -1,21 +1,67 @@
 # Main CLI entry point for CryptoTractatus.
 
+import sys
+from collections.abc import Iterator
+from contextlib import nullcontext
 from cli.parser import build_parser
-from cli.dispatch import dispatch
-
-# Import ALL commands to ensure they are registered!
-import cli.commands.caesar
-import cli.commands.rot
-import cli.commands.keywordmono
-import cli.commands.mono
-import cli.commands.pipeline
-import cli.commands.vigenere
+from cli.dispatch import compile_command, compile_streaming, dispatch
+from cli.spec import install_entry_points, load_spec
+from cli.stream import STREAMING_OPERATIONS, open_output, run_binary, run_streaming
 
 def main():
-    parser = build_parser()
+    # Handlers are imported lazily on dispatch via the precompiled spec.
+    spec = load_spec()
+    install_entry_points(spec)
+    parser = build_parser(spec)
     args = parser.parse_args()
+    if args.operation == "serve":
+        from cli.serve import serve
+        serve(args, spec)
+        return
+    if args.operation == "bench":
+        from bench.suite import run_args
+        sys.exit(run_args(args))
+    if args.profile:
+        from cipher.profiling import Profiler
+
+        with Profiler.for_mode(args.profile) as profiler:
+            with profiler.stage(f"cli {args.operation} {args.cipher}", args.operation) as record:
+                record.chars = execute(parser, args)
+        print(profiler.report(), file=sys.stderr)
+        return
+    execute(parser, args)
+
+def execute(parser, args):
+    """Run a cipher command; returns the number of characters (bytes) processed."""
+    all_shifts = getattr(args, "all_shifts", False)
+    if args.binary:
+        if args.input is None or args.operation not in STREAMING_OPERATIONS or all_shifts:
+            parser.error("--binary requires --input and an encrypt/decrypt operation (without --all-shifts)")
+        return run_binary(args, compile_command(args))
+    if args.input is not None and args.operation in STREAMING_OPERATIONS and not all_shifts:
+        return run_streaming(args, dispatch, compile_streaming(args))
     result = dispatch(args)
-    print("".join(result))
+    if isinstance(result, Iterator):
+        # Generators (e.g. --all-shifts) are written piece by piece, not joined.
+        return write_pieces(args.output, result)
+    result = "".join(result)
+    if args.output is not None:
+        with open_output(args.output) as out:
+            out.write(result)
+        return len(result)
+    print(result)
+    return len(result)
+
+def write_pieces(path, pieces):
+    """Write `pieces` to `path` (stdout, newline-terminated, for None) as they are produced."""
+    written = 0
+    with open_output(path) if path is not None else nullcontext(sys.stdout) as out:
+        for piece in pieces:
+            out.write(piece)
+            written += len(piece)
+        if path is None:
+            out.write("\n")
+    return written
 
 if __name__ == "__main__":
     main()
@@ -1,23 +1,42 @@
 import argparse
-from pathlib import Path
-from utils.load import load_yaml
+from cli.stream import DEFAULT_CHUNK_SIZE
 
-def load_flag_config(cipher: str) -> dict:
-    path = Path(__file__).parent / "config" / f"{cipher}.yaml"
-    return load_yaml(path)
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {number}")
+    return number
 
-def load_all_cipher_configs(config_dir: Path) -> dict:
-    ciphers = [
-        p.stem for p in config_dir.glob("*.yaml")
-        if p.stem not in ("default",)
-    ]
-    cipher_configs = {cipher: load_flag_config(cipher) for cipher in ciphers}
-    return cipher_configs
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {number}")
+    return number
 
 def add_cipher_to_operation(op_parser, cipher, flags):
     cipher_parser = op_parser.add_parser(cipher)
-    cipher_parser.add_argument("--text", required=True)
+    source = cipher_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--text")
+    source.add_argument("--input", help="Read input from a file ('-' for stdin), processed in chunks")
+    cipher_parser.add_argument("--output", help="Write output to a file ('-' for stdout)")
+    cipher_parser.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                               help="Characters per chunk when streaming")
+    cipher_parser.add_argument("--binary", action="store_true",
+                               help="Byte mode: treat input bytes as Latin-1 code points (requires --input)")
+    cipher_parser.add_argument("--jobs", type=non_negative_int, default=1,
+                               help="Worker processes for large inputs (0 = all cores)")
+    cipher_parser.add_argument("--profile", nargs="?", const="time", choices=("time", "memory", "cprofile", "all"),
+                               help="Print per-stage timings to stderr (memory: tracemalloc, cprofile: call profile)")
+    groups = {}  # flags sharing `one_of`: exactly one of them is required
     for flag in flags:
+        target = cipher_parser
+        if flag.get("one_of"):
+            if flag["one_of"] not in groups:
+                groups[flag["one_of"]] = cipher_parser.add_mutually_exclusive_group(required=True)
+            target = groups[flag["one_of"]]
+        if flag["type"] == "bool":
+            target.add_argument(flag["name"], action="store_true")
+            continue
         kwargs = {"required": flag.get("required", False)}
         if flag.get("default") is not None:
             kwargs["default"] = flag["default"]
@@ -25,7 +44,7 @@ def add_cipher_to_operation(op_parser, cipher, flags):
             kwargs["type"] = int
         elif flag["type"] == "str":
             kwargs["type"] = str
-        cipher_parser.add_argument(flag["name"], **kwargs)
+        target.add_argument(flag["name"], **kwargs)
 
 def add_operation(parser, op_name: str, cipher_configs: dict):
     op_parser = parser.add_parser(op_name)
@@ -35,14 +54,42 @@ def add_operation(parser, op_name: str, cipher_configs: dict):
             continue
         add_cipher_to_operation(cipher_parsers, cipher, config[op_name])
 
-def build_parser():
+def build_parser(spec=None):
+    """
+    Build the argument parser from the precompiled CLI spec (see `cli.spec`),
+    which avoids reading the YAML configs on every invocation.
+    """
+    from cli.spec import load_spec
+
     parser = argparse.ArgumentParser(
         description="CryptoTractatus CLI – classical cipher toolkit"
     )
     operations = parser.add_subparsers(dest="operation", required=True)
-    config_dir = Path(__file__).parent / "config"
-    cipher_configs = load_all_cipher_configs(config_dir)
+    cipher_configs = (spec or load_spec())["ciphers"]
     all_ops = {op for cfg in cipher_configs.values() for op in cfg}
     for op_name in sorted(all_ops):
         add_operation(operations, op_name, cipher_configs)
+    serve_parser = operations.add_parser("serve", help="Serve JSON-lines requests (see cli/serve.py)")
+    serve_parser.add_argument("--socket", help="Listen on this Unix socket path instead of stdin/stdout")
+    serve_parser.add_argument("--port", type=int, help="Listen on this TCP port instead of stdin/stdout")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="TCP address for --port")
+    serve_parser.add_argument("--workers", type=positive_int, default=4, help="Requests processed concurrently (socket mode)")
+    serve_parser.add_argument("--pool", choices=("thread", "process"), default="thread",
+                              help="Executor for socket mode")
+    serve_parser.add_argument("--queue-size", type=positive_int, default=1024,
+                              help="Queued requests before clients are throttled (socket mode)")
+    serve_parser.add_argument("--line-limit", type=positive_int, default=16 * 1024 * 1024,
+                              help="Longest request line in bytes; longer lines get an error response (socket mode)")
+    bench_parser = operations.add_parser("bench", help="Run the benchmark suite (see bench/suite.py)")
+    add_bench_arguments(bench_parser)
     return parser
+
+def add_bench_arguments(bench_parser):
+    # Mirrors bench.suite.add_arguments without importing the bench package at start-up.
+    bench_parser.add_argument("names", nargs="*", metavar="NAME", help="Benchmarks to run (default: all)")
+    bench_parser.add_argument("--profile", choices=("quick", "full"), default="quick", help="Input sizes")
+    bench_parser.add_argument("--output", help="Write the JSON document here instead of stdout")
+    bench_parser.add_argument("--compare", metavar="BASELINE", help="Report regressions against a previous document")
+    bench_parser.add_argument("--threshold", type=float, default=0.10,
+                              help="Relative slowdown reported as a regression")
+    bench_parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
@@ -1,8 +1,16 @@
 """
 Registry and decorator for mapping CLI operations and ciphers to their handler functions.
+
+Entries are either handler functions (registered by `@register_command` when a
+command module is imported) or entry-point names such as
+"cli.commands.rot:rot_encrypt" (installed from the precompiled CLI spec), which
+are imported on first use by `resolve`.
 """
 
+import importlib
+
 COMMAND_REGISTRY = {}
+COMPILER_REGISTRY = {}
 
 def register_command(operation, cipher):
     """
@@ -19,3 +27,55 @@ def register_command(operation, cipher):
         COMMAND_REGISTRY.setdefault(operation, {})[cipher] = fn
         return fn
     return decorator
+
+
+def register_compiler(cipher):
+    """
+    Decorator to register a compiler for a cipher: a function taking
+    (args, mode) and returning a stateless CompiledTransform.
+    Used by modes that drive the transform themselves, such as byte mode.
+
+    Args:
+        cipher (str): The cipher name, e.g., "rot", "vigenere".
+
+    Returns:
+        Callable: The decorated compiler function.
+    """
+    def decorator(fn):
+        COMPILER_REGISTRY[cipher] = fn
+        return fn
+    return decorator
+
+
+def register_entry_point(operation, cipher, entry_point):
+    """
+    Register a lazily imported handler by entry-point name ("module:function").
+    Handlers that are already registered are left untouched.
+    """
+    COMMAND_REGISTRY.setdefault(operation, {}).setdefault(cipher, entry_point)
+
+
+def register_compiler_entry_point(cipher, entry_point):
+    """Register a lazily imported compiler by entry-point name ("module:function")."""
+    COMPILER_REGISTRY.setdefault(cipher, entry_point)
+
+
+def load_entry_point(entry_point):
+    """Import and return the object named by "module:attribute"."""
+    module, _, attr = entry_point.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def resolve(registry, *keys):
+    """
+    Look up a handler in `registry` by nested `keys`, importing it if it is an
+    entry-point name. Raises KeyError if no entry exists.
+    """
+    table = registry
+    for key in keys[:-1]:
+        table = table[key]
+    handler = table[keys[-1]]
+    if isinstance(handler, str):
+        handler = load_entry_point(handler)
+        table[keys[-1]] = handler
+    return handler
@@ -1,35 +1,26 @@
 import sys
 import inquirer
-from pathlib import Path
 
 from cli.dispatch import dispatch
 from cli.parser import build_parser
-import cli.commands.caesar
-import cli.commands.rot
-import cli.commands.mono
-import cli.commands.keywordmono
+from cli.spec import install_entry_points, load_spec
 
 
-def get_available_ciphers():
-    config_dir = Path(__file__).parent / "config"
-    return [
-        p.stem for p in config_dir.glob("*.yaml")
-        if p.stem not in ("default",)
-    ]
+def get_available_ciphers(spec=None):
+    return sorted((spec or load_spec())["ciphers"])
 
 def run_interactive():
-    parser = build_parser()
-    cipher_choices = get_available_ciphers()
+    spec = load_spec()
+    install_entry_points(spec)
+    parser = build_parser(spec)
+    cipher_choices = get_available_ciphers(spec)
     op_choices = ["encrypt", "decrypt"]
 
     op = inquirer.list_input("Vad vill du göra?", choices=op_choices)
     cipher = inquirer.list_input("Vilken cipher?", choices=cipher_choices)
 
-    # Dynamiskt fråga efter parametrar som krävs enligt YAML
-    config_dir = Path(__file__).parent / "config"
-    from utils.load import load_yaml
-    cipher_config = load_yaml(config_dir / f"{cipher}.yaml")
-    flags = cipher_config[op]
+    # Dynamiskt fråga efter parametrar som krävs enligt YAML (via CLI-spec)
+    flags = spec["ciphers"][cipher].get(op, [])
 
     questions = []
     for flag in flags:
@@ -0,0 +1,190 @@
+"""
+Long-running server mode with a JSON-lines protocol.
+
+One process serves many requests, so imports, parsed alphabets, shared tables
+and compiled keys stay warm between them. Each input line is a request:
+
+    {"id": 1, "operation": "encrypt", "cipher": "rot", "args": {"shift": 3, "lang": "en"}, "text": "HELLO"}
+
+and produces exactly one response line, in request order:
+
+    {"id": 1, "ok": true, "result": "KHOOR", "latency_ms": 0.041}
+    {"id": 2, "ok": false, "error": "ValueError: ...", "latency_ms": 0.012}
+
+`args` holds the same flags as the command line (with or without the leading
+"--"), except flags that name files on the server (`path: true` in the YAML
+config, e.g. --wordlist, --corpus, --model), which are refused; `lang` must be
+a plain language name. An optional integer "offset" continues a key stream across requests,
+like `--input` chunking does. Clients may pipeline: write many requests
+without waiting, then read the responses in order.
+
+Usage:
+    python -m cli.main serve                  # stdin -> stdout
+    python -m cli.main serve --socket PATH    # Unix socket (see cli.service)
+    python -m cli.main serve --port 8765      # TCP on --host (see cli.service)
+"""
+
+import json
+import re
+import sys
+import time
+from argparse import Namespace
+from typing import Any, Dict, Iterable, TextIO
+
+from cli.config.settings import get_config, get_default_lang
+from cli.dispatch import dispatch
+from cli.registry import COMMAND_REGISTRY, resolve
+from cli.stream import DEFAULT_CHUNK_SIZE
+from utils.alphabet_loader import load_alphabet_view
+from utils.errors import UnknownCommandError
+
+def _flag_bool(value: Any) -> bool:
+    if not isinstance(value, bool):
+        raise ValueError(f"Expected true or false, got {value!r}")
+    return value
+
+
+FLAG_TYPES = {"int": int, "str": str, "bool": _flag_bool}
+LANG_NAME = re.compile(r"[A-Za-z0-9_-]+")  # resolved to files under language/, so no paths
+
+
+def _dest(flag_name: str) -> str:
+    return flag_name.lstrip("-").replace("-", "_")
+
+
+def request_namespace(spec: Dict[str, Any], request: Dict[str, Any]) -> Namespace:
+    """
+    Build the argument namespace a handler would receive from the parser,
+    validating flags against the CLI spec.
+
+    Raises:
+        UnknownCommandError: If the cipher does not support the operation.
+        ValueError: If a flag is unknown, missing, has the wrong type, names a
+            server-side file, or `lang` is not a plain language name.
+    """
+    operation, cipher = request.get("operation"), request.get("cipher")
+    flags = spec["ciphers"].get(cipher, {}).get(operation)
+    if flags is None:
+        raise UnknownCommandError(operation, cipher)
+    text = request.get("text")
+    if not isinstance(text, str):
+        raise ValueError("Request must contain a string 'text'.")
+
+    given = {_dest(name): value for name, value in (request.get("args") or {}).items()}
+    known = {_dest(flag["name"]): flag for flag in flags}
+    unknown = sorted(set(given) - set(known))
+    if unknown:
+        raise ValueError(f"Unknown argument(s) for {operation} {cipher}: {', '.join(unknown)}")
+    paths = sorted(known[dest]["name"] for dest in given if known[dest].get("path"))
+    if paths:
+        raise ValueError(f"File arguments are not accepted by serve: {', '.join(paths)}")
+    lang = given.get("lang")
+    if lang is not None and not (isinstance(lang, str) and LANG_NAME.fullmatch(lang)):
+        raise ValueError(f"Invalid language name: {lang!r}")
+
+    values = {}
+    for dest, flag in known.items():
+        value = given.get(dest, flag.get("default"))
+        if value is None and flag["type"] == "bool":
+            value = False
+        elif value is None:
+            if flag.get("required", False):
+                raise ValueError(f"Missing required argument: {flag['name']}")
+        else:
+            value = FLAG_TYPES.get(flag["type"], str)(value)
+        values[dest] = value
+
+    groups: Dict[str, list] = {}
+    for dest, flag in known.items():
+        if flag.get("one_of"):
+            groups.setdefault(flag["one_of"], []).append(dest)
+    for dests in groups.values():
+        if sum(values[dest] not in (None, False) for dest in dests) != 1:
+            names = ", ".join(known[dest]["name"] for dest in dests)
+            raise ValueError(f"Exactly one of {names} is required")
+
+    return Namespace(
+        operation=operation,
+        cipher=cipher,
+        text=text,
+        offset=int(request.get("offset", 0)),
+        input=None,
+        output=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        binary=False,
+        jobs=1,
+        profile=None,
+        **values,
+    )
+
+
+def handle_request(spec: Dict[str, Any], line: str) -> Dict[str, Any]:
+    """Decode, dispatch and time one request line; errors become error responses."""
+    start = time.perf_counter()
+    request_id = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object.")
+        request_id = request.get("id")
+        result = dispatch(request_namespace(spec, request))
+        response = {"id": request_id, "ok": True, "result": "".join(result)}
+    except Exception as exc:
+        response = {"id": request_id, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    response["latency_ms"] = round((time.perf_counter() - start) * 1e3, 3)
+    return response
+
+
+def serve_lines(spec: Dict[str, Any], lines: Iterable[str], out: TextIO) -> int:
+    """
+    Answer every non-blank request line on `out`, in order.
+
+    Returns:
+        int: Number of requests served.
+    """
+    served = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        out.write(json.dumps(handle_request(spec, line), ensure_ascii=False) + "\n")
+        out.flush()
+        served += 1
+    return served
+
+
+def warm_up(spec: Dict[str, Any]) -> None:
+    """Import every handler and load settings and the default alphabet before the first request."""
+    for operation, ciphers in spec["handlers"].items():
+        for cipher in ciphers:
+            resolve(COMMAND_REGISTRY, operation, cipher)
+    get_config()
+    load_alphabet_view(get_default_lang())
+
+
+def serve(args: Namespace, spec: Dict[str, Any]) -> None:
+    """
+    Entry point for `cli.main serve`: stdin/stdout in-process, or the asyncio
+    service (`cli.service`) when a socket or port is given.
+    """
+    if args.socket is None and args.port is None:
+        warm_up(spec)
+        serve_lines(spec, sys.stdin, sys.stdout)
+        return
+
+    import asyncio
+    from cli.service import run_service
+
+    try:
+        asyncio.run(run_service(
+            socket_path=args.socket,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            pool=args.pool,
+            queue_size=args.queue_size,
+            line_limit=args.line_limit,
+        ))
+    except FileExistsError as exc:
+        sys.exit(f"[✗] {exc}")
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,321 @@
+"""
+Asyncio front end for `serve`: many concurrent clients over TCP or a Unix socket.
+
+Connections speak the JSON-lines protocol of `cli.serve`. Request lines from
+all connections go into one bounded queue; a fixed number of dispatcher tasks
+hand them to a thread or process pool (`--pool`, `--workers`), taking up to
+MAX_BATCH already-queued requests per pool call. When the queue
+is full, connection readers stop reading, so clients are slowed down by TCP
+flow control instead of the server buffering without bound. Each connection
+receives its responses in request order.
+
+Request lines longer than `line_limit` bytes (`--line-limit`) are answered
+with an error response and skipped up to the next newline, without buffering
+them whole.
+
+A request `{"operation": "stats"}` is answered with the service counters as
+its result: requests, errors, throughput, queue depth and p50/p99 latency
+(queue wait + processing) over the most recent requests.
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import stat
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+from cipher.cache import default_cache
+
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_HOST = "127.0.0.1"
+LATENCY_WINDOW = 10_000
+DEFAULT_LINE_LIMIT = 16 * 1024 * 1024  # bytes per request line
+MAX_BATCH = 64  # queued requests handed to the pool in one call
+STATS_OPERATION = "stats"
+
+_spec: Optional[Dict[str, Any]] = None
+
+
+def _init_worker() -> None:
+    """Load the CLI spec and warm handler caches (once per pool worker)."""
+    global _spec
+    if _spec is not None:
+        return
+    from cli.serve import warm_up
+    from cli.spec import install_entry_points, load_spec
+
+    _spec = load_spec()
+    install_entry_points(_spec)
+    warm_up(_spec)
+
+
+def _handle_lines(lines: List[str]) -> List[Dict[str, Any]]:
+    from cli.serve import handle_request
+
+    _init_worker()
+    return [handle_request(_spec, line) for line in lines]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of `values` (0 for an empty sample)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class ServiceStats:
+    """
+    Request counters for the service.
+
+    Attributes:
+        requests (int): Completed requests (including errors).
+        errors (int): Requests answered with `ok: false`.
+        latencies_ms (Deque[float]): Latency of the most recent requests,
+            measured from enqueue to response.
+    """
+    requests: int = 0
+    errors: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    latencies_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        self.requests += 1
+        self.errors += not ok
+        self.latencies_ms.append(latency_ms)
+
+    def snapshot(self, queue_depth: int = 0) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        latencies = list(self.latencies_ms)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "uptime_s": round(elapsed, 3),
+            "throughput_rps": round(self.requests / elapsed, 1) if elapsed else 0.0,
+            "queue_depth": queue_depth,
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            # this process only; with --pool process each worker has its own cache
+            "cipher_cache": default_cache().stats().as_dict(),
+        }
+
+
+class CipherService:
+    """
+    Bounded work queue between asyncio connections and an executor pool.
+
+    Args:
+        executor (Executor): Pool that runs request lines (thread or process).
+        workers (int): Number of requests in flight on the pool.
+        queue_size (int): Maximum queued requests before readers block.
+        line_limit (int): Longest accepted request line, in bytes.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        workers: int,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        line_limit: int = DEFAULT_LINE_LIMIT
+    ):
+        self.executor = executor
+        self.workers = workers
+        self.line_limit = line_limit
+        self.queue: "asyncio.Queue" = asyncio.Queue(maxsize=queue_size)
+        self.stats = ServiceStats()
+        self._dispatchers = []
+
+    def start(self) -> None:
+        self.stats = ServiceStats()
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Take whatever is already queued (up to MAX_BATCH) so one pool
+            # round trip serves many small requests.
+            batch = [await self.queue.get()]
+            while len(batch) < MAX_BATCH and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                responses = await loop.run_in_executor(
+                    self.executor, _handle_lines, [line for line, _, _ in batch]
+                )
+            except Exception as exc:  # e.g. a broken process pool
+                error = {"id": None, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+                responses = [error] * len(batch)
+            done = time.perf_counter()
+            for (_, future, enqueued), response in zip(batch, responses):
+                self.stats.record((done - enqueued) * 1e3, response.get("ok", False))
+                if not future.cancelled():
+                    future.set_result(response)
+                self.queue.task_done()
+
+    async def submit(self, line: str) -> "asyncio.Future":
+        """Queue one request line (waits while the queue is full)."""
+        future = asyncio.get_running_loop().create_future()
+        stats_request = _stats_request(line)
+        if stats_request is not None:
+            future.set_result({
+                "id": stats_request.get("id"),
+                "ok": True,
+                "result": self.stats.snapshot(self.queue.qsize()),
+            })
+        else:
+            await self.queue.put((line, future, time.perf_counter()))
+        return future
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Bounded too, so a client that stops reading responses stops being read.
+        pending: "asyncio.Queue" = asyncio.Queue(maxsize=self.queue.maxsize)
+        responder = asyncio.create_task(self._respond(pending, writer))
+        try:
+            while True:
+                try:
+                    raw = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as exc:
+                    raw = exc.partial  # last line without a newline, or b"" at EOF
+                except asyncio.LimitOverrunError:
+                    await pending.put(self._reject_oversized())
+                    if not await _skip_line(reader):
+                        break
+                    continue
+                if not raw:
+                    break
+                line = raw.decode("utf-8", "surrogateescape")
+                if line.strip():
+                    await pending.put(await self.submit(line))
+        finally:
+            await pending.put(None)
+            await responder
+            writer.close()
+
+    def _reject_oversized(self) -> "asyncio.Future":
+        future = asyncio.get_running_loop().create_future()
+        future.set_result({
+            "id": None,
+            "ok": False,
+            "error": f"ValueError: request line exceeds {self.line_limit} bytes",
+            "latency_ms": 0.0,
+        })
+        self.stats.record(0.0, False)
+        return future
+
+    async def _respond(self, pending: "asyncio.Queue", writer: asyncio.StreamWriter) -> None:
+        while True:
+            future = await pending.get()
+            if future is None:
+                return
+            response = await future
+            writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8", "surrogateescape"))
+            try:
+                await writer.drain()
+            except ConnectionError:
+                return
+
+
+async def _skip_line(reader: asyncio.StreamReader) -> bool:
+    """Discard input through the next newline; False if the stream ended first."""
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return True
+        except asyncio.IncompleteReadError:
+            return False
+        except asyncio.LimitOverrunError as exc:
+            # The buffered part of the line (up to the newline, if seen) is dropped.
+            await reader.readexactly(exc.consumed)
+
+
+def _stats_request(line: str) -> Optional[Dict[str, Any]]:
+    """Return the decoded request if it asks for service stats, else None."""
+    # Cheap pre-check so ordinary requests are not decoded twice.
+    if STATS_OPERATION not in line:
+        return None
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(request, dict) and request.get("operation") == STATS_OPERATION:
+        return request
+    return None
+
+
+def remove_stale_socket(path: str) -> None:
+    """
+    Remove a socket file left at `path` by an earlier run.
+
+    Raises:
+        FileExistsError: If `path` exists and is not a socket.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"Refusing to replace {path}: it exists and is not a socket")
+    os.unlink(path)
+
+
+def make_executor(pool: str, workers: int) -> Executor:
+    if pool == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    if pool == "thread":
+        _init_worker()
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError("Pool must be 'thread' or 'process'.")
+
+
+async def run_service(
+    socket_path: Optional[str] = None,
+    host: str = DEFAULT_HOST,
+    port: Optional[int] = None,
+    workers: int = 4,
+    pool: str = "thread",
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    line_limit: int = DEFAULT_LINE_LIMIT,
+) -> None:
+    """
+    Serve until cancelled on a Unix socket (`socket_path`) or TCP (`host`, `port`).
+
+    Raises:
+        FileExistsError: If `socket_path` exists and is not a socket.
+    """
+    if socket_path is not None:
+        remove_stale_socket(socket_path)
+    with make_executor(pool, workers) as executor:
+        service = CipherService(executor, workers, queue_size, line_limit)
+        service.start()
+        if socket_path is not None:
+            server = await asyncio.start_unix_server(
+                service.handle_connection, path=socket_path, limit=line_limit
+            )
+            where = socket_path
+        else:
+            server = await asyncio.start_server(
+                service.handle_connection, host=host, port=port, limit=line_limit
+            )
+            where = "{}:{}".format(*server.sockets[0].getsockname()[:2])
+        print(f"[✓] Serving on {where} ({workers} {pool} workers, queue {queue_size})", file=sys.stderr)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await service.stop()
+            print(json.dumps(service.stats.snapshot()), file=sys.stderr)
+            if socket_path is not None:
+                with contextlib.suppress(FileExistsError):
+                    remove_stale_socket(socket_path)
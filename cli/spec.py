@@ -0,0 +1,124 @@
+"""
+Precompiled CLI spec.
+
+The parser layout (ciphers, operations and flags from `cli/config/*.yaml`) and
+the handler entry points (from the `@register_command`/`@register_compiler`
+decorators in `cli/commands/`) are compiled once into `cli/config/spec.json`.
+At start-up the CLI reads that JSON instead of parsing YAML and importing every
+command module; handlers are imported lazily on dispatch.
+
+The spec records a hash of every source file and is rebuilt automatically when
+any of them changes. Regenerate it explicitly with:
+
+    python -m cli.spec
+"""
+
+import hashlib
+import importlib
+import json
+import pkgutil
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from cli.registry import (
+    COMMAND_REGISTRY,
+    COMPILER_REGISTRY,
+    register_compiler_entry_point,
+    register_entry_point,
+)
+
+CLI_DIR = Path(__file__).parent
+CONFIG_DIR = CLI_DIR / "config"
+COMMANDS_DIR = CLI_DIR / "commands"
+SPEC_PATH = CONFIG_DIR / "spec.json"
+SPEC_VERSION = 1
+NON_CIPHER_CONFIGS = ("default",)
+
+
+def _cipher_configs():
+    return sorted(p for p in CONFIG_DIR.glob("*.yaml") if p.stem not in NON_CIPHER_CONFIGS)
+
+
+def source_hashes() -> Dict[str, str]:
+    """SHA-1 of every file the spec is built from, keyed by path relative to `cli/`."""
+    sources = _cipher_configs() + sorted(COMMANDS_DIR.glob("*.py"))
+    return {
+        str(path.relative_to(CLI_DIR)): hashlib.sha1(path.read_bytes()).hexdigest()
+        for path in sources
+    }
+
+
+def _entry_point(fn) -> str:
+    return f"{fn.__module__}:{fn.__name__}"
+
+
+def build_spec() -> Dict[str, Any]:
+    """
+    Build the spec from the YAML configs and the command modules.
+    This parses YAML and imports every handler module, so it is only run when
+    the compiled spec is missing or stale.
+    """
+    from utils.load import load_yaml
+
+    ciphers = {path.stem: load_yaml(path) or {} for path in _cipher_configs()}
+    for module in pkgutil.iter_modules([str(COMMANDS_DIR)]):
+        importlib.import_module(f"cli.commands.{module.name}")
+
+    handlers = {
+        operation: {cipher: _entry_point(fn) for cipher, fn in sorted(entries.items()) if callable(fn)}
+        for operation, entries in sorted(COMMAND_REGISTRY.items())
+    }
+    compilers = {
+        cipher: _entry_point(fn) for cipher, fn in sorted(COMPILER_REGISTRY.items()) if callable(fn)
+    }
+    return {
+        "version": SPEC_VERSION,
+        "sources": source_hashes(),
+        "ciphers": ciphers,
+        "handlers": handlers,
+        "compilers": compilers,
+    }
+
+
+def write_spec(spec: Dict[str, Any], path: Path = SPEC_PATH) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(spec, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def _read_spec(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_spec(path: Path = SPEC_PATH) -> Dict[str, Any]:
+    """
+    Return the compiled spec, rebuilding (and trying to rewrite) it if it is
+    missing, from another spec version or out of date with its sources.
+    """
+    spec = _read_spec(path)
+    if spec is not None and spec.get("version") == SPEC_VERSION and spec.get("sources") == source_hashes():
+        return spec
+    spec = build_spec()
+    try:
+        write_spec(spec, path)
+    except OSError:
+        pass  # read-only install: keep using the in-memory spec
+    return spec
+
+
+def install_entry_points(spec: Dict[str, Any]) -> None:
+    """Register every handler and compiler from the spec for lazy import."""
+    for operation, entries in spec["handlers"].items():
+        for cipher, entry_point in entries.items():
+            register_entry_point(operation, cipher, entry_point)
+    for cipher, entry_point in spec["compilers"].items():
+        register_compiler_entry_point(cipher, entry_point)
+
+
+if __name__ == "__main__":
+    write_spec(build_spec())
+    print(f"[✓] Wrote CLI spec: {SPEC_PATH}")
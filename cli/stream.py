@@ -0,0 +1,157 @@
+"""
+Chunked file/stdin streaming for the CLI.
+
+Input is read in fixed-size chunks (counted in characters). Ciphers with a
+registered compiler are compiled once and each chunk goes through
+`compiled.transform(chunk, offset)`; other commands dispatch each chunk like
+a `--text` invocation, with the running character count as `args.offset`.
+Either way position-dependent ciphers such as Vigenère continue the keyword
+across chunk boundaries and the streamed output matches the one-shot output.
+Memory stays bounded by the chunk size.
+"""
+
+import sys
+from argparse import Namespace
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, TextIO
+
+if TYPE_CHECKING:  # the cipher package is not imported at CLI start-up
+    from cipher.interfaces import CompiledTransform
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # characters (bytes in --binary mode)
+STDIO = "-"
+ENCODING = "utf-8"
+ERRORS = "surrogateescape"  # round-trips bytes that are not valid UTF-8
+STREAMING_OPERATIONS = ("encrypt", "decrypt")
+
+
+@contextmanager
+def open_input(path: Optional[str]) -> Iterator[TextIO]:
+    """Open `path` for reading, or stdin for None/'-'. Newlines are not translated."""
+    if path in (None, STDIO):
+        with open(sys.stdin.fileno(), "r", encoding=ENCODING, errors=ERRORS, newline="", closefd=False) as f:
+            yield f
+    else:
+        with open(path, "r", encoding=ENCODING, errors=ERRORS, newline="") as f:
+            yield f
+
+
+@contextmanager
+def open_output(path: Optional[str]) -> Iterator[TextIO]:
+    """Open `path` for writing, or stdout for None/'-'. Newlines are not translated."""
+    if path in (None, STDIO):
+        sys.stdout.flush()
+        with open(sys.stdout.fileno(), "w", encoding=ENCODING, errors=ERRORS, newline="", closefd=False) as f:
+            yield f
+    else:
+        with open(path, "w", encoding=ENCODING, errors=ERRORS, newline="") as f:
+            yield f
+
+
+def iter_chunks(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Yield successive chunks of at most `chunk_size` characters until EOF."""
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_input_chunks(args: Namespace) -> Iterator[str]:
+    """
+    Yield the command's input as chunks: `--text` as a single chunk,
+    otherwise the `--input` file or stdin read incrementally.
+    """
+    if getattr(args, "text", None) is not None:
+        yield args.text
+        return
+    with open_input(args.input) as src:
+        yield from iter_chunks(src, args.chunk_size)
+
+
+def run_streaming(
+    args: Namespace,
+    handler: Callable[[Namespace], str],
+    compiled: Optional["CompiledTransform"] = None
+) -> int:
+    """
+    Stream `args.input` to `args.output` chunk by chunk.
+
+    With `--jobs` other than 1, one `cipher.parallel.ShardPool` is started for
+    the whole command; it shards `compiled`, or is passed to the handler as
+    `args.shard_pool`.
+
+    Args:
+        args: Parsed CLI arguments.
+        handler: Callable returning the transformed text for one chunk (with
+            `text` and `offset` set); used when `compiled` is None.
+        compiled: The command's compiled transform, applied to every chunk.
+
+    Returns:
+        int: Number of characters processed.
+    """
+    from cipher import profiling
+    from cipher.parallel import ShardPool
+
+    offset = 0
+    jobs = getattr(args, "jobs", 1)
+    with ShardPool(jobs) if jobs != 1 else nullcontext() as pool, \
+            open_input(args.input) as src, open_output(args.output) as dst:
+        for chunk in iter_chunks(src, args.chunk_size):
+            if compiled is None:
+                chunk_args = Namespace(**vars(args))
+                chunk_args.text = chunk
+                chunk_args.offset = offset
+                chunk_args.shard_pool = pool
+                dst.write(handler(chunk_args))
+            else:
+                profiler = profiling.current()
+                if profiler is None:
+                    dst.write(_transform_chunk(compiled, chunk, offset, pool))
+                else:
+                    with profiler.stage(f"{type(compiled).__name__}.transform", args.operation, len(chunk)):
+                        dst.write(_transform_chunk(compiled, chunk, offset, pool))
+            offset += len(chunk)
+    return offset
+
+
+def _transform_chunk(compiled: "CompiledTransform", chunk: str, offset: int, pool) -> str:
+    if pool is not None:
+        return pool.transform(compiled, chunk, offset)
+    return compiled.transform(chunk, offset)[0]
+
+
+def run_binary(args: Namespace, compiled) -> int:
+    """
+    Run a compiled transform in byte mode from `args.input` to `args.output`.
+
+    Regular files are memory-mapped into a preallocated output file; stdin/stdout
+    fall back to chunked binary reads and writes.
+
+    Returns:
+        int: Number of bytes processed.
+    """
+    from cipher.bytemode import ByteCipher
+
+    cipher = ByteCipher.from_compiled(compiled)
+    src, dst = args.input, args.output
+    if src not in (None, STDIO) and dst not in (None, STDIO):
+        return cipher.transform_file(src, dst, args.chunk_size)
+
+    with _open_binary(src, "rb") as reader, _open_binary(dst, "wb") as writer:
+        return cipher.transform_stream(reader, writer, args.chunk_size)
+
+
+@contextmanager
+def _open_binary(path: Optional[str], mode: str):
+    if path in (None, STDIO) and "r" in mode:
+        yield sys.stdin.buffer
+    elif path in (None, STDIO):
+        sys.stdout.flush()
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+    else:
+        with open(path, mode) as f:
+            yield f
@@ -2,7 +2,7 @@
 Language-specific tools for alphabet generation and loading.
 """
 
-from .tools import load_unicode_alphabet, generate_unicode_yaml
+from .tools import load_unicode_alphabet, generate_unicode_yaml, load_letter_frequencies
 
-__all__ = ["load_unicode_alphabet", "generate_unicode_yaml"]
+__all__ = ["load_unicode_alphabet", "generate_unicode_yaml", "load_letter_frequencies"]
 
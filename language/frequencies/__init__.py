@@ -0,0 +1,3 @@
+"""
+Contains language-specific YAML files with letter frequency tables.
+"""
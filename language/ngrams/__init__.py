@@ -0,0 +1,4 @@
+"""
+Stored n-gram language models (`<lang>.<n>.bin`), built with
+`python -m analysis.ngram_store build`.
+"""
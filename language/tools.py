@@ -3,17 +3,20 @@ Language-specific tools for Unicode-based alphabet configuration.
 
 Provides:
 - Loading of language-specific alphabets from YAML
+- Loading of per-language letter frequency tables (`frequencies/*.yaml`)
 - Fallback for Latin-based defaults (A–Z)
 - Generation of YAML alphabet files using Unicode ranges + extras
 
 Used in CLI defaults, cipher setup, and transformation logic.
 """
 
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from utils.load import load_yaml
 
 ALPHABET_DIR = Path(__file__).parent / "alphabets"
+FREQUENCY_DIR = Path(__file__).parent / "frequencies"
 
 
 def load_unicode_alphabet(lang: str = "en") -> List[str]:
@@ -21,30 +24,61 @@ def load_unicode_alphabet(lang: str = "en") -> List[str]:
     Load an alphabet from YAML using a language code.
 
     Supports:
-    - Unicode range: start & end
+    - Unicode ranges: start & end (end exclusive)
     - Extras: additional characters mapped to Unicode code points
 
+    The YAML file is read once per language and process; every call returns
+    a fresh list.
+
     Args:
         lang (str): Language code (e.g. 'en', 'sv', 'el')
 
     Returns:
         List[str]: Alphabet as list of characters
     """
-    path = ALPHABET_DIR / f"{lang.lower()}.yaml"
+    return list(_unicode_alphabet(lang.lower()))
+
+
+@lru_cache(maxsize=None)
+def _unicode_alphabet(lang: str) -> Tuple[str, ...]:
+    path = ALPHABET_DIR / f"{lang}.yaml"
     if not path.exists():
-        return basic_unicode_latin()
+        return tuple(basic_unicode_latin())
 
     config = load_yaml(path)
-    alphabet = []
+    ranges = config.get("range") or []
+    if isinstance(ranges, dict):
+        ranges = [ranges]
+    alphabet = [chr(i) for r in ranges for i in range(r["start"], r["end"])]
+    if isinstance(config.get("extras"), dict):
+        alphabet.extend(chr(cp) for cp in config["extras"].values())
+    return tuple(alphabet)
+
+
+@lru_cache(maxsize=None)
+def _letter_frequencies(lang: str) -> Dict[str, float]:
+    path = FREQUENCY_DIR / f"{lang}.yaml"
+    if not path.exists():
+        raise FileNotFoundError(f"No frequency table for language '{lang}': {path}")
+    letters = load_yaml(path)["letters"]
+    total = sum(letters.values())
+    return {str(letter).upper(): weight / total for letter, weight in letters.items()}
+
 
-    if "range" in config:
-        for r in config["range"]:
-            alphabet.extend([chr(i) for i in range(r["start"], r["end"])])
+def load_letter_frequencies(lang: str = "en") -> Dict[str, float]:
+    """
+    Load the relative letter frequencies for a language.
+
+    Letters are uppercase (frequencies are case-insensitive) and the values
+    are normalized to sum to 1.
 
-    if "extras" in config and isinstance(config["extras"], dict):
-        alphabet.extend([chr(cp) for cp in config["extras"].values()])
+    Args:
+        lang (str): Language code (e.g. 'en', 'sv')
 
-    return alphabet
+    Returns:
+        Dict[str, float]: Letter -> probability
+    """
+    return dict(_letter_frequencies(lang.lower()))
 
 
 def generate_unicode_yaml(
@@ -69,12 +103,10 @@ def generate_unicode_yaml(
     out_dir.mkdir(parents=True, exist_ok=True)
     filepath = out_dir / f"{name.lower()}.yaml"
 
+    # A list of ranges, as `load_unicode_alphabet` and `load_alphabet` read it.
     data: Dict = {
-        "range": {
-            "start": start,
-            "end": end,
-            "name": name
-        }
+        "name": name,
+        "range": [{"start": start, "end": end}],
     }
 
     if extras:
@@ -0,0 +1,81 @@
+"""Shared fixtures for the test modules: alphabets, tables, sample text and cipher stages."""
+
+from cipher import CharmapTable, CipherTransformer, ModularTable, MonoalphabeticCipher, Vigenere
+from cipher.compiled import CompiledCipher
+from utils.alphabet_loader import load_alphabet
+from utils.range_alphabet import RangeAlphabet
+
+GREEK = RangeAlphabet([(0x391, 0x3A2), (0x3A3, 0x3AA), (0x3B1, 0x3C2)], extras=["."])
+
+ALPHABETS = {
+    "en": lambda: load_alphabet("en"),
+    "sv": lambda: load_alphabet("sv"),
+    "range": lambda: GREEK,
+}
+TABLES = {
+    "modular": lambda alphabet: ModularTable.from_alphabet(alphabet, source="test"),
+    "charmap": lambda alphabet: CharmapTable.from_alphabet(list(alphabet), source="test"),
+}
+
+
+def sample_text(alphabet, length=500):
+    """Alphabet symbols interleaved with characters outside it."""
+    symbols = [alphabet[(i * 7) % len(alphabet)] for i in range(length)]
+    for i in range(0, length, 9):
+        symbols[i] = " " if i % 2 else "\n"
+    return "".join(symbols)
+
+
+def keyword_table(alphabet):
+    plain = list(alphabet)
+    key = [plain[5], plain[1], plain[9]]
+    return CharmapTable.from_plain_and_cipher_alphabet(plain, key + [c for c in plain if c not in key], source="test")
+
+
+def build_stages(alphabet, table, text, fast=False, offset=0):
+    """Vigenère, a shift and a keyword substitution over `alphabet`."""
+    keyword = [alphabet[3], alphabet[11], alphabet[4], alphabet[7]]
+    return [
+        Vigenere(text=text, keyword=keyword, alphabet=alphabet, table=table, fast=fast, offset=offset),
+        MonoalphabeticCipher(text=text, key_char=alphabet[2], alphabet=alphabet, table=table, fast=fast),
+        MonoalphabeticCipher(
+            text=text, key_char=alphabet[0], alphabet=alphabet, table=keyword_table(alphabet), fast=fast
+        ),
+    ]
+
+
+def staged(alphabet, table, text, mode, offset=0):
+    return "".join(CipherTransformer(build_stages(alphabet, table, list(text), offset=offset))._run_staged(mode))
+
+
+PLAIN = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, "
+    "it was the age of foolishness, it was the epoch of belief, it was the epoch of incredulity. "
+) * 4
+
+
+def shift_text(text, shift, alphabet):
+    """`text` shifted by `shift` positions of `alphabet`."""
+    table = ModularTable.from_alphabet(alphabet, source="test")
+    return CompiledCipher.from_table(table, [alphabet[shift]], "encrypt")(text)
+
+PROSE = (
+    "There were a king with a large jaw and a queen with a plain face, on the throne of England; "
+    "there were a king with a large jaw and a queen with a fair face, on the throne of France. "
+    "In both countries it was clearer than crystal to the lords of the State preserves of loaves "
+    "and fishes, that things in general were settled for ever. France, less favoured on the whole "
+    "as to matters spiritual than her sister of the shield and trident, rolled with exceeding "
+    "smoothness down hill, making paper money and spending it. Under the guidance of her Christian "
+    "pastors, she entertained herself, besides, with such humane achievements as sentencing a youth "
+    "to have his hands cut off, his tongue torn out with pincers, and his body burned alive, because "
+    "he had not kneeled down in the rain to do honour to a dirty procession of monks which passed "
+    "within his view, at a distance of some fifty or sixty yards. It is likely enough that, rooted "
+    "in the woods of France and Norway, there were growing trees, when that sufferer was put to "
+    "death, already marked by the Woodman, Fate, to come down and be sawn into boards, to make a "
+    "certain movable framework with a sack and a knife in it, terrible in history. It is likely "
+    "enough that in the rough outhouses of some tillers of the heavy lands adjacent to Paris, there "
+    "were sheltered from the weather that very day, rude carts, bespattered with rustic mire, "
+    "snuffed about by pigs, and roosted in by poultry, which the Farmer, Death, had already set "
+    "apart to be his tumbrils of the Revolution. But that Woodman and that Farmer, though they work "
+    "unceasingly, work silently, and no one heard them as they went about with muffled tread."
+)
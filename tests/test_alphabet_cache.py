@@ -0,0 +1,71 @@
+"""Cached alphabet loading (`utils.alphabet_loader`): in-process memo and on-disk compiled files."""
+
+import os
+
+import pytest
+
+from utils import alphabet_loader
+from utils.alphabet_loader import CACHE_DIR_ENV, alphabet_cache_dir, clear_alphabet_cache, load_alphabet
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    clear_alphabet_cache()
+    yield tmp_path / "cache" / "alphabets"
+    clear_alphabet_cache()
+
+
+def write_alphabet(tmp_path, symbols):
+    path = tmp_path / "custom.yaml"
+    path.write_text(f"alphabet: [{', '.join(symbols)}]\n", encoding="utf-8")
+    return path
+
+
+def test_compiled_file_is_written_and_reused(monkeypatch, tmp_path, cache_dir):
+    path = write_alphabet(tmp_path, "ABC")
+    assert load_alphabet(path) == ["A", "B", "C"]
+    assert len(list(cache_dir.iterdir())) == 1
+
+    clear_alphabet_cache()
+    monkeypatch.setattr(alphabet_loader, "load_alphabet_from_yaml", lambda path: pytest.fail("YAML parsed again"))
+    assert load_alphabet(path) == ["A", "B", "C"]
+
+
+def test_changed_file_is_reloaded(tmp_path, cache_dir):
+    path = write_alphabet(tmp_path, "ABC")
+    assert load_alphabet(path) == ["A", "B", "C"]
+    write_alphabet(tmp_path, "ABCD")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_alphabet(path) == ["A", "B", "C", "D"]
+
+
+def test_callers_get_independent_lists(tmp_path, cache_dir):
+    path = write_alphabet(tmp_path, "ABC")
+    load_alphabet(path).append("X")
+    assert load_alphabet(path) == ["A", "B", "C"]
+
+
+def test_corrupt_compiled_file_is_ignored(tmp_path, cache_dir):
+    path = write_alphabet(tmp_path, "ABC")
+    load_alphabet(path)
+    for compiled in cache_dir.iterdir():
+        compiled.write_bytes(b"not marshal")
+    clear_alphabet_cache()
+    assert load_alphabet(path) == ["A", "B", "C"]
+
+
+def test_disk_cache_can_be_disabled(monkeypatch, tmp_path):
+    monkeypatch.setenv(CACHE_DIR_ENV, "")
+    clear_alphabet_cache()
+    assert alphabet_cache_dir() is None
+    assert load_alphabet(write_alphabet(tmp_path, "AB")) == ["A", "B"]
+
+
+def test_shared_tables_are_reused():
+    from cipher import ModularTable
+
+    first = ModularTable.shared(load_alphabet("en"), source="test")
+    assert ModularTable.shared(load_alphabet("en"), source="test") is first
+    assert ModularTable.shared(load_alphabet("sv"), source="test") is not first
@@ -0,0 +1,45 @@
+"""Batch API (`cipher.batch`): many short messages through one compiled cipher."""
+
+import pytest
+
+from cipher import Vigenere
+from cipher.batch import compile_key, decrypt_many, encrypt_many, transform_many
+from tests.support import ALPHABETS, TABLES, sample_text
+from utils.errors import EmptySequenceError
+
+
+@pytest.mark.parametrize("concat", [False, True])
+def test_batch_matches_one_cipher_per_message(concat):
+    alphabet = ALPHABETS["en"]()
+    table = TABLES["modular"](alphabet)
+    messages = [sample_text(alphabet, n) for n in (1, 7, 40, 123)]
+    key = [alphabet[3], alphabet[9], alphabet[1]]
+
+    expected = [
+        "".join(Vigenere(text=list(m), keyword=key, alphabet=alphabet, table=table).encrypt()) for m in messages
+    ]
+    encrypted = list(encrypt_many(messages, key, alphabet, table=table, concat=concat))
+    assert encrypted == expected
+    assert list(decrypt_many(encrypted, key, alphabet, table=table, concat=concat)) == messages
+
+
+@pytest.mark.parametrize("batch_records", [1, 2, 3, 100])
+def test_batches_of_any_size_keep_order(batch_records):
+    alphabet = ALPHABETS["en"]()
+    compiled = compile_key("LEMON", alphabet)
+    messages = [sample_text(alphabet, n) for n in (5, 1, 12, 9, 30)]
+    expected = [compiled.transform(m, 0)[0] for m in messages]
+    assert list(transform_many(compiled, iter(messages), concat=True, batch_records=batch_records)) == expected
+
+
+def test_single_character_key_is_a_shift():
+    alphabet = ALPHABETS["en"]()
+    assert list(encrypt_many(["HELLO", "abc"], "D", alphabet, concat=True)) == ["KHOOR", "def"]
+
+
+def test_invalid_keys_and_batch_sizes_are_rejected():
+    alphabet = ALPHABETS["en"]()
+    with pytest.raises(EmptySequenceError, match="Keyword must not be empty"):
+        compile_key("123", alphabet)
+    with pytest.raises(ValueError):
+        list(transform_many(compile_key("K", alphabet), ["x"], concat=True, batch_records=0))
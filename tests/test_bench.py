@@ -0,0 +1,78 @@
+"""Benchmark suite runner (`bench.suite`): documents, regression comparison and the `bench` command."""
+
+import argparse
+import json
+import sys
+
+import pytest
+
+from bench import suite
+from cli.main import main
+from cli.parser import add_bench_arguments
+
+
+def fake_bench(rate=100.0, fail=False):
+    if fail:
+        raise RuntimeError("boom")
+    return [{"case": "en", "per_s": rate, "seconds": 0.5}]
+
+
+@pytest.fixture
+def fake_suite(monkeypatch):
+    monkeypatch.setattr(suite, "BENCHMARKS", {
+        "fake": ("tests.test_bench", "fake_bench", {}, {"rate": 50.0}),
+        "broken": ("tests.test_bench", "fake_bench", {"fail": True}, {"fail": True}),
+    })
+
+
+def document(**metrics):
+    return {"benchmarks": {"fake": {"results": [{"case": "en", **metrics}]}}}
+
+
+def test_run_suite_records_results_and_errors(fake_suite):
+    result = suite.run_suite(profile="full")
+    assert result["format"] == suite.FORMAT_VERSION and result["profile"] == "full"
+    assert result["benchmarks"]["fake"]["results"] == fake_bench(50.0)
+    assert result["benchmarks"]["broken"]["error"] == "RuntimeError: boom"
+    assert set(result["environment"]) >= {"python", "platform", "cpus", "numpy", "revision"}
+    with pytest.raises(ValueError):
+        suite.run_suite(["missing"])
+    with pytest.raises(ValueError):
+        suite.run_suite(profile="huge")
+
+
+def test_metric_direction():
+    assert [suite.metric_direction(k) for k in ("chars_per_s", "speedup", "seconds", "peak_mb", "case")] == [1, 1, -1, -1, 0]
+
+
+def test_compare_reports_regressions_beyond_threshold():
+    baseline = document(per_s=100.0, seconds=1.0, median_ms=0.5)
+    assert suite.compare(baseline, document(per_s=95.0, seconds=1.05, median_ms=5.0)) == []
+    regressions = suite.compare(baseline, document(per_s=80.0, seconds=1.5, median_ms=5.0))
+    assert [(row["metric"], row["change"]) for row in regressions] == [("per_s", -0.2), ("seconds", -0.5)]
+    assert regressions[0]["case"] == "en"
+    # Rows whose labels differ are not compared.
+    other = {"benchmarks": {"fake": {"results": [{"case": "sv", "per_s": 1.0}]}}}
+    assert suite.compare(baseline, other) == []
+
+
+def test_cli_bench_mirrors_suite_arguments():
+    cli_parser, suite_parser = argparse.ArgumentParser(), argparse.ArgumentParser()
+    add_bench_arguments(cli_parser)
+    suite.add_arguments(suite_parser)
+    for argv in ([], ["tables", "mono", "--profile", "full", "--output", "x.json", "--compare", "b.json",
+                      "--threshold", "0.2", "--list"]):
+        assert cli_parser.parse_args(argv) == suite_parser.parse_args(argv)
+
+
+def test_cli_bench_writes_and_compares(monkeypatch, fake_suite, tmp_path, capsys):
+    output, baseline = tmp_path / "run.json", tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(document(per_s=200.0)), encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", [
+        "cli.main", "bench", "fake", "--output", str(output), "--compare", str(baseline),
+    ])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 1
+    assert json.loads(output.read_text(encoding="utf-8"))["benchmarks"]["fake"]["results"] == fake_bench()
+    assert "1 regression(s) beyond 10%" in capsys.readouterr().err
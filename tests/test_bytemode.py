@@ -0,0 +1,68 @@
+"""Byte mode (`cipher.bytemode`): byte tables, memory-mapped files and streams."""
+
+import io
+import mmap
+
+import pytest
+
+from cipher import CipherTransformer
+from cipher.bytemode import ByteCipher
+from tests.support import ALPHABETS, TABLES, build_stages, sample_text, staged
+
+
+def byte_cipher(mode="encrypt", stages=3):
+    alphabet = ALPHABETS["en"]()
+    stages = build_stages(alphabet, TABLES["modular"](alphabet), ["x"])[:stages]
+    return ByteCipher.from_compiled(CipherTransformer(stages).compile(mode))
+
+
+@pytest.mark.parametrize("lang", ["en", "sv"])
+def test_byte_mode_matches_staged(lang):
+    alphabet = ALPHABETS[lang]()
+    table = TABLES["modular"](alphabet)
+    text = sample_text(alphabet)
+    compiled = CipherTransformer(build_stages(alphabet, table, list(text))).compile("encrypt")
+
+    out, _ = ByteCipher.from_compiled(compiled).transform(text.encode("latin-1"))
+    assert out.decode("latin-1") == staged(alphabet, table, text, "encrypt")
+
+
+@pytest.mark.parametrize("chunk_size", [1, mmap.PAGESIZE, 1 << 20])
+def test_file_and_stream_match_in_memory(tmp_path, chunk_size):
+    cipher = byte_cipher()
+    data = bytes(range(256)) * 97 + b"tail"
+    expected, _ = cipher.transform(data, 3)
+    src, dst = tmp_path / "in.bin", tmp_path / "out.bin"
+    src.write_bytes(data)
+
+    assert cipher.transform_file(str(src), str(dst), chunk_size, offset=3) == len(data)
+    assert dst.read_bytes() == expected
+    out = io.BytesIO()
+    assert cipher.transform_stream(io.BytesIO(data), out, chunk_size, offset=3) == len(data)
+    assert out.getvalue() == expected
+
+
+def test_decrypt_inverts_encrypt():
+    data = sample_text(ALPHABETS["en"]()).encode("latin-1")
+    encrypted, _ = byte_cipher("encrypt", stages=1).transform(data)
+    assert encrypted != data and byte_cipher("decrypt", stages=1).transform(encrypted)[0] == data
+
+
+def test_empty_file(tmp_path):
+    src, dst = tmp_path / "in.bin", tmp_path / "out.bin"
+    src.write_bytes(b"")
+    assert byte_cipher().transform_file(str(src), str(dst)) == 0 and dst.read_bytes() == b""
+
+
+def test_same_input_and_output_is_refused(tmp_path):
+    src = tmp_path / "in.bin"
+    src.write_bytes(b"abc")
+    with pytest.raises(ValueError):
+        byte_cipher().transform_file(str(src), str(src))
+
+
+def test_alphabet_beyond_latin1_is_refused():
+    alphabet = ALPHABETS["range"]()
+    compiled = CipherTransformer(build_stages(alphabet, TABLES["modular"](alphabet), ["x"])).compile("encrypt")
+    with pytest.raises(ValueError, match="Byte mode"):
+        ByteCipher.from_compiled(compiled)
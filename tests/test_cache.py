@@ -0,0 +1,111 @@
+"""Compiled-cipher cache (`cipher.cache`): shared entries, LRU eviction, stats and thread safety."""
+
+import threading
+
+import pytest
+
+from cipher import CipherCache, compile_cached
+from cipher.cache import alphabet_fingerprint, estimate_size, table_fingerprint
+from cipher.compiled import CompiledCipher
+from tests.support import ALPHABETS, TABLES, keyword_table, sample_text
+
+ALPHABET = ALPHABETS["en"]()
+TABLE = TABLES["modular"](ALPHABET)
+
+
+def compiler(keyword, calls=None):
+    def compile():
+        if calls is not None:
+            calls.append(keyword)
+        return CompiledCipher.from_table(TABLE, [keyword], "encrypt")
+    return compile
+
+
+@pytest.mark.parametrize("mode", ["encrypt", "decrypt"])
+def test_cache_matches_fresh_compile(mode):
+    text = sample_text(ALPHABET)
+    keyword = [ALPHABET[4], ALPHABET[0], ALPHABET[17]]
+
+    for table in (TABLES["modular"](ALPHABET), TABLES["charmap"](ALPHABET)):
+        assert compile_cached(table, keyword, mode)(text) == CompiledCipher.from_table(table, keyword, mode)(text)
+    # Tables that produce the same rows share one entry.
+    assert compile_cached(TABLES["modular"](ALPHABET), keyword, mode) \
+        is compile_cached(TABLES["charmap"](ALPHABET), keyword, mode)
+    first, second = keyword_table(ALPHABET), keyword_table(ALPHABET)
+    assert compile_cached(first, [ALPHABET[0]], mode) is compile_cached(second, [ALPHABET[0]], mode)
+    assert compile_cached(first, [ALPHABET[0]], mode)(text) \
+        == CompiledCipher.from_table(first, [ALPHABET[0]], mode)(text)
+
+
+def test_fingerprints():
+    assert alphabet_fingerprint(ALPHABET) == alphabet_fingerprint(list(ALPHABET))
+    assert alphabet_fingerprint(ALPHABET) != alphabet_fingerprint(ALPHABET[::-1])
+    assert table_fingerprint(TABLE) == table_fingerprint(TABLES["charmap"](ALPHABET))
+    assert table_fingerprint(TABLE) != table_fingerprint(keyword_table(ALPHABET))
+
+
+def test_hits_misses_and_clear():
+    cache, calls = CipherCache(), []
+    first = cache.get_or_compile("A", compiler("A", calls))
+    assert cache.get_or_compile("A", compiler("A", calls)) is first
+    cache.get_or_compile("B", compiler("B", calls))
+    stats = cache.stats()
+    assert calls == ["A", "B"]
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 2, 0, 2)
+    assert stats.bytes == estimate_size(first) + estimate_size(cache.get_or_compile("B", compiler("B")))
+    assert stats.hit_rate == pytest.approx(1 / 3) and stats.as_dict()["hit_rate"] == 0.3333
+
+    cache.clear()
+    assert cache.stats().as_dict() == {
+        "hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0,
+        "max_bytes": cache.max_bytes, "hit_rate": 0.0,
+    }
+    assert cache.get_or_compile("A", compiler("A", calls)) is not first
+
+
+def test_least_recently_used_entry_is_evicted():
+    size = estimate_size(compiler("A")())
+    cache, calls = CipherCache(max_bytes=2 * size + size // 2), []
+    cache.get_or_compile("A", compiler("A", calls))
+    cache.get_or_compile("B", compiler("B", calls))
+    cache.get_or_compile("A", compiler("A", calls))  # A is now the most recent
+    cache.get_or_compile("C", compiler("C", calls))
+    assert cache.stats().evictions == 1 and cache.stats().entries == 2
+    cache.get_or_compile("A", compiler("A", calls))
+    cache.get_or_compile("B", compiler("B", calls))
+    assert calls == ["A", "B", "C", "B"]
+    assert cache.stats().bytes <= cache.max_bytes
+
+
+def test_zero_budget_disables_caching():
+    cache, calls = CipherCache(max_bytes=0), []
+    assert cache.get_or_compile("A", compiler("A", calls)) is not cache.get_or_compile("A", compiler("A", calls))
+    stats = cache.stats()
+    assert calls == ["A", "A"]
+    assert (stats.misses, stats.entries, stats.bytes, stats.evictions) == (2, 0, 0, 0)
+
+
+def test_concurrent_lookups_share_one_entry():
+    cache = CipherCache()
+    keys = ALPHABET[:8]
+    results = {key: [] for key in keys}
+    barrier = threading.Barrier(8)
+
+    def work():
+        barrier.wait()
+        for _ in range(20):
+            for key in keys:
+                results[key].append(cache.get_or_compile(key, compiler(key)))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 8 * 20 * len(keys)
+    assert stats.entries == len(keys)
+    for compiled in results.values():
+        # Concurrent first misses may compile twice, but all return the stored entry.
+        assert all(entry is compiled[0] for entry in compiled)
@@ -0,0 +1,82 @@
+"""Dictionary attack on keyword ciphers (`analysis.dictionary`) and `analyze ... --wordlist` output."""
+
+import sys
+from argparse import Namespace
+
+import pytest
+
+from analysis import dictionary
+from analysis.dictionary import candidate_normalizer, compile_decryption, dictionary_attack, text_scorer
+from analysis.ngrams import NgramModel
+from cipher import ModularTable
+from cipher.compiled import CompiledCipher
+from cli.commands.mono_helpers import run_mono_variant
+from cli.main import main
+from tests.support import PROSE
+from utils.alphabet_loader import load_alphabet
+
+ALPHABET = load_alphabet("en")
+MODEL = NgramModel.from_corpus([PROSE], ALPHABET)
+WORDS = ["apple", "Banana", "cherry", "Lemons", "LEMON", "melon", "  grape ", "kiwi", "123", "", "Krypto"]
+
+
+def encrypt(text, keyword, variant):
+    """Encrypt as the CLI does with `--keyword keyword`."""
+    if variant == "vigenere":
+        table = ModularTable.shared(ALPHABET, source="test")
+        return CompiledCipher.from_table(table, list(keyword.upper()), "encrypt")(text)
+    return run_mono_variant(Namespace(text=text, lang="en", jobs=1, keyword=keyword), "encrypt", variant)
+
+
+def test_candidate_normalizer():
+    vigenere = candidate_normalizer("vigenere", ALPHABET)
+    assert vigenere("Lemons!") == ("LEMONS",)
+    assert vigenere("look") == ("LOK",)
+    assert vigenere("123") == ()
+    keywordmono = candidate_normalizer("keywordmono", ALPHABET)
+    assert keywordmono("Krypto") == ("KRYPTO", "Krypto")
+    assert keywordmono("KEY") == ("KEY",)
+    assert keywordmono("éé") == ()
+    with pytest.raises(ValueError):
+        candidate_normalizer("caesar", ALPHABET)
+
+
+@pytest.mark.parametrize("variant, word", [("vigenere", "Lemons"), ("keywordmono", "KRYPTO"), ("keywordmono", "Krypto")])
+def test_compile_decryption_inverts_the_cli(variant, word):
+    key = candidate_normalizer(variant, ALPHABET)(word)[-1]
+    assert compile_decryption(key, variant, ALPHABET)(encrypt(PROSE, word, variant)) == PROSE
+
+
+def test_text_scorer_matches_model():
+    assert text_scorer(MODEL)(PROSE) == pytest.approx(MODEL.score_text(PROSE))
+
+
+@pytest.mark.parametrize("variant, word, key", [("vigenere", "lemon", "LEMON"), ("keywordmono", "Krypto", "Krypto")])
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_dictionary_attack_finds_the_keyword(monkeypatch, variant, word, key, jobs):
+    monkeypatch.setattr(dictionary, "BATCH_SIZE", 3)
+    result = dictionary_attack(encrypt(PROSE, word, variant), iter(WORDS), ALPHABET, MODEL, variant, promote=4, jobs=jobs)
+    assert result.best.keyword == key
+    assert result.words_read == len(WORDS)
+    expected = {k for w in WORDS for k in candidate_normalizer(variant, ALPHABET)(w.strip())}
+    assert result.keys_tried == len(expected)
+    assert len(result.candidates) == 4
+    assert [c.score for c in result.candidates] == sorted((c.score for c in result.candidates), reverse=True)
+    with pytest.raises(ValueError):
+        dictionary_attack(PROSE, WORDS, ALPHABET, MODEL, "caesar")
+
+
+def test_analyze_vigenere_wordlist_cli(monkeypatch, capsys, tmp_path):
+    corpus, wordlist = tmp_path / "corpus.txt", tmp_path / "words.txt"
+    corpus.write_text(PROSE, encoding="utf-8")
+    wordlist.write_text("\n".join(WORDS), encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", [
+        "cli.main", "analyze", "vigenere", "--text", encrypt(PROSE, "melon", "vigenere"), "--lang", "en",
+        "--wordlist", str(wordlist), "--corpus", str(corpus), "--top", "2",
+    ])
+    main()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "keyword\tsample\tscore" and lines[1].startswith("MELON\t")
+    assert lines[3].startswith(f"keywords: {len(WORDS)} read, ")
+    label, preview = lines[4].split(": ", 1)
+    assert label == "preview (MELON)" and preview and PROSE.startswith(preview)
@@ -0,0 +1,87 @@
+"""Integer-encoded text (`cipher.encoded`): round trips, periodic permutations and encoded pipelines."""
+
+import random
+
+import pytest
+
+from cipher import CipherTransformer, EncodedText
+from cipher import encoded as module
+from cipher.encoded import index_typecode, translation_permutation
+from tests.support import ALPHABETS, TABLES, build_stages, sample_text, staged
+
+SIZES = {"B": 26, "H": 300, "I": 70_000}
+
+
+def alphabet_of(typecode):
+    return [chr(0x10000 + i) for i in range(SIZES[typecode])] if typecode == "I" \
+        else [chr(0x100 + i) for i in range(SIZES[typecode])]
+
+
+def reference(text, alphabet, permutations, offset):
+    position = {symbol: i for i, symbol in enumerate(alphabet)}
+    period = len(permutations)
+    return "".join(
+        alphabet[permutations[(i + offset) % period][position[c]]] if c in position else c
+        for i, c in enumerate(text)
+    )
+
+
+def test_index_typecode():
+    assert [index_typecode(size) for size in (1, 255, 256, 65_535, 65_536)] == ["B", "B", "H", "H", "I"]
+
+
+@pytest.mark.parametrize("typecode", SIZES)
+def test_round_trip(typecode):
+    alphabet = alphabet_of(typecode)
+    text = sample_text(alphabet, 500) + "\n€ \U0001F600" + alphabet[-1]
+    encoded = EncodedText.encode(text, alphabet)
+    assert encoded.indices.typecode == typecode and len(encoded) == len(text)
+    assert encoded.decode() == str(encoded) == text
+    assert EncodedText.encode(list(text), alphabet).decode() == text
+    assert EncodedText.encode("", alphabet).decode() == ""
+
+
+@pytest.mark.parametrize("typecode", SIZES)
+@pytest.mark.parametrize("period", [1, 3, 7])
+@pytest.mark.parametrize("offset", [0, 5])
+@pytest.mark.parametrize("numpy", [False, True])
+def test_permute_matches_reference(monkeypatch, typecode, period, offset, numpy):
+    if not numpy:
+        monkeypatch.setattr(module.vectorized, "HAVE_NUMPY", False)
+    alphabet = alphabet_of(typecode)
+    rng = random.Random(period)
+    permutations = [rng.sample(range(len(alphabet)), len(alphabet)) for _ in range(period)]
+    text = sample_text(alphabet, 400) + " , \n" + sample_text(alphabet, 100)
+    result = EncodedText.encode(text, alphabet).permute(permutations, offset)
+    assert result.decode() == reference(text, alphabet, permutations, offset)
+    shifted = EncodedText.encode(text, alphabet).shift([1, 2], offset)
+    assert shifted.decode() == reference(
+        text, alphabet, [[(j + s) % len(alphabet) for j in range(len(alphabet))] for s in (1, 2)], offset)
+
+
+def test_permute_rejects_bad_schedules():
+    encoded = EncodedText.encode("abc", "abc")
+    with pytest.raises(ValueError):
+        encoded.permute([])
+    with pytest.raises(ValueError):
+        encoded.permute([[0, 1]])
+
+
+def test_translation_permutation():
+    alphabet = "abc"
+    assert translation_permutation(str.maketrans("abc", "bca"), alphabet) == [1, 2, 0]
+    assert translation_permutation(str.maketrans("a", "b"), alphabet) == [1, 1, 2]
+    assert translation_permutation(str.maketrans("a", "x"), alphabet) is None
+
+
+@pytest.mark.parametrize("lang", ALPHABETS)
+@pytest.mark.parametrize("mode", ["encrypt", "decrypt"])
+def test_encoded_stages_match_staged(lang, mode):
+    alphabet = ALPHABETS[lang]()
+    table = TABLES["modular"](alphabet)
+    text = sample_text(alphabet)
+    encoded = EncodedText.encode(text, alphabet)
+
+    result = CipherTransformer(build_stages(alphabet, table, encoded)).run(mode)
+    assert isinstance(result, EncodedText)
+    assert result.decode() == staged(alphabet, table, text, mode)
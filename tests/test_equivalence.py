@@ -0,0 +1,47 @@
+"""
+Equivalence of the optimized engines with the staged (per-character) baseline.
+
+`CipherTransformer._run_staged` runs each `CipherBit` on the previous stage's
+output with plain symbol maps; compiled and fused pipelines, `fast` stages and
+`EncodedText` runs must produce the same text. The other engines are checked
+against the same baseline in their own modules (`test_parallel.py`,
+`test_bytemode.py`, `test_batch.py`, `test_encoded.py`, `test_cache.py`).
+"""
+
+import pytest
+
+from cipher import CipherTransformer, MonoalphabeticCipher, Vigenere
+from tests.support import ALPHABETS, TABLES, build_stages, sample_text, staged
+
+
+@pytest.mark.parametrize("lang", ALPHABETS)
+@pytest.mark.parametrize("kind", TABLES)
+@pytest.mark.parametrize("mode", ["encrypt", "decrypt"])
+@pytest.mark.parametrize("fast", [False, True])
+@pytest.mark.parametrize("encode", [False, True])
+def test_pipeline_matches_staged(lang, kind, mode, fast, encode):
+    alphabet = ALPHABETS[lang]()
+    table = TABLES[kind](alphabet)
+    text = sample_text(alphabet)
+    expected = staged(alphabet, table, text, mode, offset=5)
+
+    stages = build_stages(alphabet, table, list(text), fast=fast, offset=5)
+    assert "".join(CipherTransformer(stages, encode=encode).run(mode)) == expected
+
+
+@pytest.mark.parametrize("kind", TABLES)
+@pytest.mark.parametrize("fast", [False, True])
+def test_multi_character_symbols_fall_back_to_staged(kind, fast):
+    alphabet = ["CH", "A", "B", "C", "D"]
+    table = TABLES[kind](alphabet)
+    text = ["A", "B", "x", "C", "D", "CH"]
+
+    def stages():
+        return [
+            Vigenere(text=text, keyword=["A", "B"], alphabet=alphabet, table=table, fast=fast),
+            MonoalphabeticCipher(text=text, key_char="B", alphabet=alphabet, table=table, fast=fast),
+        ]
+
+    expected = CipherTransformer(stages())._run_staged("encrypt")
+    assert CipherTransformer(stages()).run("encrypt") == expected
+    assert CipherTransformer(stages()).run("encrypt") != text
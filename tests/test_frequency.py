@@ -0,0 +1,59 @@
+"""Frequency analysis: symbol and n-gram counting (`analysis.counting`) and shift recovery."""
+
+import sys
+from collections import Counter
+
+import pytest
+
+from analysis import counting
+from analysis.counting import count_ngrams, count_symbols, count_symbols_stream, fold_counts
+from analysis.shift import recover_shift
+from cli.main import main
+from tests.support import ALPHABETS, PLAIN, sample_text, shift_text as encrypt
+from utils.alphabet_loader import load_alphabet
+
+
+@pytest.mark.parametrize("lang", ALPHABETS)
+@pytest.mark.parametrize("numpy", [False, True])
+def test_count_symbols_matches_counter(monkeypatch, lang, numpy):
+    if not numpy:
+        monkeypatch.setattr(counting.vectorized, "HAVE_NUMPY", False)
+    alphabet = ALPHABETS[lang]()
+    text = sample_text(alphabet, 2000) + "€\U0001F600"
+    counter = Counter(text)
+    assert count_symbols(text, alphabet) == [counter[s] for s in alphabet]
+    chunks = [text[i:i + 333] for i in range(0, len(text), 333)]
+    assert count_symbols_stream(chunks, alphabet) == count_symbols(text, alphabet)
+
+
+def test_count_ngrams_spans_chunks_and_drops_other_characters():
+    alphabet = load_alphabet("en")
+    chunks = ["He l", "", "lo Wo", "rld"]
+    expected = Counter("HELLOWORLD"[i:i + 3] for i in range(8))
+    assert count_ngrams(chunks, 3, alphabet) == expected
+    assert count_ngrams(["ab", "c"], 1, fold_case=False) == Counter("abc")
+    with pytest.raises(ValueError):
+        count_ngrams(["abc"], 0)
+
+
+def test_fold_counts_merges_case():
+    assert fold_counts([1, 2, 3, 4], ["A", "B", "a", "b"]) == {"A": 4, "B": 6}
+
+
+@pytest.mark.parametrize("shift", [1, 13, 30])
+def test_recover_shift_ranks_true_shift_first(shift):
+    alphabet = load_alphabet("en")
+    chunks = [encrypt(PLAIN, shift, alphabet)[i:i + 50] for i in range(0, len(PLAIN), 50)]
+    assert recover_shift(chunks, alphabet, "en")[0].shift == shift
+
+
+def test_analyze_rot_cli(monkeypatch, capsys):
+    alphabet = load_alphabet("en")
+    monkeypatch.setattr(sys, "argv", [
+        "cli.main", "analyze", "rot", "--text", encrypt(PLAIN, 11, alphabet), "--lang", "en", "--top", "3",
+    ])
+    main()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "shift\tkey\tchi2" and len(lines) == 5
+    assert lines[1].startswith("11\tL\t")
+    assert lines[-1] == f"preview (shift 11): {PLAIN[:80]}"
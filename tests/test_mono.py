@@ -0,0 +1,43 @@
+"""Monoalphabetic CLI handlers (`cli.commands.mono_helpers`): the str.translate fast path and its fallback."""
+
+from argparse import Namespace
+
+import pytest
+
+from cipher import ModularTable, MonoalphabeticCipher
+from cli.commands import mono_helpers
+from cli.commands.mono_helpers import run_mono_variant
+
+MULTI = ["CH", "A", "B", "C", "D"]
+
+
+def cli_args(text, **flags):
+    return Namespace(text=text, lang="en", jobs=1, shift=3, key_char="K", keyword="ZEBRA", **flags)
+
+
+@pytest.mark.parametrize("variant", ["rot", "caesar", "mono", "keywordmono"])
+@pytest.mark.parametrize("mode", ["encrypt", "decrypt"])
+def test_fast_path_matches_symbol_map(variant, mode):
+    text = "The quick brown fox, jumps over the lazy dog!\n" * 3
+    table, key_char, mono_alphabet = mono_helpers.build_mono_table(cli_args(text), variant)
+    cipher = MonoalphabeticCipher(text=list(text), key_char=key_char, alphabet=mono_alphabet, table=table)
+    assert run_mono_variant(cli_args(text), mode, variant) == "".join(cipher(mode))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("mode", ["encrypt", "decrypt"])
+def test_multi_character_symbols_fall_back(monkeypatch, jobs, mode):
+    monkeypatch.setattr(mono_helpers, "load_alphabet_view", lambda lang=None: list(MULTI))
+    text = "ABxCD"
+    table = ModularTable.from_alphabet(MULTI, source="test")
+    cipher = MonoalphabeticCipher(text=text, key_char=MULTI[1], alphabet=MULTI, table=table)
+    args = cli_args(text)
+    args.shift, args.jobs = 1, jobs
+    assert run_mono_variant(args, mode, "rot") == "".join(cipher(mode))
+
+
+def test_rot_round_trip():
+    text = "Hello, World"
+    encrypted = run_mono_variant(cli_args(text), "encrypt", "rot")
+    assert encrypted == "Khoor, Zruog"
+    assert run_mono_variant(cli_args(encrypted), "decrypt", "rot") == text
@@ -0,0 +1,65 @@
+"""N-gram tables and models (`analysis.ngrams`) and stored models (`analysis.ngram_store`)."""
+
+import pickle
+from collections import Counter
+
+import pytest
+
+from analysis import ngram_store
+from analysis.ngram_store import build_model, load_model, save_model
+from analysis.ngrams import NgramModel, _count_table_python, count_ngram_table, model_letters
+from tests.support import PROSE
+
+LETTERS = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+
+
+@pytest.mark.parametrize("chunks", [["ab", "cdefg"], list("abcde"), ["a", "", "bcd", "e", "fgh"], ["hello world", "x"]])
+@pytest.mark.parametrize("n", [1, 2, 3, 4])
+def test_ngram_counts_match_python(chunks, n):
+    assert count_ngram_table(chunks, LETTERS, n) == _count_table_python(chunks, LETTERS, n)
+
+
+def test_model_matches_counts():
+    letters = "".join(c for c in PROSE.upper() if c in LETTERS)
+    counts = Counter(letters[i:i + 2] for i in range(len(letters) - 1))
+    model = NgramModel.from_corpus([PROSE[:700], PROSE[700:]], LETTERS, n=2)
+    assert model.scores == NgramModel.from_table(count_ngram_table([PROSE], LETTERS, 2), LETTERS, 2).scores
+    assert model.scores == NgramModel.from_counts(counts, LETTERS, 2).scores
+    assert model.letters == model_letters(["b", "A", "a", "B"] + LETTERS) == tuple(LETTERS)
+    assert model.scores[model.index([19, 7])] > model.scores[model.index([16, 16])] == model.floor
+    with pytest.raises(ValueError):
+        NgramModel.from_corpus(["123"], LETTERS)
+
+
+def test_stored_model_round_trip(tmp_path):
+    model = NgramModel.from_corpus([PROSE], LETTERS, n=3)
+    path = save_model(model, tmp_path / "models" / "en.3.bin")
+    loaded = load_model(path)
+    assert (loaded.letters, loaded.n, loaded.path) == (model.letters, model.n, path)
+    assert loaded.floor == pytest.approx(model.floor, rel=1e-6)
+    assert list(loaded.scores) == pytest.approx(model.scores, rel=1e-6)
+    assert loaded.score_text(PROSE) == pytest.approx(model.score_text(PROSE), rel=1e-5)
+    # Stored models pickle as their path.
+    assert list(pickle.loads(pickle.dumps(loaded)).scores) == list(loaded.scores)
+
+
+def test_stored_model_rejects_bad_files(tmp_path):
+    path = save_model(NgramModel.from_corpus([PROSE], LETTERS, n=2), tmp_path / "en.2.bin")
+    data = path.read_bytes()
+    (tmp_path / "magic.bin").write_bytes(b"XXXX" + data[4:])
+    (tmp_path / "short.bin").write_bytes(data[:-4])
+    for name in ("magic.bin", "short.bin"):
+        with pytest.raises(ValueError):
+            load_model(tmp_path / name)
+
+
+def test_build_and_info(monkeypatch, tmp_path, capsys):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text(PROSE, encoding="utf-8")
+    monkeypatch.setattr(ngram_store, "NGRAM_DIR", tmp_path / "ngrams")
+    ngram_store.main(["build", "--lang", "en", "--corpus", str(corpus), "--n", "2"])
+    path = tmp_path / "ngrams" / "en.2.bin"
+    assert capsys.readouterr().out.strip() == f"[✓] Wrote 2-gram model: {path}"
+    assert list(load_model(path).scores) == pytest.approx(build_model([PROSE], "en", 2).scores, rel=1e-6)
+    ngram_store.main(["info", str(path)])
+    assert capsys.readouterr().out.startswith("n=2 letters=")
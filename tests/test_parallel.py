@@ -0,0 +1,47 @@
+"""Process-sharded transforms (`cipher.parallel`)."""
+
+import pytest
+
+from cipher import CipherTransformer
+from cipher.parallel import MIN_PARALLEL_CHARS, ShardPool, parallel_transform, shard_bounds
+from cli.parser import build_parser
+from tests.support import ALPHABETS, TABLES, build_stages, sample_text, staged
+
+
+def test_parallel_shards_match_staged():
+    alphabet = ALPHABETS["sv"]()
+    table = TABLES["modular"](alphabet)
+    text = sample_text(alphabet, MIN_PARALLEL_CHARS + 1001)
+    compiled = CipherTransformer(build_stages(alphabet, table, list(text))).compile("encrypt")
+    expected = staged(alphabet, table, text, "encrypt")
+
+    with ShardPool(2) as pool:
+        assert parallel_transform(compiled, text, pool=pool) == expected
+        # The pool and its buffers are reused for a second, shorter input.
+        tail = text[:MIN_PARALLEL_CHARS + 10]
+        assert parallel_transform(compiled, tail, offset=3, pool=pool) == compiled.transform(tail, 3)[0]
+
+
+@pytest.mark.parametrize("length, jobs, period", [(10, 3, 1), (100, 4, 7), (5, 8, 1), (64, 2, 64), (0, 2, 1)])
+def test_shard_bounds_cover_text_on_period_boundaries(length, jobs, period):
+    bounds = shard_bounds(length, jobs, period)
+    assert len(bounds) <= jobs
+    covered = [i for start, end in bounds for i in range(start, end)]
+    assert covered == list(range(length))
+    assert all(start % period == 0 for start, _ in bounds)
+
+
+def test_small_inputs_skip_the_pool():
+    alphabet = ALPHABETS["en"]()
+    compiled = CipherTransformer(build_stages(alphabet, TABLES["modular"](alphabet), ["x"])).compile("encrypt")
+    with ShardPool(2) as pool:
+        text = sample_text(alphabet, 1000)
+        assert pool.transform(compiled, text, 5) == compiled.transform(text, 5)[0]
+        assert pool._executor is None
+
+
+def test_negative_jobs_are_rejected():
+    with pytest.raises(ValueError):
+        ShardPool(-1)
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["encrypt", "rot", "--text", "x", "--shift", "1", "--jobs", "-2"])
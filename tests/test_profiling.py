@@ -0,0 +1,64 @@
+"""Per-stage profiling (`cipher.profiling`) and the CLI `--profile` flag."""
+
+import sys
+
+import pytest
+
+from cipher import CipherTransformer, ModularTable, MonoalphabeticCipher, Vigenere
+from cipher.profiling import Profiler
+from cli.main import main
+from utils.alphabet_loader import load_alphabet
+
+
+def run_cli(monkeypatch, capsys, *argv):
+    monkeypatch.setattr(sys, "argv", ["cli.main", *argv])
+    main()
+    return capsys.readouterr()
+
+
+def report_stages(report):
+    """Stage names of a `Profiler.report()` table."""
+    return [line.split("\t")[0] for line in report.splitlines()[1:]]
+
+
+@pytest.mark.parametrize("cipher, flags", [
+    ("rot", ["--shift", "3"]),
+    ("caesar", []),
+    ("mono", ["--key_char", "K"]),
+    ("keywordmono", ["--keyword", "ZEBRA"]),
+])
+def test_profile_reports_mono_stage(monkeypatch, capsys, cipher, flags):
+    out = run_cli(monkeypatch, capsys, "encrypt", cipher, "--text", "Hello World", "--lang", "en", "--profile", *flags)
+    stages = report_stages(out.err)
+    assert stages == ["MonoalphabeticCipher", f"cli encrypt {cipher}"]
+
+
+def test_profile_reports_pipeline_stages(monkeypatch, capsys):
+    out = run_cli(monkeypatch, capsys, "encrypt", "vigenere", "--text", "Hello World", "--keyword", "KEY",
+                  "--lang", "en", "--profile")
+    assert out.out == "RiJvs gsPvh\n"
+    assert report_stages(out.err) == ["stage 0: Vigenere", "CipherTransformer", "cli encrypt vigenere"]
+
+
+def test_profiler_records_chars_and_memory():
+    alphabet = load_alphabet("en")
+    table = ModularTable.from_alphabet(alphabet, source="test")
+    text = list("Attack at dawn" * 50)
+    stages = [
+        Vigenere(text=text, keyword=list("LEMON"), alphabet=alphabet, table=table),
+        MonoalphabeticCipher(text=text, key_char="D", alphabet=alphabet, table=table),
+    ]
+    seen = []
+    with Profiler(callback=seen.append, trace_memory=True) as profiler:
+        CipherTransformer(stages).run("encrypt")
+    assert seen == profiler.stages
+    assert [s.name for s in profiler.stages][-1] == "CipherTransformer"
+    assert all(s.chars == len(text) and s.alloc_peak is not None for s in profiler.stages)
+
+
+def test_no_profiler_outside_block():
+    from cipher import profiling
+
+    with Profiler():
+        assert profiling.current() is not None
+    assert profiling.current() is None
@@ -0,0 +1,57 @@
+"""`rot_text` (`utils.quick`) and its translation-table cache."""
+
+import pytest
+
+from utils.errors import EmptySequenceError
+from utils.quick import clear_rot_cache, rot_cache_info, rot_text
+from utils.range_alphabet import RangeAlphabet
+
+UPPER = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_rot_cache()
+    yield
+    clear_rot_cache()
+
+
+def test_rotates_language_alphabet():
+    assert rot_text("HELLO, world", 3, lang="en") == "KHOOR, zruog"
+    assert rot_text("KHOOR", -3, lang="EN") == "HELLO"
+
+
+@pytest.mark.parametrize("alphabet", [UPPER, list(UPPER), "".join(UPPER), RangeAlphabet([(65, 91)])],
+                         ids=["tuple", "list", "str", "range"])
+def test_custom_alphabets(alphabet):
+    assert rot_text("HELLO world", 13, alphabet) == "URYYB world"
+
+
+def test_equivalent_shifts_share_one_table():
+    for shift in (3, 3 + 52, 3 - 52, 3 + 52 * 10):
+        assert rot_text("HELLO", shift, lang="en") == "KHOOR"
+    info = rot_cache_info()
+    assert (info.misses, info.hits, info.currsize) == (1, 3, 1)
+
+
+@pytest.mark.parametrize("alphabet", [UPPER, RangeAlphabet([(65, 91)])], ids=["tuple", "range"])
+def test_immutable_alphabet_is_cached(alphabet):
+    for shift in (1, 27, 1):
+        rot_text("ABC", shift, alphabet)
+    assert (rot_cache_info().misses, rot_cache_info().hits) == (1, 2)
+
+
+def test_list_alphabet_changes_are_seen():
+    alphabet = list("ABC")
+    assert rot_text("ABC", 1, alphabet) == "BCA"
+    alphabet.append("D")
+    assert rot_text("ABC", 1, alphabet) == "BCD"
+
+
+def test_multi_character_symbols_are_left_out():
+    assert rot_text("ACHB", 1, ["A", "CH", "B"]) == "CHCHA"
+
+
+def test_empty_alphabet_is_rejected():
+    with pytest.raises(EmptySequenceError):
+        rot_text("ABC", 1, [])
@@ -0,0 +1,110 @@
+"""`RangeAlphabet` and the alphabet loaders that produce it."""
+
+import pytest
+
+from cipher import ModularTable
+from cipher.vigenere import normalize_keyword
+from utils.alphabet_loader import (
+    CACHE_DIR_ENV,
+    clear_alphabet_cache,
+    load_alphabet,
+    load_alphabet_from_yaml,
+    load_alphabet_view,
+    load_range_alphabet,
+)
+from utils.range_alphabet import RangeAlphabet
+
+GREEK = RangeAlphabet([(0x391, 0x3A2), (0x3A3, 0x3AA), (0x3B1, 0x3C2)], extras=[".", "Α"])
+
+
+@pytest.fixture(autouse=True)
+def no_disk_cache(monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, "")
+    clear_alphabet_cache()
+    yield
+    clear_alphabet_cache()
+
+
+def write_yaml(tmp_path, text, name="custom.yaml"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_sequence_operations_match_list():
+    symbols = list(GREEK)
+    assert len(GREEK) == len(symbols) == 17 + 7 + 17 + 1  # "Α" is already in a range
+    assert GREEK == symbols and GREEK[-1] == "." and GREEK[5:9] == symbols[5:9]
+    for i, symbol in enumerate(symbols):
+        assert GREEK[i] == symbol and GREEK.index(symbol) == i and symbol in GREEK
+    assert "A" not in GREEK and GREEK.index_of("Ϊ") is None and GREEK.get("A", -1) == -1
+    with pytest.raises(ValueError):
+        GREEK.index("A")
+    with pytest.raises(IndexError):
+        GREEK[len(GREEK)]
+
+
+def test_ranges_keep_their_order():
+    alphabet = RangeAlphabet([(97, 100), (65, 68)])
+    assert list(alphabet) == list("abcABC") and alphabet.index("A") == 3
+
+
+def test_overlapping_ranges_are_rejected():
+    with pytest.raises(ValueError, match="overlap"):
+        RangeAlphabet([(65, 70), (68, 72)])
+
+
+def test_from_symbols_compresses_runs():
+    alphabet = RangeAlphabet.from_symbols("ABCxyzD")
+    assert alphabet.ranges == ((65, 68), (120, 123), (68, 69)) and alphabet == list("ABCxyzD")
+    with pytest.raises(ValueError):
+        RangeAlphabet.from_symbols(["CH", "A"])
+
+
+@pytest.mark.parametrize("lang", ["en", "sv"])
+def test_range_loader_matches_list_loader(lang):
+    alphabet = load_range_alphabet(lang, fallback=False)
+    assert isinstance(alphabet, RangeAlphabet) and alphabet == load_alphabet(lang, fallback=False)
+    assert load_range_alphabet(lang) is alphabet  # memoized
+    assert load_alphabet_view(lang) is alphabet
+
+
+def test_yaml_extras_are_not_part_of_the_alphabet(tmp_path):
+    # load_alphabet has always read only the ranges of a range-based file.
+    path = write_yaml(tmp_path, "range:\n  - {start: 65, end: 68}\nextras:\n  É: 201\n")
+    assert load_alphabet_from_yaml(path) == ["A", "B", "C"]
+    assert load_alphabet(path) == load_range_alphabet(path) == ["A", "B", "C"]
+
+
+def test_single_range_mapping_is_accepted(tmp_path):
+    path = write_yaml(tmp_path, "range: {start: 65, end: 68}\n")
+    assert load_alphabet(path) == load_range_alphabet(path) == ["A", "B", "C"]
+
+
+def test_overlapping_yaml_ranges_keep_repeated_symbols(tmp_path):
+    path = write_yaml(tmp_path, "range:\n  - {start: 65, end: 68}\n  - {start: 66, end: 69}\n")
+    assert load_alphabet_from_yaml(path) == list("ABCBCD")
+    with pytest.raises(ValueError, match="repeated or multi-character"):
+        load_range_alphabet(path, fallback=False)
+    view = load_alphabet_view(path)
+    assert not isinstance(view, RangeAlphabet) and view == list("ABCBCD")
+
+
+def test_symbol_list_yaml(tmp_path):
+    path = write_yaml(tmp_path, "alphabet: [A, B, C, x]\n")
+    assert load_range_alphabet(path).ranges == ((65, 68), (120, 121))
+    multi = write_yaml(tmp_path, "alphabet: [CH, A, B]\n", "multi.yaml")
+    assert load_alphabet_view(multi) == ["CH", "A", "B"]
+
+
+def test_missing_file_falls_back_to_ascii(tmp_path, capsys):
+    missing = tmp_path / "missing.yaml"
+    assert load_alphabet_view(missing) == load_alphabet(missing) == list(load_range_alphabet(missing))
+    with pytest.raises(FileNotFoundError):
+        load_range_alphabet(missing, fallback=False)
+
+
+@pytest.mark.parametrize("alphabet", [GREEK, list(GREEK)], ids=["range", "list"])
+def test_normalize_keyword_looks_up_symbols(alphabet):
+    table = ModularTable.from_alphabet(alphabet, source="test")
+    assert normalize_keyword("αβxΑβγ.", table) == ["Α", "Β", "Γ", "."]
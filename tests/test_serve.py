@@ -0,0 +1,83 @@
+"""JSON-lines server mode (`cli.serve`): request validation and responses."""
+
+import io
+import json
+
+import pytest
+
+from cli.serve import handle_request, request_namespace, serve_lines
+from cli.spec import install_entry_points, load_spec
+
+
+@pytest.fixture(scope="module")
+def spec():
+    spec = load_spec()
+    install_entry_points(spec)
+    return spec
+
+
+def request(**fields):
+    return json.dumps({"id": 1, "operation": "encrypt", "cipher": "rot", "text": "HELLO", **fields})
+
+
+def test_request_is_answered(spec):
+    response = handle_request(spec, request(args={"shift": 3, "lang": "en"}))
+    assert response["ok"] and response["result"] == "KHOOR" and response["id"] == 1
+
+
+def test_flags_accept_leading_dashes_and_defaults(spec):
+    args = request_namespace(spec, json.loads(request(args={"--shift": 3})))
+    assert args.shift == 3 and args.lang is None and args.offset == 0
+
+
+@pytest.mark.parametrize("args, message", [
+    ({"lang": "en"}, "Missing required argument: --shift"),
+    ({"shift": "x"}, "invalid literal"),
+    ({"shift": 3, "colour": "red"}, "Unknown argument"),
+])
+def test_invalid_flags_become_error_responses(spec, args, message):
+    response = handle_request(spec, request(args=args))
+    assert not response["ok"] and message in response["error"]
+
+
+@pytest.mark.parametrize("flag", ["wordlist", "--corpus", "model"])
+def test_file_flags_are_refused(spec, tmp_path, flag):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("hunter2\n")
+    line = json.dumps({
+        "operation": "analyze", "cipher": "vigenere", "text": "ABC", "args": {"lang": "en", flag: str(secret)},
+    })
+    response = handle_request(spec, line)
+    assert not response["ok"] and "not accepted by serve" in response["error"]
+    assert "hunter2" not in json.dumps(response)
+
+
+@pytest.mark.parametrize("lang", ["../../etc/passwd", "/tmp/x", "en/../sv", 3])
+def test_lang_must_be_a_plain_name(spec, lang):
+    response = handle_request(spec, request(args={"shift": 3, "lang": lang}))
+    assert not response["ok"] and "Invalid language name" in response["error"]
+
+
+def test_rot_decrypt_needs_exactly_one_of_shift_and_all_shifts(spec):
+    line = request(operation="decrypt", args={"lang": "en"})
+    assert "Exactly one of --shift, --all-shifts" in handle_request(spec, line)["error"]
+
+
+def test_offset_continues_vigenere_key_stream(spec):
+    def encrypt(text, offset):
+        line = json.dumps({
+            "operation": "encrypt", "cipher": "vigenere", "text": text, "offset": offset,
+            "args": {"keyword": "LEMON", "lang": "en"},
+        })
+        return handle_request(spec, line)["result"]
+
+    assert encrypt("Attack", 0) + encrypt(" at dawn", 6) == encrypt("Attack at dawn", 0)
+
+
+def test_serve_lines_answers_in_order_and_skips_blank_lines(spec):
+    lines = [request(id=i, args={"shift": i, "lang": "en"}) + "\n" for i in range(1, 4)]
+    out = io.StringIO()
+    assert serve_lines(spec, [lines[0], "\n", lines[1], "not json\n", lines[2]], out) == 4
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r.get("id") for r in responses] == [1, 2, None, 3]
+    assert [r["ok"] for r in responses] == [True, True, False, True]
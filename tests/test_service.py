@@ -0,0 +1,81 @@
+"""Asyncio service (`cli.service`): line limit, stats, socket handling and serve flags."""
+
+import asyncio
+import json
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cli.parser import build_parser
+from cli.service import CipherService, _init_worker, remove_stale_socket, run_service
+
+
+def exchange(lines, line_limit=1024):
+    """Send `lines` over one connection to a thread-pool service; return the responses."""
+    async def main():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = CipherService(executor, workers=2, queue_size=4, line_limit=line_limit)
+            service.start()
+            server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0, limit=line_limit)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write("".join(lines).encode("utf-8"))
+                writer.write_eof()
+                data = await reader.read()
+                writer.close()
+            finally:
+                server.close()
+                await service.stop()
+        return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+    _init_worker()
+    return asyncio.run(main())
+
+
+def rot(i, text="HELLO"):
+    request = {"id": i, "operation": "encrypt", "cipher": "rot", "text": text, "args": {"shift": 1, "lang": "en"}}
+    return json.dumps(request) + "\n"
+
+
+def test_responses_keep_request_order():
+    responses = exchange([rot(i) for i in range(20)])
+    assert [r["id"] for r in responses] == list(range(20))
+    assert all(r["result"] == "IFMMP" for r in responses)
+
+
+def test_oversized_line_is_answered_and_skipped():
+    responses = exchange([rot(1), rot(2, "A" * 5000), rot(3)])
+    assert [r["id"] for r in responses] == [1, None, 3]
+    assert "exceeds 1024 bytes" in responses[1]["error"]
+
+
+def test_stats_request_reports_counters():
+    responses = exchange([rot(1), "not json\n", json.dumps({"id": "s", "operation": "stats"}) + "\n"])
+    stats = responses[-1]
+    assert stats["id"] == "s" and stats["ok"]
+    assert {"requests", "errors", "p50_ms", "p99_ms", "cipher_cache"} <= set(stats["result"])
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    path = str(tmp_path / "s.sock")
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.bind(path)
+    remove_stale_socket(path)
+    remove_stale_socket(path)  # nothing left to remove
+
+
+def test_regular_file_at_socket_path_is_kept(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        asyncio.run(run_service(socket_path=str(path)))
+    assert path.read_text() == "keep me"
+
+
+@pytest.mark.parametrize("flag", ["--workers", "--queue-size", "--line-limit"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_serve_sizes_must_be_positive(flag, value):
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["serve", "--port", "0", flag, value])
@@ -0,0 +1,43 @@
+"""`decrypt rot --all-shifts` (`analysis.shift.decrypt_all_shifts`)."""
+
+import sys
+
+import pytest
+
+from analysis.shift import decrypt_all_shifts
+from cli.main import main
+from tests.support import PLAIN, shift_text as encrypt
+from utils.alphabet_loader import load_alphabet
+
+@pytest.mark.parametrize("top, sample", [(0, 0), (3, 0), (3, 40)])
+def test_all_shifts_decrypts_every_candidate(top, sample):
+    alphabet = load_alphabet("en")
+    cipher = encrypt(PLAIN, 7, alphabet)
+    results = list(decrypt_all_shifts([cipher], alphabet, "en", top=top, sample=sample))
+    assert len(results) == (top or len(alphabet))
+    best, plaintext = results[0]
+    assert best.shift == 7 and plaintext == PLAIN[:sample or None]
+    for candidate, text in results:
+        assert encrypt(text, candidate.shift, alphabet) == cipher[:sample or None]
+
+
+def test_all_shifts_cli_streams_every_shift(monkeypatch, tmp_path):
+    alphabet = load_alphabet("en")
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text(encrypt(PLAIN, 7, alphabet))
+    monkeypatch.setattr(sys, "argv", [
+        "cli.main", "decrypt", "rot", "--all-shifts", "--lang", "en", "--input", str(src), "--output", str(dst),
+    ])
+    main()
+    out = dst.read_text()
+    assert out.count("--- shift ") == len(alphabet)
+    assert out.startswith("--- shift 7 (key H, ") and PLAIN in out
+
+
+def test_all_shifts_cli_prints_to_stdout(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", [
+        "cli.main", "decrypt", "rot", "--all-shifts", "--top", "2", "--lang", "en", "--text", "Khoor",
+    ])
+    main()
+    out = capsys.readouterr().out
+    assert out.count("--- shift ") == 2 and out.endswith("\n") and not out.endswith("\n\n")
@@ -0,0 +1,42 @@
+"""Precompiled CLI spec (`cli.spec`): freshness of spec.json and lazy start-up."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from cli.spec import SPEC_PATH, SPEC_VERSION, build_spec, load_spec, source_hashes
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_committed_spec_is_up_to_date():
+    # Regenerate with `python -m cli.spec` after changing cli/config/*.yaml or cli/commands/.
+    with open(SPEC_PATH, encoding="utf-8") as f:
+        committed = json.load(f)
+    assert committed["version"] == SPEC_VERSION
+    assert committed["sources"] == source_hashes()
+    assert committed == build_spec()
+
+
+def test_stale_spec_is_rebuilt(tmp_path):
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps({"version": SPEC_VERSION, "sources": {}, "ciphers": {}}), encoding="utf-8")
+    spec = load_spec(path)
+    assert spec["sources"] == source_hashes() and "rot" in spec["ciphers"]
+    assert json.loads(path.read_text(encoding="utf-8")) == spec
+
+
+def test_parsing_imports_no_handlers_or_yaml():
+    code = (
+        "import sys\n"
+        "from cli.parser import build_parser\n"
+        "from cli.spec import install_entry_points, load_spec\n"
+        "spec = load_spec()\n"
+        "install_entry_points(spec)\n"
+        "build_parser(spec).parse_args(['encrypt', 'vigenere', '--text', 'x', '--keyword', 'K'])\n"
+        "prefixes = ('cli.commands', 'cipher', 'analysis', 'yaml', 'numpy')\n"
+        "print(sorted(m for m in sys.modules if m.startswith(prefixes)))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
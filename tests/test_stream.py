@@ -0,0 +1,88 @@
+"""Chunked streaming (`cli.stream`): output across chunk boundaries matches one-shot runs."""
+
+import sys
+from argparse import Namespace
+
+import pytest
+
+from cli.dispatch import dispatch
+from cli.main import main
+from cli.stream import iter_chunks, run_streaming
+
+TEXT = "Attack at dawn, then retreat!\nÅsa och Örjan\r\n" * 40
+
+COMMANDS = [
+    ["vigenere", "--keyword", "LEMON"],
+    ["rot", "--shift", "5"],
+    ["caesar"],
+    ["mono", "--key_char", "K"],
+    ["keywordmono", "--keyword", "ZEBRA"],
+]
+
+
+def run_cli(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["cli.main", *argv])
+    main()
+
+
+def one_shot(operation, command, lang):
+    flags = dict(zip(command[1::2], command[2::2]))
+    args = Namespace(
+        operation=operation, cipher=command[0], text=TEXT, lang=lang, offset=0, jobs=1,
+        shift=int(flags.get("--shift", 0)), keyword=flags.get("--keyword"), key_char=flags.get("--key_char"),
+        all_shifts=False,
+    )
+    return "".join(dispatch(args))
+
+
+@pytest.mark.parametrize("command", COMMANDS, ids=lambda command: command[0])
+@pytest.mark.parametrize("operation", ["encrypt", "decrypt"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, len(TEXT) + 1])
+@pytest.mark.parametrize("lang", ["en", "sv"])
+def test_streamed_output_matches_one_shot(monkeypatch, tmp_path, command, operation, chunk_size, lang):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text(TEXT, encoding="utf-8", newline="")
+    run_cli(monkeypatch, operation, *command, "--lang", lang,
+            "--input", str(src), "--output", str(dst), "--chunk-size", str(chunk_size))
+    with open(dst, encoding="utf-8", newline="") as f:
+        assert f.read() == one_shot(operation, command, lang)
+
+
+def test_cipher_is_compiled_once(monkeypatch, tmp_path, capsys):
+    # Without --lang the alphabet falls back to ASCII with a warning, which
+    # used to be printed once per chunk.
+    src = tmp_path / "in.txt"
+    src.write_text(TEXT, encoding="utf-8")
+    run_cli(monkeypatch, "encrypt", "vigenere", "--keyword", "LEMON",
+            "--input", str(src), "--output", str(tmp_path / "out.txt"), "--chunk-size", "16")
+    assert capsys.readouterr().err.count("WARNING") == 1
+
+
+def test_handler_runs_per_chunk_without_compiled_form(tmp_path):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text("abcdefghij")
+    calls = []
+
+    def handler(args):
+        calls.append((args.text, args.offset))
+        return args.text.upper()
+
+    args = Namespace(input=str(src), output=str(dst), chunk_size=4, jobs=1, operation="encrypt")
+    assert run_streaming(args, handler) == 10
+    assert calls == [("abcd", 0), ("efgh", 4), ("ij", 8)]
+    assert dst.read_text() == "ABCDEFGHIJ"
+
+
+@pytest.mark.parametrize("size", ["0", "-3"])
+def test_chunk_size_must_be_positive(monkeypatch, tmp_path, size):
+    with pytest.raises(SystemExit) as exc:
+        run_cli(monkeypatch, "encrypt", "rot", "--shift", "1", "--input", str(tmp_path / "in.txt"), "--chunk-size", size)
+    assert exc.value.code == 2
+
+
+def test_iter_chunks_splits_on_characters():
+    import io
+
+    assert list(iter_chunks(io.StringIO("åäöxyz"), 4)) == ["åäöx", "yz"]
+    with pytest.raises(ValueError):
+        list(iter_chunks(io.StringIO("x"), 0))
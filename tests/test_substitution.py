@@ -0,0 +1,70 @@
+"""Substitution key search (`analysis.substitution`) and `analyze mono` output."""
+
+import random
+import sys
+
+import pytest
+
+from analysis.ngrams import NgramModel
+from analysis.substitution import SubstitutionScorer, solve_substitution
+from cli.main import main
+from tests.support import PROSE
+
+LETTERS = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+MODEL = NgramModel.from_corpus([PROSE], LETTERS)
+
+
+def substitute(text, seed=3):
+    """`text` uppercased and enciphered with a random key; returns (ciphertext, cipher alphabet)."""
+    cipher = LETTERS[:]
+    random.Random(seed).shuffle(cipher)
+    return text.upper().translate(str.maketrans(dict(zip(LETTERS, cipher)))), "".join(cipher)
+
+
+def test_scorer_matches_model_score():
+    text = PROSE.upper()
+    scorer = SubstitutionScorer.from_text([text[:500], text[500:]], LETTERS, MODEL)
+    assert scorer.score(list(range(len(LETTERS)))) == pytest.approx(MODEL.score_text(text))
+    with pytest.raises(ValueError):
+        SubstitutionScorer.from_text([text], LETTERS + ["1"], MODEL)
+
+
+def test_anneal_tracks_the_score_incrementally():
+    ciphertext, _ = substitute(PROSE)
+    scorer = SubstitutionScorer.from_text([ciphertext], LETTERS, MODEL)
+    rng = random.Random(1)
+    key, score, evaluated = scorer.anneal(rng.sample(range(len(LETTERS)), len(LETTERS)), 2000, rng)
+    assert score == pytest.approx(scorer.score(key))
+    assert 0 < evaluated <= 2000
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_solve_substitution_recovers_key(jobs):
+    ciphertext, cipher_alphabet = substitute(PROSE)
+    chunks = [ciphertext[i:i + 100] for i in range(0, len(ciphertext), 100)]
+    result = solve_substitution(chunks, LETTERS, MODEL, restarts=2, iterations=5000, jobs=jobs)
+    assert result.cipher_alphabet == cipher_alphabet
+    assert result.decrypt(ciphertext, LETTERS) == PROSE.upper()
+    assert result.keys_evaluated > 0
+
+
+def test_prefer_lowercase_gives_lowercase_to_the_frequent_symbol():
+    alphabet = ["A", "B", "a", "b"]
+    model = NgramModel.from_corpus(["ab"], alphabet, n=1)
+    scorer = SubstitutionScorer.from_text(["aaaBBB", "BA"], alphabet, model)
+    # Cipher B (4) outnumbers A (1), and a (3) outnumbers b (0).
+    for key in ([0, 2, 1, 3], [2, 0, 3, 1], [0, 2, 3, 1]):
+        assert scorer.prefer_lowercase(key) == [0, 2, 3, 1]
+
+
+def test_analyze_mono_cli(monkeypatch, capsys, tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text(PROSE, encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", [
+        "cli.main", "analyze", "mono", "--text", substitute(PROSE[:200])[0], "--lang", "en",
+        "--corpus", str(corpus), "--restarts", "1", "--iterations", "500",
+    ])
+    main()
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(":")[0] for line in lines] == ["cipher alphabet", "score", "keys evaluated", "preview"]
+    assert sorted(lines[0].split(": ")[1]) == sorted(LETTERS + [c.lower() for c in LETTERS])
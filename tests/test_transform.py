@@ -0,0 +1,58 @@
+"""Chunk-resumable cipher API: `transform(chunk, offset)` on stages, pipelines and compiled ciphers."""
+
+import random
+
+import pytest
+
+from cipher import CipherTransformer, Vigenere
+from tests.support import ALPHABETS, TABLES, build_stages, sample_text, staged
+
+
+@pytest.mark.parametrize("kind", TABLES)
+def test_stage_transform_continues_key_stream(kind):
+    alphabet = ALPHABETS["en"]()
+    table = TABLES[kind](alphabet)
+    text = sample_text(alphabet)
+    pipeline = CipherTransformer(build_stages(alphabet, table, list(text)))
+
+    out, position = [], 0
+    for size in (1, 13, 100, len(text)):
+        chunk = text[position:position + size]
+        piece, position = pipeline.transform(chunk, position, "encrypt")
+        out.append(piece)
+    assert "".join(out) == staged(alphabet, table, text, "encrypt")
+
+
+def split(text, seed):
+    """`text` cut at random points (including empty chunks)."""
+    rng = random.Random(seed)
+    cuts = sorted(rng.randrange(len(text) + 1) for _ in range(12))
+    return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize("lang", ALPHABETS)
+@pytest.mark.parametrize("mode", ["encrypt", "decrypt"])
+@pytest.mark.parametrize("seed", range(3))
+def test_offset_round_trips_through_chunks(lang, mode, seed):
+    alphabet = ALPHABETS[lang]()
+    table = TABLES["modular"](alphabet)
+    text = sample_text(alphabet)
+    compiled = CipherTransformer(build_stages(alphabet, table, list(text))).compile(mode)
+
+    out, offset = [], 17
+    for chunk in split(text, seed):
+        piece, next_offset = compiled.transform(chunk, offset)
+        assert next_offset == offset + len(chunk)
+        out.append(piece)
+        offset = next_offset
+    assert "".join(out) == staged(alphabet, table, text, mode, offset=17)
+
+
+def test_stage_transform_ignores_text():
+    alphabet = ALPHABETS["en"]()
+    table = TABLES["modular"](alphabet)
+    cipher = Vigenere(text=["x"], keyword=list("LEMON"), alphabet=alphabet, table=table)
+    head, offset = cipher.transform("Attack", 0)
+    tail, offset = cipher.transform(" at dawn", offset)
+    whole = Vigenere(text=list("Attack at dawn"), keyword=list("LEMON"), alphabet=alphabet, table=table)
+    assert head + tail == "".join(whole.encrypt()) and offset == 14
@@ -0,0 +1,78 @@
+"""Vigenère key-length and key recovery (`analysis.vigenere`) and `analyze vigenere` output."""
+
+import sys
+
+import pytest
+
+from analysis.vigenere import PeriodScore, analyze_vigenere, choose_period, index_of_coincidence
+from cipher import ModularTable
+from cipher.compiled import CompiledCipher
+from cli.main import main
+from tests.support import PROSE as TEXT
+from utils.alphabet_loader import load_alphabet
+
+
+def vigenere(text, keyword, alphabet):
+    table = ModularTable.from_alphabet(alphabet, source="test")
+    return CompiledCipher.from_table(table, list(keyword), "encrypt")(text)
+
+
+def test_index_of_coincidence():
+    assert index_of_coincidence([]) == 0.0
+    assert index_of_coincidence([1, 0]) == 0.0
+    assert index_of_coincidence([4, 0, 0]) == 1.0
+    assert index_of_coincidence([1, 1, 1, 1]) == 0.0
+    assert index_of_coincidence([2, 2]) == pytest.approx(1 / 3)
+
+
+def test_choose_period_prefers_the_smallest_near_best():
+    scores = [PeriodScore(1, 0.04), PeriodScore(3, 0.065), PeriodScore(6, 0.067), PeriodScore(7, 0.05)]
+    assert choose_period(scores) == 3
+    assert choose_period(scores, tolerance=1.0) == 6
+
+
+@pytest.mark.parametrize("keyword", ["KEY", "LEMON", "CIPHERS"])
+@pytest.mark.parametrize("sample", [600, 1 << 19])
+@pytest.mark.parametrize("size", [1, 97, 4096])
+def test_analyze_vigenere_recovers_keyword(keyword, sample, size):
+    alphabet = load_alphabet("en")
+    cipher = vigenere(TEXT, keyword, alphabet)
+    chunks = [cipher[i:i + size] for i in range(0, len(cipher), size)]
+    result = analyze_vigenere(chunks, alphabet, "en", max_period=20, sample=sample)
+    assert (result.period, result.keyword, result.length) == (len(keyword), keyword, len(TEXT))
+    assert len(result.chi2) == len(keyword)
+    assert [score.ioc for score in result.periods] == sorted((score.ioc for score in result.periods), reverse=True)
+
+
+def test_analyze_vigenere_known_period():
+    alphabet = load_alphabet("en")
+    result = analyze_vigenere([vigenere(TEXT, "LEMON", alphabet)], alphabet, "en", period=5)
+    assert result.keyword == "LEMON"
+    assert [score.period for score in result.periods] == [5]
+    with pytest.raises(ValueError):
+        analyze_vigenere([TEXT], alphabet, "en", max_period=0)
+
+
+def test_analyze_vigenere_counts_match_without_numpy(monkeypatch):
+    from analysis import vigenere as module
+
+    alphabet = load_alphabet("en")
+    chunks = [vigenere(TEXT, "LEMON", alphabet)[i:i + 61] for i in range(0, len(TEXT), 61)]
+    expected = analyze_vigenere(chunks, alphabet, "en", max_period=12)
+    monkeypatch.setattr(module.vectorized, "HAVE_NUMPY", False)
+    result = analyze_vigenere(chunks, alphabet, "en", max_period=12)
+    assert (result.period, result.keyword, result.periods) == (expected.period, expected.keyword, expected.periods)
+    assert result.chi2 == pytest.approx(expected.chi2)
+
+
+def test_analyze_vigenere_cli(monkeypatch, capsys):
+    alphabet = load_alphabet("en")
+    monkeypatch.setattr(sys, "argv", [
+        "cli.main", "analyze", "vigenere", "--text", vigenere(TEXT, "LEMON", alphabet),
+        "--lang", "en", "--max-period", "12", "--top", "2",
+    ])
+    main()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "period\tioc" and len(lines) == 5
+    assert lines[3] == "keyword: LEMON (period 5)"
+    assert lines[4] == f"preview: {TEXT[:80]}"
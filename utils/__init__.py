@@ -7,6 +7,7 @@ from .load import load_yaml, load_json
 from .errors import CryptoTractatusError
 from .validators import ensure_not_empty
 from .quick import rot_text
+from .range_alphabet import RangeAlphabet
 
 __all__ = [
     "rotate",
@@ -17,5 +18,6 @@ __all__ = [
     "CryptoTractatusError",
     "ensure_not_empty",
     "rot_text",
+    "RangeAlphabet",
 ]
 
@@ -1,9 +1,24 @@
+import hashlib
+import marshal
+import os
+import sys
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from utils.load import load_yaml
+from utils.range_alphabet import RangeAlphabet
 from utils.tools import get_ascii_alphabet
 
+# Compiled alphabets are cached on disk (marshal format) and in-process, keyed by
+# the YAML file's path, mtime and size, so repeated loads skip YAML parsing.
+CACHE_DIR_ENV = "CRYPTOTRACTATUS_CACHE_DIR"  # set to "" to disable the disk cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "cryptotractatus"
+_CACHE_FORMAT = 3
+
+Stamp = Tuple[int, int]
+_memo: Dict[Path, Tuple[Stamp, Tuple[str, ...]]] = {}
+_range_memo: Dict[Path, Tuple[Stamp, Optional[RangeAlphabet]]] = {}
+
 def load_alphabet_from_yaml(path: Path) -> List[str]:
     if not path or not path.exists():
         raise FileNotFoundError(f"YAML alphabet file not found: {path}")
@@ -16,36 +31,169 @@ def load_alphabet_from_yaml(path: Path) -> List[str]:
         return data
     elif isinstance(data, dict) and "range" in data:
         # Stöd för range-baserad YAML, t.ex. en.yaml/sv.yaml
-        alphabet = []
-        for r in data["range"]:
-            start = int(r["start"])
-            end = int(r["end"])
-            alphabet.extend([chr(i) for i in range(start, end)])
-        return alphabet
+        return [chr(i) for start, end in _ranges(data) for i in range(start, end)]
     else:
         raise ValueError(f"Invalid format in alphabet file: {path}")
 
+def _ranges(data: Dict) -> List[Tuple[int, int]]:
+    """(start, end) pairs of a range-based YAML mapping (a list of, or a single, {start, end})."""
+    ranges = data["range"]
+    if isinstance(ranges, dict):
+        ranges = [ranges]
+    return [(int(r["start"]), int(r["end"])) for r in ranges]
+
+def alphabet_cache_dir() -> Optional[Path]:
+    """Directory for compiled alphabets, or None if the disk cache is disabled."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured is None:
+        return DEFAULT_CACHE_DIR / "alphabets"
+    return Path(configured) / "alphabets" if configured else None
+
+def _stamp(path: Path) -> Stamp:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+def _compiled_path(path: Path) -> Optional[Path]:
+    cache_dir = alphabet_cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / f"{hashlib.sha1(str(path).encode()).hexdigest()[:16]}.alpha"
+
+def _read_compiled(path: Path, stamp: Stamp) -> Optional[Tuple[str, ...]]:
+    compiled = _compiled_path(path)
+    if compiled is None:
+        return None
+    try:
+        fmt, source, cached_stamp, alphabet = marshal.loads(compiled.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if fmt != _CACHE_FORMAT or source != str(path) or tuple(cached_stamp) != stamp:
+        return None
+    return alphabet
+
+def _write_compiled(path: Path, stamp: Stamp, alphabet: Sequence[str]) -> None:
+    compiled = _compiled_path(path)
+    if compiled is None:
+        return
+    try:
+        compiled.parent.mkdir(parents=True, exist_ok=True)
+        tmp = compiled.with_name(f"{compiled.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(marshal.dumps((_CACHE_FORMAT, str(path), stamp, tuple(alphabet))))
+        os.replace(tmp, compiled)
+    except OSError:
+        pass  # the cache is an optimization; a read-only home must not break loading
+
+def load_alphabet_cached(path: Path) -> List[str]:
+    """
+    Load an alphabet YAML file through the in-process and on-disk caches.
+    Entries are invalidated when the file's mtime or size changes.
+    """
+    if not path or not path.exists():
+        raise FileNotFoundError(f"YAML alphabet file not found: {path}")
+    stamp = _stamp(path)
+    hit = _memo.get(path)
+    if hit is not None and hit[0] == stamp:
+        return list(hit[1])
+
+    alphabet = _read_compiled(path, stamp)
+    if alphabet is None:
+        alphabet = tuple(load_alphabet_from_yaml(path))
+        _write_compiled(path, stamp, alphabet)
+    _memo[path] = (stamp, alphabet)
+    return list(alphabet)
+
+def clear_alphabet_cache() -> None:
+    """Forget alphabets memoized in this process (the disk cache is kept)."""
+    _memo.clear()
+    _range_memo.clear()
+
+def _alphabet_path(lang_or_path: Optional[Union[str, Path]]) -> Optional[Path]:
+    if isinstance(lang_or_path, str):
+        # Sök filen i projektets struktur
+        return (Path(__file__).parent.parent / "language" / "alphabets" / f"{lang_or_path}.yaml").resolve()
+    if isinstance(lang_or_path, Path):
+        return lang_or_path.resolve() if lang_or_path else None
+    return None
+
+def _range_alphabet(path: Path) -> Optional[RangeAlphabet]:
+    """
+    The symbols `load_alphabet_from_yaml(path)` returns, as a `RangeAlphabet`,
+    or None when they have no range form (repeated or multi-character symbols,
+    e.g. overlapping ranges). Memoized per file stamp.
+    """
+    stamp = _stamp(path)
+    hit = _range_memo.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    data = load_yaml(path)
+    try:
+        if isinstance(data, dict) and "range" in data:
+            alphabet: Optional[RangeAlphabet] = RangeAlphabet(_ranges(data))
+        else:
+            alphabet = RangeAlphabet.from_symbols(load_alphabet_cached(path))
+    except ValueError:
+        alphabet = None
+    _range_memo[path] = (stamp, alphabet)
+    return alphabet
+
+def load_range_alphabet(lang_or_path: Optional[Union[str, Path]] = None, fallback: bool = True) -> RangeAlphabet:
+    """
+    Load an alphabet as a `RangeAlphabet`, resolved like `load_alphabet` and
+    with the same symbols. Range-based YAML files are read as their ranges (no
+    per-symbol strings); explicit symbol lists are compressed into runs.
+    Memoized per file stamp.
+
+    Raises:
+        ValueError: If the alphabet has no range form (overlapping ranges,
+            repeated or multi-character symbols) and `fallback` is False.
+    """
+    path = _alphabet_path(lang_or_path)
+    try:
+        if not path or not path.exists():
+            raise FileNotFoundError(f"YAML alphabet file not found: {path}")
+        alphabet = _range_alphabet(path)
+        if alphabet is None:
+            raise ValueError(f"Alphabet has repeated or multi-character symbols: {path}")
+        return alphabet
+    except Exception as e:
+        if not fallback:
+            raise
+        print(f"[Alphabet] WARNING: Falling back to ASCII: {e}", file=sys.stderr)
+        return RangeAlphabet.from_symbols(get_ascii_alphabet())
+
+def load_alphabet_view(lang_or_path: Optional[Union[str, Path]] = None, fallback: bool = True) -> Sequence[str]:
+    """
+    Read-only alphabet for callers that never modify it: the memoized
+    `RangeAlphabet` when the alphabet has a range form, otherwise the list
+    `load_alphabet` returns. Same symbols, in the same order, either way.
+    """
+    path = _alphabet_path(lang_or_path)
+    try:
+        if path and path.exists():
+            alphabet = _range_alphabet(path)
+            if alphabet is not None:
+                return alphabet
+    except Exception:
+        pass  # reported by load_alphabet below
+    return load_alphabet(lang_or_path, fallback)
+
 def load_alphabet(lang_or_path: Optional[Union[str, Path]] = None, fallback: bool = True) -> List[str]:
     """
     Förbättrad robusthet:
     1. Om sträng: tolka som språk, sök i language/alphabets/<lang>.yaml
     2. Om Path: använd direkt
     3. Om None: fallback till ASCII
+    Parsed alphabets are cached (see `load_alphabet_cached`).
     """
-    path = None
-    if isinstance(lang_or_path, str):
-        # Sök filen i projektets struktur
-        path = (Path(__file__).parent.parent / "language" / "alphabets" / f"{lang_or_path}.yaml").resolve()
-    elif isinstance(lang_or_path, Path):
-        path = lang_or_path.resolve() if lang_or_path else None
+    path = _alphabet_path(lang_or_path)
 
     try:
         if path:
-            return load_alphabet_from_yaml(path)
+            return load_alphabet_cached(path)
         else:
             raise FileNotFoundError("No alphabet path or language specified.")
     except Exception as e:
         if not fallback:
             raise
-        print(f"[Alphabet] WARNING: Falling back to ASCII: {e}")
+        print(f"[Alphabet] WARNING: Falling back to ASCII: {e}", file=sys.stderr)
         return get_ascii_alphabet()
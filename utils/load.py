@@ -1,4 +1,3 @@
-import yaml
 import json
 from pathlib import Path
 from typing import Any
@@ -7,7 +6,9 @@ from typing import Any
 def load_yaml(path: Path) -> Any:
     """
     Load a YAML file and return its contents as Python data.
+    PyYAML is imported on first use to keep start-up fast.
     """
+    import yaml
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
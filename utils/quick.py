@@ -5,11 +5,30 @@ Quick transformation utilities for CLI defaults and minimal pipelines.
 [...]
 """
 
-from typing import List, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from utils.range_alphabet import RangeAlphabet
 from utils.tools import rotate
 from utils.validators import ensure_not_empty
-from language.tools import load_unicode_alphabet
+import language.tools as language_tools  # module import: language.tools imports utils
+
+ROT_CACHE_SIZE = 256  # translation tables kept by rot_text
+
+
+class _Frozen:
+    """Holder of an immutable alphabet; hashed and compared by identity, not by its symbols."""
+
+    __slots__ = ("symbols",)
+
+    def __init__(self, symbols: Sequence[str]):
+        self.symbols = symbols
+
+
+# id(tuple or str alphabet) -> (alphabet, its _Frozen); the alphabet is kept so its id is not reused
+_frozen: Dict[int, Tuple[Sequence[str], _Frozen]] = {}
+_frozen_lock = threading.Lock()
 
 
 def rot_text(
@@ -22,6 +41,12 @@ def rot_text(
     Fast Caesar-style rotation of a string using a given alphabet.
     If no alphabet is provided, defaults to Unicode-based alphabet via language config.
 
+    The translation table for each (lang or alphabet, shift modulo the alphabet
+    size) is built once and kept in a bounded LRU cache (see `rot_cache_info`),
+    so repeated calls cost one `str.translate`. A language, a `RangeAlphabet`
+    or a tuple is found in the cache without touching its symbols; a list is
+    copied and hashed on every call, since it may have changed.
+
     Args:
         text (str): Input string to transform.
         shift (int): Rotation amount.
@@ -34,14 +59,61 @@ def rot_text(
     ensure_not_empty(text)
 
     if alphabet is None:
-        alphabet = load_unicode_alphabet(lang)
+        lang = lang.lower()
+        key: Tuple[str, Any] = ("lang", lang)
+        size = len(_lang_alphabet(lang))
+    else:
+        ensure_not_empty(alphabet)
+        key = _alphabet_key(alphabet)
+        size = len(alphabet)
+    return text.translate(_rot_table(key, shift % size))
 
+
+@lru_cache(maxsize=None)
+def _lang_alphabet(lang: str) -> Tuple[str, ...]:
+    alphabet = tuple(language_tools.load_unicode_alphabet(lang))
     ensure_not_empty(alphabet)
+    return alphabet
+
+
+def _alphabet_key(alphabet: Sequence[str]) -> Tuple[str, Any]:
+    """Cache key for a custom alphabet that is cheap to hash whenever the alphabet is immutable."""
+    if isinstance(alphabet, RangeAlphabet):
+        return ("range", alphabet)  # hashed by its ranges
+    if isinstance(alphabet, (tuple, str)):
+        with _frozen_lock:
+            known = _frozen.get(id(alphabet))
+            if known is None or known[0] is not alphabet:
+                if len(_frozen) >= ROT_CACHE_SIZE:
+                    _frozen.clear()
+                known = _frozen[id(alphabet)] = (alphabet, _Frozen(alphabet))
+        return ("frozen", known[1])
+    return ("symbols", tuple(alphabet))  # a list may have changed since the last call
+
 
+def _symbols(key: Tuple[str, Any]) -> Sequence[str]:
+    kind, value = key
+    if kind == "lang":
+        return _lang_alphabet(value)
+    return value.symbols if kind == "frozen" else value
+
+
+@lru_cache(maxsize=ROT_CACHE_SIZE)
+def _rot_table(key: Tuple[str, Any], shift: int) -> Dict[int, str]:
+    """`str.maketrans` table rotating the alphabet of `key` by `shift`."""
+    alphabet = _symbols(key)
     rotated = rotate(alphabet, -shift)
-    index_map = {char: idx for idx, char in enumerate(alphabet)}
+    # Only single characters can match in `text`; longer symbols are left out.
+    return str.maketrans({char: target for char, target in zip(alphabet, rotated) if len(char) == 1})
+
+
+def rot_cache_info():
+    """Hits, misses, maxsize and current size of the rot_text table cache."""
+    return _rot_table.cache_info()
 
-    return ''.join(
-        rotated[index_map[char]] if char in index_map else char for char in text
-    )
 
+def clear_rot_cache() -> None:
+    """Drop every cached rot_text table."""
+    _rot_table.cache_clear()
+    with _frozen_lock:
+        _frozen.clear()
@@ -0,0 +1,158 @@
+"""
+Range-backed alphabets for large Unicode blocks.
+
+A `RangeAlphabet` stores an alphabet as half-open code point ranges plus a
+short list of extra symbols, instead of one string per symbol. Index,
+membership and character-at lookups are range arithmetic (a bisect over the
+range starts, which is constant time for the handful of ranges a language
+file defines); only the extras go through a dict. A CJK block of 20 000+
+symbols therefore loads and validates in microseconds.
+
+`RangeAlphabet` is a read-only `Sequence[str]`, so it can stand in for the
+list alphabets returned by `load_alphabet` wherever the alphabet is only read.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class RangeAlphabet(Sequence):
+    """
+    Alphabet made of code point ranges followed by extra symbols.
+
+    Args:
+        ranges (Iterable[Tuple[int, int]]): (start, end) code points, end
+            exclusive, in alphabet order. Ranges must not overlap.
+        extras (Iterable[str]): Symbols appended after the ranges. Extras that
+            are already in the alphabet are dropped, so the alphabet is
+            duplicate-free.
+    """
+
+    __slots__ = ("_ranges", "_offsets", "_starts", "_by_start", "_extras", "_extra_index", "_size")
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]], extras: Iterable[str] = ()):
+        self._ranges: Tuple[Tuple[int, int], ...] = tuple((int(s), int(e)) for s, e in ranges if int(e) > int(s))
+        offsets, total = [], 0
+        for start, end in self._ranges:
+            offsets.append(total)
+            total += end - start
+        self._offsets = tuple(offsets)
+        self._by_start = tuple(sorted(range(len(self._ranges)), key=lambda k: self._ranges[k][0]))
+        self._starts = tuple(self._ranges[k][0] for k in self._by_start)
+        for previous, current in zip(self._by_start, self._by_start[1:]):
+            if self._ranges[previous][1] > self._ranges[current][0]:
+                raise ValueError(f"Alphabet ranges overlap: {self._ranges[previous]} and {self._ranges[current]}")
+
+        self._extras: List[str] = []
+        self._extra_index: Dict[str, int] = {}
+        for symbol in extras:
+            if self._range_index(symbol) is None and symbol not in self._extra_index:
+                self._extra_index[symbol] = total + len(self._extras)
+                self._extras.append(symbol)
+        self._size = total + len(self._extras)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'RangeAlphabet':
+        """
+        Build from an alphabet YAML mapping: `range` (a list of, or a single,
+        {start, end} mapping; end exclusive) and optional `extras` (symbol -> code point).
+        """
+        ranges = config.get("range") or []
+        if isinstance(ranges, dict):
+            ranges = [ranges]
+        extras = config.get("extras")
+        return cls(
+            [(r["start"], r["end"]) for r in ranges],
+            [chr(int(cp)) for cp in extras.values()] if isinstance(extras, dict) else (),
+        )
+
+    @classmethod
+    def from_symbols(cls, symbols: Iterable[str]) -> 'RangeAlphabet':
+        """Compress an explicit alphabet into runs of consecutive code points."""
+        ranges: List[List[int]] = []
+        for symbol in symbols:
+            if len(symbol) != 1:
+                raise ValueError(f"RangeAlphabet symbols must be single characters, got {symbol!r}.")
+            cp = ord(symbol)
+            if ranges and cp == ranges[-1][1]:
+                ranges[-1][1] += 1
+            else:
+                ranges.append([cp, cp + 1])
+        return cls((start, end) for start, end in ranges)
+
+    @property
+    def ranges(self) -> Tuple[Tuple[int, int], ...]:
+        return self._ranges
+
+    @property
+    def extras(self) -> Tuple[str, ...]:
+        return tuple(self._extras)
+
+    def _range_index(self, symbol: str) -> Optional[int]:
+        if len(symbol) != 1:
+            return None
+        cp = ord(symbol)
+        k = bisect_right(self._starts, cp) - 1
+        if k < 0:
+            return None
+        r = self._by_start[k]
+        start, end = self._ranges[r]
+        return self._offsets[r] + cp - start if cp < end else None
+
+    def index_of(self, symbol: str) -> Optional[int]:
+        """Position of `symbol`, or None if it is not in the alphabet."""
+        position = self._range_index(symbol)
+        return position if position is not None else self._extra_index.get(symbol)
+
+    def get(self, symbol: str, default: Optional[int] = None) -> Optional[int]:
+        """Dict-style `index_of`, so the alphabet can serve as its own symbol -> index map."""
+        position = self.index_of(symbol)
+        return default if position is None else position
+
+    def index(self, symbol: str, start: int = 0, stop: Optional[int] = None) -> int:
+        position = self.index_of(symbol)
+        if position is None or not start <= position < (self._size if stop is None else stop):
+            raise ValueError(f"{symbol!r} is not in alphabet")
+        return position
+
+    def count(self, symbol: str) -> int:
+        return int(symbol in self)
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and self.index_of(symbol) is not None
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._size))]
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError("alphabet index out of range")
+        ranged = self._size - len(self._extras)
+        if i >= ranged:
+            return self._extras[i - ranged]
+        r = bisect_right(self._offsets, i) - 1
+        return chr(self._ranges[r][0] + i - self._offsets[r])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        return chain(chain.from_iterable(map(chr, range(s, e)) for s, e in self._ranges), self._extras)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RangeAlphabet):
+            return self._ranges == other._ranges and self._extras == other._extras
+        if isinstance(other, (list, tuple)):
+            return len(other) == self._size and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._ranges, tuple(self._extras)))
+
+    def __repr__(self) -> str:
+        ranges = ", ".join(f"U+{s:04X}..U+{e - 1:04X}" for s, e in self._ranges)
+        extras = f" + {len(self._extras)} extras" if self._extras else ""
+        return f"RangeAlphabet([{ranges}]{extras}, size={self._size})"